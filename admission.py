@@ -0,0 +1,69 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Limiteur de débit à seau à jetons, un seau par clé (ex. un club).
+
+    Chaque seau contient au plus `burst` jetons et se remplit de `rate` jetons
+    par seconde ; une opération consomme un jeton. Un club peut donc enchaîner
+    `burst` réservations, puis `rate` par seconde.
+    """
+
+    def __init__(self, rate, burst, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.limited = 0  # opérations refusées
+        self._clock = clock
+        self._buckets = {}  # clé -> (jetons, instant de la dernière mise à jour)
+        self._lock = threading.Lock()
+
+    def acquire(self, key):
+        """
+        Consomme un jeton du seau de `key`.
+
+        Returns:
+            float: 0 si l'opération est autorisée, sinon le délai (secondes)
+                   avant qu'un jeton soit disponible.
+        """
+        now = self._clock()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                return 0.0
+            self._buckets[key] = (tokens, now)
+            self.limited += 1
+        return (1 - tokens) / self.rate
+
+
+class ConcurrencyLimiter:
+    """
+    Nombre maximal d'opérations simultanées, sans attente : au-delà de `limit`,
+    une nouvelle opération est refusée immédiatement plutôt que mise en attente.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.overloaded = 0  # opérations refusées
+        self._slots = threading.BoundedSemaphore(limit)
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        """
+        Réserve une place si possible.
+
+        Returns:
+            bool: True si la place est réservée (à libérer avec `release`).
+        """
+        if self._slots.acquire(blocking=False):
+            return True
+        with self._lock:
+            self.overloaded += 1
+        return False
+
+    def release(self):
+        """Libère une place réservée par `try_acquire`."""
+        self._slots.release()
@@ -0,0 +1,155 @@
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+# Valeur placée dans la file pour arrêter le thread d'écriture
+_STOP = object()
+
+
+class QueueTimeout(Exception):
+    """Levée (via le futur) quand une commande a attendu dans la file au-delà de son délai."""
+
+
+class BookingQueue:
+    """
+    File de commandes à écrivain unique.
+
+    Les threads de requête déposent des commandes (`submit`) et attendent leur
+    résultat via un `concurrent.futures.Future`. Un seul thread dédié retire les
+    commandes de la file et les traite en série : les données en mémoire ne sont
+    modifiées que par ce thread, sans verrou entre threads de requête.
+
+    Le thread regroupe les commandes déjà en attente (jusqu'à `max_batch`) et les
+    passe ensemble à `handler`, qui peut ainsi les persister en une seule écriture.
+    `handler(commands)` retourne la liste des résultats, dans le même ordre.
+
+    La latence est bornée de deux façons :
+        - `max_pending` limite le nombre de commandes en attente (`submit` lève
+          `queue.Full` au-delà) ;
+        - `timeout` : une commande retirée de la file après ce délai n'est pas
+          appliquée, son futur reçoit `QueueTimeout`.
+
+    Les temps d'attente dans la file et de traitement complet des dernières
+    commandes sont conservés pour `stats()`.
+    """
+
+    def __init__(self, handler, max_batch=64, max_pending=0, timeout=None, history=10000):
+        self.handler = handler
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self.processed = 0
+        self.batches = 0
+        self.expired = 0
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._waits = deque(maxlen=history)
+        self._latencies = deque(maxlen=history)
+        self._stats_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="booking-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, command):
+        """
+        Dépose une commande dans la file.
+
+        Args:
+            command: Commande transmise telle quelle à `handler`.
+
+        Returns:
+            Future: Futur recevant le résultat de la commande.
+
+        Raises:
+            queue.Full: si `max_pending` commandes sont déjà en attente.
+        """
+        future = Future()
+        self._queue.put_nowait((command, future, time.monotonic()))
+        return future
+
+    def depth(self):
+        """Nombre approximatif de commandes en attente."""
+        return self._queue.qsize()
+
+    def stats(self):
+        """
+        Statistiques des dernières commandes traitées.
+
+        Returns:
+            dict: Compteurs (commandes, lots, expirations, profondeur de la file) et
+                  percentiles (50, 95, 99, max) en millisecondes de l'attente dans la
+                  file (`wait_ms`) et du temps total jusqu'au résultat (`latency_ms`).
+        """
+        with self._stats_lock:
+            waits = sorted(self._waits)
+            latencies = sorted(self._latencies)
+            counters = {"processed": self.processed, "batches": self.batches, "expired": self.expired}
+        return {
+            **counters,
+            "depth": self.depth(),
+            "wait_ms": _percentiles(waits),
+            "latency_ms": _percentiles(latencies),
+        }
+
+    def close(self):
+        """Arrête le thread d'écriture après traitement des commandes déjà déposées."""
+        if self._thread.is_alive():
+            self._queue.put((_STOP, None, None))
+            self._thread.join()
+
+    def _run(self):
+        """Boucle du thread d'écriture : retire un lot de commandes et le traite."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = any(command is _STOP for command, _, _ in batch)
+            self._process([item for item in batch if item[0] is not _STOP])
+            if stopping:
+                return
+
+    def _process(self, batch):
+        """Traite un lot : écarte les commandes expirées, appelle `handler`, résout les futurs."""
+        if not batch:
+            return
+        started = time.monotonic()
+        live = []
+        for command, future, enqueued in batch:
+            if self.timeout is not None and started - enqueued > self.timeout:
+                future.set_exception(QueueTimeout(f"Command waited {started - enqueued:.3f}s in queue"))
+                with self._stats_lock:
+                    self.expired += 1
+            elif future.set_running_or_notify_cancel():
+                live.append((command, future, enqueued))
+
+        if live:
+            try:
+                results = self.handler([command for command, _, _ in live])
+            except Exception as error:  # le thread d'écriture ne doit jamais s'arrêter
+                for _, future, _ in live:
+                    future.set_exception(error)
+            else:
+                for (_, future, _), result in zip(live, results):
+                    future.set_result(result)
+
+        finished = time.monotonic()
+        with self._stats_lock:
+            self.batches += 1
+            self.processed += len(live)
+            for _, _, enqueued in live:
+                self._waits.append(started - enqueued)
+                self._latencies.append(finished - enqueued)
+
+
+def _percentiles(values):
+    """Percentiles 50, 95, 99 et maximum d'une liste triée de durées (secondes), en millisecondes."""
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+    def at(fraction):
+        return round(values[min(int(fraction * len(values)), len(values) - 1)] * 1000, 3)
+
+    return {"p50": at(0.50), "p95": at(0.95), "p99": at(0.99), "max": round(values[-1] * 1000, 3)}
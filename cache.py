@@ -0,0 +1,52 @@
+import threading
+from collections import OrderedDict
+
+
+class VersionedCache:
+    """
+    Cache de valeurs calculées à partir des données, invalidé par numéro de version.
+
+    Chaque entrée mémorise la version des données pour laquelle elle a été
+    calculée : tant que la version courante est la même, la valeur est servie
+    telle quelle ; dès que les données changent (nouvelle version), elle est
+    recalculée au prochain accès. Le nombre d'entrées est borné (LRU).
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, version, compute):
+        """
+        Retourne la valeur en cache pour `key` si elle correspond à `version`,
+        sinon la calcule avec `compute()` et la met en cache.
+
+        Args:
+            key: Clé hachable de l'entrée.
+            version: Version des données dont dépend la valeur.
+            compute (callable): Fonction sans argument calculant la valeur.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # Calcul hors verrou : deux requêtes simultanées peuvent calculer la même valeur
+        value = compute()
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Vide le cache."""
+        with self._lock:
+            self._entries.clear()
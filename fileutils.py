@@ -0,0 +1,39 @@
+import json
+import os
+
+
+def to_json(obj):
+    """
+    Hook `default` de `json.dump` : sérialise les objets exposant `to_dict()` (modèles).
+
+    Raises:
+        TypeError: si l'objet n'est pas sérialisable.
+    """
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def write_json_atomic(path, payload, fsync=True, **dump_options):
+    """
+    Écrit un fichier JSON de façon atomique : fichier temporaire, fsync, puis renommage.
+
+    Un lecteur (ou un redémarrage après un crash) voit soit l'ancien contenu complet,
+    soit le nouveau, jamais un fichier à moitié écrit.
+
+    Args:
+        path (str): Chemin du fichier à remplacer.
+        payload: Données sérialisables en JSON.
+        fsync (bool): Force l'écriture sur disque avant le renommage.
+        **dump_options: Options passées à `json.dump` (ex. indent=4).
+
+    Les modèles (objets exposant `to_dict()`) sont sérialisés au format JSON des données.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(payload, f, default=to_json, **dump_options)
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
@@ -0,0 +1,125 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class SeatHolds:
+    """
+    Places retenues temporairement pour un club sur une compétition.
+
+    Ouvrir la page de réservation retient des places pendant `ttl` secondes :
+    elles ne sont plus réservables par les autres clubs, et l'achat du club
+    qui les retient ne peut plus échouer faute de places. Un club a au plus une
+    retenue par compétition ; une nouvelle retenue remplace la précédente.
+
+    Les échéances sont rangées dans un tas : expirer k retenues coûte O(k log n),
+    sans parcourir les retenues encore valides. Une retenue remplacée ou
+    convertie laisse son échéance dans le tas ; elle est ignorée à l'expiration.
+    """
+
+    def __init__(self, ttl, clock=time.monotonic):
+        self.ttl = ttl
+        self.expired = 0  # retenues arrivées à échéance
+        self.converted = 0  # retenues converties en réservation
+        self._clock = clock
+        self._holds = {}  # (club, compétition) -> (places, échéance, numéro)
+        self._held = {}  # compétition -> places retenues, tous clubs confondus
+        self._deadlines = []  # tas de (échéance, numéro, (club, compétition))
+        self._numbers = itertools.count()
+        self._lock = threading.Lock()
+
+    def hold(self, club_name, competition_name, places, available):
+        """
+        Retient des places pour un club, dans la limite des places non retenues par les autres clubs.
+
+        Args:
+            club_name (str): Nom du club.
+            competition_name (str): Nom de la compétition.
+            places (int): Places souhaitées.
+            available (int): Places restantes de la compétition.
+
+        Returns:
+            tuple: (places retenues, secondes avant échéance) ; (0, 0) si rien n'est retenu.
+        """
+        key = (club_name, competition_name)
+        now = self._clock()
+        with self._lock:
+            self._expire(now)
+            self._remove(key)
+            places = min(places, available - self._held.get(competition_name, 0))
+            if places <= 0:
+                return 0, 0
+            number = next(self._numbers)
+            self._holds[key] = (places, now + self.ttl, number)
+            self._held[competition_name] = self._held.get(competition_name, 0) + places
+            heapq.heappush(self._deadlines, (now + self.ttl, number, key))
+        return places, self.ttl
+
+    def held(self, competition_name, exclude=None):
+        """
+        Places retenues sur une compétition.
+
+        Args:
+            competition_name (str): Nom de la compétition.
+            exclude (str, optional): Club dont la retenue n'est pas comptée.
+
+        Returns:
+            int: Places retenues par les (autres) clubs.
+        """
+        with self._lock:
+            self._expire(self._clock())
+            held = self._held.get(competition_name, 0)
+            if exclude is not None:
+                held -= self._holds.get((exclude, competition_name), (0,))[0]
+        return held
+
+    def convert(self, club_name, competition_name):
+        """
+        Libère la retenue d'un club après sa réservation.
+
+        Returns:
+            int: Places qui étaient retenues (0 si aucune retenue valide).
+        """
+        with self._lock:
+            self._expire(self._clock())
+            places = self._remove((club_name, competition_name))
+            if places:
+                self.converted += 1
+        return places
+
+    def expire(self):
+        """
+        Supprime les retenues arrivées à échéance.
+
+        Returns:
+            int: Nombre de retenues encore valides.
+        """
+        with self._lock:
+            self._expire(self._clock())
+            return len(self._holds)
+
+    def _expire(self, now):
+        """Dépile les échéances passées (appelé sous verrou)."""
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, number, key = heapq.heappop(self._deadlines)
+            hold = self._holds.get(key)
+            if hold is not None and hold[2] == number:
+                self._remove(key)
+                self.expired += 1
+
+    def _remove(self, key):
+        """Supprime une retenue et retourne ses places (appelé sous verrou)."""
+        hold = self._holds.pop(key, None)
+        if hold is None:
+            return 0
+        competition_name = key[1]
+        held = self._held[competition_name] - hold[0]
+        if held:
+            self._held[competition_name] = held
+        else:
+            del self._held[competition_name]
+        return hold[0]
+
+    def __len__(self):
+        return len(self._holds)
@@ -0,0 +1,407 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+from fileutils import write_json_atomic
+from json_stream import iter_records
+from ledger import BookingLedger
+from snapshot import SnapshotError, read_fresh_snapshot, write_snapshot
+
+# Clé ajoutée aux fichiers JSON pour mémoriser le dernier enregistrement du journal déjà intégré
+SEQUENCE_KEY = "journalSeq"
+
+
+def _read_snapshot(path, key):
+    """
+    Lit un fichier JSON de données (clubs ou compétitions).
+
+    Args:
+        path (str): Chemin du fichier.
+        key (str): Clé de la liste ("clubs" ou "competitions").
+
+    Returns:
+        tuple: (liste des enregistrements, numéro de séquence du journal déjà intégré)
+    """
+    extras = {}
+    records = list(iter_records(path, key, extras))
+    return records, extras.get(SEQUENCE_KEY, 0)
+
+
+def _write_snapshot(path, key, records, sequence):
+    """
+    Écrit un fichier JSON de données de façon atomique, avec sa séquence de journal.
+
+    Args:
+        path (str): Chemin du fichier.
+        key (str): Clé de la liste ("clubs" ou "competitions").
+        records (list): Enregistrements à écrire.
+        sequence (int): Dernier numéro de séquence du journal intégré.
+    """
+    write_json_atomic(path, {key: records, SEQUENCE_KEY: sequence}, indent=4)
+
+
+def _bookings(record):
+    """Réservations d'un enregistrement : une réservation (competition, places) ou un lot (bookings)."""
+    return record["bookings"] if "bookings" in record else [(record["competition"], record["places"])]
+
+
+def _apply(records, clubs_seq, competitions_seq, clubs_by_name, competitions_by_name):
+    """
+    Rejoue des enregistrements du journal sur des clubs et compétitions indexés par nom.
+
+    Chaque fichier de données retient sa propre séquence : un enregistrement n'est
+    appliqué qu'aux données qui ne l'ont pas encore intégré, ce qui rend le rejeu
+    sûr même après une compaction interrompue.
+    """
+    for record in records:
+        bookings = _bookings(record)
+        club = clubs_by_name.get(record["club"])
+        if club is not None and record["seq"] > clubs_seq:
+            club["points"] = int(club["points"]) - sum(places for _, places in bookings)
+        if record["seq"] > competitions_seq:
+            for name, places in bookings:
+                competition = competitions_by_name.get(name)
+                if competition is not None:
+                    competition["numberOfPlaces"] = int(competition["numberOfPlaces"]) - places
+
+
+def _apply_ledger(records, ledger_seq, ledger):
+    """Rejoue sur le registre des réservations cumulées les enregistrements qu'il n'a pas encore intégrés."""
+    for record in records:
+        if record["seq"] > ledger_seq:
+            for name, places in _bookings(record):
+                ledger.add(record["club"], name, places)
+
+
+class BookingJournal:
+    """
+    Journal des réservations en ajout seul, avec compaction périodique.
+
+    Chaque réservation ajoute une ligne JSON compacte (séquence, club, compétition,
+    places, horodatage) au fichier journal au lieu de réécrire les fichiers de
+    données. Au démarrage, l'état est reconstruit à partir des fichiers JSON
+    (instantanés) puis du rejeu du journal. Lorsque le journal dépasse un seuil
+    de taille, une compaction en arrière-plan réintègre le journal dans les
+    instantanés JSON puis le tronque.
+
+    Si `ledger_path` est fourni, le registre des réservations cumulées (voir
+    `ledger.BookingLedger`) est un troisième instantané, reconstruit et compacté
+    de la même façon.
+    """
+
+    def __init__(
+        self,
+        path,
+        clubs_path,
+        competitions_path,
+        compact_threshold=1024 * 1024,
+        fsync=False,
+        snapshot_path=None,
+        ledger_path=None,
+    ):
+        self.path = path
+        self.clubs_path = clubs_path
+        self.competitions_path = competitions_path
+        self.ledger_path = ledger_path
+        self.snapshot_path = snapshot_path
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self.sequence = 0
+        self._lock = threading.Lock()
+        self._compacting = threading.Lock()
+        self._file = None
+
+    def load(self):
+        """
+        Charge les instantanés JSON puis rejoue le journal par-dessus.
+
+        Une fin de journal incomplète (arrêt brutal pendant une écriture) est
+        d'abord tronquée, pour que les ajouts suivants commencent sur une ligne neuve.
+
+        Returns:
+            tuple: (clubs, competitions) reconstruits.
+        """
+        clubs, clubs_seq, competitions, competitions_seq = self._read_snapshots()
+        self._truncate_torn_tail()
+        records = self._read_records()
+        _apply(
+            records,
+            clubs_seq,
+            competitions_seq,
+            {club["name"]: club for club in reversed(clubs)},
+            {competition["name"]: competition for competition in reversed(competitions)},
+        )
+        last_seq = records[-1]["seq"] if records else 0
+        self.sequence = max(last_seq, clubs_seq, competitions_seq)
+        return clubs, competitions
+
+    def load_ledger(self):
+        """
+        Charge l'instantané du registre des réservations cumulées puis rejoue le journal par-dessus.
+
+        Returns:
+            BookingLedger: Registre reconstruit (vide sans `ledger_path`).
+        """
+        records, ledger_seq = self._read_ledger()
+        ledger = BookingLedger.from_records(records)
+        _apply_ledger(self._read_records(), ledger_seq, ledger)
+        return ledger
+
+    def append(self, club_name, competition_name, places):
+        """
+        Ajoute une réservation au journal.
+
+        Déclenche une compaction en arrière-plan si le journal dépasse le seuil.
+
+        Args:
+            club_name (str): Nom du club.
+            competition_name (str): Nom de la compétition.
+            places (int): Nombre de places réservées.
+
+        Returns:
+            int: Numéro de séquence attribué à l'enregistrement.
+        """
+        return self._append({"club": club_name, "competition": competition_name, "places": places})[0]
+
+    def append_batch(self, club_name, bookings):
+        """
+        Ajoute un lot de réservations d'un club sous la forme d'un seul enregistrement.
+
+        Le lot tient sur une seule ligne : au rejeu, il est appliqué entièrement ou
+        (ligne incomplète après un arrêt brutal) pas du tout.
+
+        Args:
+            club_name (str): Nom du club.
+            bookings (list): Couples (nom de la compétition, places réservées).
+
+        Returns:
+            int: Numéro de séquence attribué à l'enregistrement.
+        """
+        return self._append({"club": club_name, "bookings": [[name, places] for name, places in bookings]})[0]
+
+    def append_batches(self, batches):
+        """
+        Ajoute plusieurs lots de réservations (un enregistrement par lot) en une seule écriture.
+
+        Args:
+            batches (list): Couples (nom du club, liste de couples (nom de la compétition, places)).
+
+        Returns:
+            list: Numéros de séquence attribués, dans l'ordre des lots.
+        """
+        records = [
+            {"club": club_name, "bookings": [[name, places] for name, places in bookings]}
+            for club_name, bookings in batches
+        ]
+        return self._append(*records)
+
+    def _append(self, *records):
+        """
+        Écrit des enregistrements numérotés et horodatés (un seul flush, un seul fsync),
+        puis compacte si le seuil est dépassé.
+
+        Returns:
+            list: Numéros de séquence attribués, dans l'ordre des enregistrements.
+        """
+        with self._lock:
+            ts = datetime.now().isoformat(timespec="seconds")
+            lines = []
+            sequences = []
+            for fields in records:
+                self.sequence += 1
+                sequences.append(self.sequence)
+                lines.append(json.dumps({"seq": self.sequence, **fields, "ts": ts}, separators=(",", ":")) + "\n")
+            f = self._open()
+            f.write("".join(lines))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            size = f.tell()
+
+        if size >= self.compact_threshold:
+            self.compact_in_background()
+        return sequences
+
+    def compact_in_background(self):
+        """
+        Lance une compaction dans un thread démon, sauf si une compaction est déjà en cours.
+
+        Returns:
+            threading.Thread | None: Thread lancé, ou None si une compaction tourne déjà.
+        """
+        if self._compacting.locked():
+            return None
+        thread = threading.Thread(target=self.compact, name="journal-compaction", daemon=True)
+        thread.start()
+        return thread
+
+    def compact(self):
+        """
+        Réintègre le journal dans les instantanés JSON puis le tronque.
+
+        La compaction travaille uniquement sur les fichiers (instantanés + journal
+        jusqu'à la position courante) : elle ne bloque les réservations que le temps
+        de lire la position de fin du journal, puis de réécrire la fin éventuelle
+        ajoutée pendant la compaction.
+        """
+        with self._compacting:
+            with self._lock:
+                if self._file is not None:
+                    self._file.flush()
+                end = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+            if end == 0:
+                return
+
+            records = self._read_records(end)
+            clubs, clubs_seq, competitions, competitions_seq = self._read_snapshots()
+            _apply(
+                records,
+                clubs_seq,
+                competitions_seq,
+                {club["name"]: club for club in reversed(clubs)},
+                {competition["name"]: competition for competition in reversed(competitions)},
+            )
+            folded_seq = records[-1]["seq"] if records else max(clubs_seq, competitions_seq)
+            self._write_snapshots(clubs, max(folded_seq, clubs_seq), competitions, max(folded_seq, competitions_seq))
+            if self.ledger_path:
+                ledger_records, ledger_seq = self._read_ledger()
+                ledger = BookingLedger.from_records(ledger_records)
+                _apply_ledger(records, ledger_seq, ledger)
+                _write_snapshot(self.ledger_path, "bookings", ledger.to_records(), max(folded_seq, ledger_seq))
+
+            # Troncature : on ne conserve que ce qui a été ajouté pendant la compaction
+            with self._lock:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                with open(self.path, "rb") as f:
+                    f.seek(end)
+                    tail = f.read()
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(tail)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+
+    def checkpoint(self, clubs, competitions, ledger=None):
+        """
+        Écrit l'état courant en mémoire comme nouvel instantané et vide le journal.
+
+        L'état fourni doit refléter toutes les réservations déjà journalisées.
+
+        Args:
+            clubs (list): Clubs à écrire.
+            competitions (list): Compétitions à écrire.
+            ledger (BookingLedger, optional): Registre des réservations cumulées à écrire ;
+                à défaut, il est relu (instantané et journal) avant que le journal ne soit vidé.
+        """
+        with self._compacting, self._lock:
+            self._write_snapshots(clubs, self.sequence, competitions, self.sequence)
+            if self.ledger_path:
+                ledger = ledger if ledger is not None else self.load_ledger()
+                _write_snapshot(self.ledger_path, "bookings", ledger.to_records(), self.sequence)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            open(self.path, "w").close()
+
+    def close(self):
+        """Ferme le fichier journal."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _read_snapshots(self):
+        """
+        Lit les instantanés : l'instantané binaire s'il est à jour, sinon les fichiers JSON.
+
+        Returns:
+            tuple: (clubs, séquence des clubs, compétitions, séquence des compétitions)
+        """
+        if self.snapshot_path:
+            try:
+                clubs, competitions, clubs_seq, competitions_seq = read_fresh_snapshot(
+                    self.snapshot_path, self.clubs_path, self.competitions_path
+                )
+                return clubs, clubs_seq, competitions, competitions_seq
+            except SnapshotError:
+                pass
+        clubs, clubs_seq = _read_snapshot(self.clubs_path, "clubs")
+        competitions, competitions_seq = _read_snapshot(self.competitions_path, "competitions")
+        return clubs, clubs_seq, competitions, competitions_seq
+
+    def _read_ledger(self):
+        """
+        Lit l'instantané du registre des réservations cumulées.
+
+        Returns:
+            tuple: (enregistrements, séquence du journal déjà intégrée) ; vide si le fichier n'existe pas.
+        """
+        if not self.ledger_path or not os.path.exists(self.ledger_path):
+            return [], 0
+        return _read_snapshot(self.ledger_path, "bookings")
+
+    def _write_snapshots(self, clubs, clubs_seq, competitions, competitions_seq):
+        """Écrit les instantanés JSON, puis l'instantané binaire (plus récent, donc préféré au chargement)."""
+        _write_snapshot(self.clubs_path, "clubs", clubs, clubs_seq)
+        _write_snapshot(self.competitions_path, "competitions", competitions, competitions_seq)
+        if self.snapshot_path:
+            write_snapshot(self.snapshot_path, clubs, competitions, clubs_seq, competitions_seq)
+
+    def _open(self):
+        """Ouvre (une seule fois) le fichier journal en mode ajout."""
+        if self._file is None:
+            self._file = open(self.path, "a")
+        return self._file
+
+    def _truncate_torn_tail(self):
+        """
+        Tronque le journal juste après sa dernière ligne complète et valide.
+
+        Sans cela, le prochain ajout (mode "a") serait écrit à la suite de la ligne
+        incomplète : le rejeu s'arrêterait sur cette ligne et perdrait la
+        réservation ajoutée ainsi que toutes les suivantes.
+        """
+        if not os.path.exists(self.path):
+            return
+        with self._lock:
+            with open(self.path, "rb") as f:
+                data = f.read()
+            valid_end = 0
+            for line in data.splitlines(keepends=True):
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    json.loads(line)
+                except ValueError:
+                    break
+                valid_end += len(line)
+            if valid_end < len(data):
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                with open(self.path, "r+b") as f:
+                    f.truncate(valid_end)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+    def _read_records(self, end=None):
+        """
+        Lit les enregistrements du journal, éventuellement jusqu'à une position donnée.
+
+        Une dernière ligne incomplète (écriture interrompue) est ignorée.
+        """
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, "rb") as f:
+            data = f.read() if end is None else f.read(end)
+        records = []
+        for line in data.splitlines():
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+        return records
@@ -0,0 +1,137 @@
+import json
+import re
+
+# Premier caractère significatif (les blancs autorisés par JSON sont ignorés)
+NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """
+    Lecture d'un fichier texte par blocs, avec un tampon qui ne conserve que la
+    partie non encore analysée.
+    """
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Ajoute un bloc au tampon, en abandonnant la partie déjà analysée."""
+        data = self.f.read(self.chunk_size)
+        if not data:
+            self.eof = True
+        self.buffer = self.buffer[self.pos :] + data
+        self.pos = 0
+
+    def peek(self):
+        """Premier caractère significatif (hors blancs), ou "" en fin de fichier."""
+        while True:
+            match = NON_WHITESPACE.search(self.buffer, self.pos)
+            if match is not None:
+                self.pos = match.start()
+                return self.buffer[self.pos]
+            self.pos = len(self.buffer)
+            if self.eof:
+                return ""
+            self.fill()
+
+    def expect(self, char):
+        """Consomme le caractère attendu (hors blancs)."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r}, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def value(self):
+        """
+        Analyse la valeur JSON suivante.
+
+        Si la valeur est coupée par la fin du tampon (ou se termine exactement à
+        la fin du tampon, cas d'un nombre éventuellement incomplet), un bloc de
+        plus est lu avant de recommencer.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self.fill()
+                continue
+            if end == len(self.buffer) and not self.eof:
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_records(path, key, extras=None, chunk_size=CHUNK_SIZE):
+    """
+    Parcourt un à un les enregistrements de la liste `key` d'un fichier de données JSON.
+
+    Le fichier ({"clubs": [...], ...}) est lu par blocs de `chunk_size` caractères :
+    la mémoire utilisée est bornée par la taille d'un bloc et d'un enregistrement,
+    quelle que soit la taille du fichier, au lieu de contenir le texte complet puis
+    l'arbre analysé comme `json.load`.
+
+    Args:
+        path (str): Chemin du fichier.
+        key (str): Clé de la liste ("clubs" ou "competitions").
+        extras (dict, optional): Reçoit les autres clés de premier niveau du
+            fichier (ex. "journalSeq"), une fois le parcours terminé.
+        chunk_size (int): Taille des blocs lus.
+
+    Yields:
+        dict: Enregistrement suivant.
+
+    Raises:
+        KeyError: si le fichier ne contient pas la clé demandée.
+        ValueError: si le fichier n'est pas un objet JSON valide.
+    """
+    with open(path, encoding="utf-8") as f:
+        reader = _Reader(f, chunk_size)
+        reader.expect("{")
+        found = False
+        if reader.peek() == "}":
+            reader.pos += 1
+        else:
+            while True:
+                name = reader.value()
+                reader.expect(":")
+                if name == key:
+                    found = True
+                    yield from _iter_array(reader)
+                else:
+                    value = reader.value()
+                    if extras is not None:
+                        extras[name] = value
+                if reader.peek() == ",":
+                    reader.pos += 1
+                    continue
+                reader.expect("}")
+                break
+
+    if not found:
+        raise KeyError(key)
+
+
+def _iter_array(reader):
+    """Parcourt les éléments d'un tableau JSON, crochets compris."""
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        if reader.peek() == ",":
+            reader.pos += 1
+            continue
+        reader.expect("]")
+        return
@@ -0,0 +1,93 @@
+import threading
+
+# Places qu'un club peut réserver au total sur une même compétition
+MAX_PLACES_PER_COMPETITION = 12
+
+
+class BookingLedger:
+    """
+    Places réservées au total par chaque club sur chaque compétition.
+
+    Les totaux sont tenus à jour à chaque réservation dans un dictionnaire indexé
+    par (club, compétition) : la limite de places par compétition se vérifie sans
+    parcourir l'historique. Un index par club donne directement ses réservations
+    (page d'historique).
+    """
+
+    def __init__(self):
+        self._totals = {}  # (club, compétition) -> places
+        self._by_club = {}  # club -> {compétition: places}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Construit le registre à partir d'enregistrements persistés.
+
+        Args:
+            records (iterable): Dictionnaires {"club", "competition", "places"}.
+        """
+        ledger = cls()
+        for record in records:
+            ledger.add(record["club"], record["competition"], int(record["places"]))
+        return ledger
+
+    def replace(self, records):
+        """
+        Remplace tout le contenu du registre (ex. fichier rechargé à chaud).
+
+        Args:
+            records (iterable): Dictionnaires {"club", "competition", "places"}.
+        """
+        loaded = BookingLedger.from_records(records)
+        with self._lock:
+            self._totals, self._by_club = loaded._totals, loaded._by_club
+
+    def booked(self, club_name, competition_name):
+        """Places déjà réservées par un club sur une compétition."""
+        return self._totals.get((club_name, competition_name), 0)
+
+    def add(self, club_name, competition_name, places):
+        """
+        Ajoute des places au total d'un club sur une compétition (retire si `places` < 0).
+
+        Args:
+            club_name (str): Nom du club.
+            competition_name (str): Nom de la compétition.
+            places (int): Places réservées (ou annulées).
+        """
+        key = (club_name, competition_name)
+        with self._lock:
+            total = self._totals.get(key, 0) + places
+            if total:
+                self._totals[key] = total
+                self._by_club.setdefault(club_name, {})[competition_name] = total
+            else:
+                self._totals.pop(key, None)
+                self._by_club.get(club_name, {}).pop(competition_name, None)
+
+    def history(self, club_name):
+        """
+        Réservations d'un club.
+
+        Returns:
+            dict: {nom de la compétition: places réservées}, dans l'ordre des premières réservations.
+        """
+        with self._lock:
+            return dict(self._by_club.get(club_name, {}))
+
+    def to_records(self):
+        """
+        Enregistrements à persister.
+
+        Returns:
+            list: Dictionnaires {"club", "competition", "places"}.
+        """
+        with self._lock:
+            return [
+                {"club": club, "competition": competition, "places": places}
+                for (club, competition), places in self._totals.items()
+            ]
+
+    def __len__(self):
+        return len(self._totals)
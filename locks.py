@@ -0,0 +1,48 @@
+import threading
+from contextlib import contextmanager
+
+
+class StripedLocks:
+    """
+    Ensemble fixe de verrous partagés par clé (lock striping).
+
+    Chaque clé (ex. ("club", "Iron Temple")) est associée à l'un des `stripes`
+    verrous selon son hash : la mémoire reste bornée quel que soit le nombre de
+    clubs et de compétitions, et deux réservations portant sur des clubs et des
+    compétitions différents ne se bloquent (presque) jamais.
+    """
+
+    def __init__(self, stripes=64):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    @contextmanager
+    def holding(self, *keys):
+        """
+        Acquiert les verrous de toutes les clés données, toujours dans le même ordre
+        (indice croissant) afin d'éviter tout interblocage.
+
+        Args:
+            *keys: Clés hachables à verrouiller.
+        """
+        indexes = sorted({hash(key) % len(self._locks) for key in keys})
+        for index in indexes:
+            self._locks[index].acquire()
+        try:
+            yield
+        finally:
+            for index in reversed(indexes):
+                self._locks[index].release()
+
+    @contextmanager
+    def holding_all(self):
+        """
+        Acquiert tous les verrous (dans le même ordre que `holding`) : aucune
+        opération protégée par `holding` ne peut se dérouler pendant ce temps.
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
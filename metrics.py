@@ -0,0 +1,161 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Bornes supérieures (secondes) des classes des histogrammes de durée
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Route attribuée aux étapes chronométrées hors requête (ex. thread d'écriture de la file)
+BACKGROUND = "background"
+
+
+class Histogram:
+    """Histogramme cumulatif de durées, au sens de Prometheus (classes `le`, somme et nombre)."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # dernière classe : +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """Ajoute une mesure (secondes)."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metrics:
+    """
+    Métriques des requêtes, au format texte de Prometheus.
+
+    Pour chaque route : nombre de requêtes par code de statut, nombre d'erreurs
+    (statut >= 400) et histogramme des durées. Des étapes de la requête
+    (recherche, validation, persistance, rendu...) peuvent être chronométrées
+    séparément avec `phase`, qui les rattache à la route en cours dans le thread.
+
+    Les mesures sont protégées par un verrou ; la mise à jour d'un histogramme ne
+    coûte qu'une recherche dichotomique et quelques additions.
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._requests = {}  # (route, statut) -> nombre
+        self._errors = {}  # route -> nombre
+        self._durations = {}  # route -> Histogram
+        self._phases = {}  # (route, étape) -> Histogram
+
+    def start_request(self, route):
+        """Commence la mesure d'une requête sur `route` dans le thread courant."""
+        self._local.route = route
+        self._local.started = time.perf_counter()
+
+    def end_request(self, status):
+        """
+        Termine la mesure de la requête en cours dans le thread courant.
+
+        Args:
+            status (int): Code de statut HTTP de la réponse.
+        """
+        started = getattr(self._local, "started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        route = self._local.route
+        self._local.started = self._local.route = None
+        with self._lock:
+            self._requests[route, status] = self._requests.get((route, status), 0) + 1
+            if status >= 400:
+                self._errors[route] = self._errors.get(route, 0) + 1
+            self._histogram(self._durations, route).observe(elapsed)
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Chronomètre une étape de la requête en cours (ou d'un traitement hors requête).
+
+        Args:
+            name (str): Nom de l'étape ("lookup", "validation", "persistence", "rendering"...).
+        """
+        route = getattr(self._local, "route", None) or BACKGROUND
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._histogram(self._phases, (route, name)).observe(elapsed)
+
+    def _histogram(self, histograms, key):
+        """Histogramme de `key`, créé au premier usage (appelé sous verrou)."""
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(self.buckets)
+        return histogram
+
+    def render(self, gauges=None):
+        """
+        Exporte les métriques au format texte de Prometheus (version 0.0.4).
+
+        Args:
+            gauges (dict, optional): Valeurs instantanées à ajouter,
+                {nom: (description, type, valeur)} ; ex. profondeur de la file.
+
+        Returns:
+            str: Contenu de la réponse de `/metrics`.
+        """
+        with self._lock:
+            requests = sorted(self._requests.items())
+            errors = sorted(self._errors.items())
+            durations = sorted((route, _copy(h)) for route, h in self._durations.items())
+            phases = sorted((key, _copy(h)) for key, h in self._phases.items())
+
+        lines = _header("gudlft_requests_total", "Requests handled, by route and status.", "counter")
+        lines += [
+            f"gudlft_requests_total{_labels(route=route, status=status)} {count}" for (route, status), count in requests
+        ]
+        lines += _header("gudlft_request_errors_total", "Requests answered with a 4xx or 5xx status.", "counter")
+        lines += [f"gudlft_request_errors_total{_labels(route=route)} {count}" for route, count in errors]
+        lines += _header("gudlft_request_duration_seconds", "Request duration, by route.", "histogram")
+        for route, histogram in durations:
+            lines += self._histogram_lines("gudlft_request_duration_seconds", histogram, route=route)
+        lines += _header("gudlft_phase_duration_seconds", "Duration of request phases, by route.", "histogram")
+        for (route, name), histogram in phases:
+            lines += self._histogram_lines("gudlft_phase_duration_seconds", histogram, route=route, phase=name)
+        for name, (description, kind, value) in (gauges or {}).items():
+            lines += _header(name, description, kind)
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def _histogram_lines(self, name, histogram, **labels):
+        """Lignes `_bucket` (cumulées), `_sum` et `_count` d'un histogramme."""
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, "+Inf"), histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {cumulative}")
+        lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum:.6f}")
+        lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+        return lines
+
+
+def _copy(histogram):
+    """Copie d'un histogramme, pour l'exporter hors verrou."""
+    copy = Histogram(histogram.buckets)
+    copy.counts, copy.sum, copy.count = list(histogram.counts), histogram.sum, histogram.count
+    return copy
+
+
+def _header(name, description, kind):
+    """Lignes HELP et TYPE d'une métrique."""
+    return [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+
+
+def _labels(**labels):
+    """Étiquettes au format Prometheus, valeurs échappées."""
+    escaped = (
+        str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in labels.values()
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + "}"
@@ -0,0 +1,107 @@
+from datetime import datetime
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class Record:
+    """
+    Base des modèles : attributs typés dans des `__slots__` (pas de `__dict__`
+    par instance) et vue « dictionnaire » compatible avec le schéma JSON.
+
+    `record.champ` donne la valeur typée (ex. un datetime), tandis que
+    `record["champ"]` donne la valeur telle qu'elle est écrite dans les fichiers
+    JSON ; l'affectation `record["champ"] = valeur` accepte ce même format.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        """Équivalent de `dict.get` sur la vue JSON de l'enregistrement."""
+        return self[key] if key in self.__slots__ else default
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: Enregistrement au format des fichiers JSON.
+        """
+        return {key: self[key] for key in self.__slots__}
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Club(Record):
+    """
+    Club inscrit : nom, email du secrétaire et points disponibles (entier).
+    """
+
+    __slots__ = ("name", "email", "points")
+
+    def __init__(self, name, email, points):
+        self.name = name
+        self.email = email
+        self.points = int(points)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Construit un club depuis un enregistrement JSON (points éventuellement en texte)."""
+        return cls(data["name"], data["email"], data["points"])
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, int(value) if key == "points" else value)
+
+
+class Competition(Record):
+    """
+    Compétition : nom, date (datetime analysé au chargement) et places restantes (entier).
+    """
+
+    __slots__ = ("name", "date", "numberOfPlaces")
+
+    def __init__(self, name, date, numberOfPlaces):
+        self.name = name
+        self.date = date if isinstance(date, datetime) else datetime.strptime(date, DATE_FORMAT)
+        self.numberOfPlaces = int(numberOfPlaces)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Construit une compétition depuis un enregistrement JSON (date au format DATE_FORMAT)."""
+        return cls(data["name"], data["date"], data["numberOfPlaces"])
+
+    def __getitem__(self, key):
+        if key == "date":
+            return self.date.strftime(DATE_FORMAT)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        if key == "date" and not isinstance(value, datetime):
+            value = datetime.strptime(value, DATE_FORMAT)
+        elif key == "numberOfPlaces":
+            value = int(value)
+        super().__setitem__(key, value)
+
+
+def competition_date(competition):
+    """
+    Date d'une compétition sous forme de datetime.
+
+    Pour un modèle `Competition`, la date est déjà analysée ; un enregistrement
+    brut (dict) est analysé à la volée.
+    """
+    if isinstance(competition, Competition):
+        return competition.date
+    return datetime.strptime(competition["date"], DATE_FORMAT)
@@ -0,0 +1,178 @@
+import cProfile
+import hmac
+import os
+import pstats
+import random
+import threading
+import time
+from collections import defaultdict
+
+# En-tête HTTP demandant le profilage d'une requête (valeur : PROFILE_TOKEN)
+PROFILE_HEADER = "X-Gudlft-Profile"
+# Temps (secondes) en dessous duquel une branche n'est pas écrite dans les piles repliées
+MIN_STACK_TIME = 1e-6
+
+
+class RequestProfiler:
+    """
+    Profilage (cProfile) d'un échantillon de requêtes.
+
+    Une requête est profilée si elle est tirée au sort (proportion `sample_rate`)
+    ou si elle présente l'en-tête PROFILE_HEADER avec le jeton configuré. Une
+    seule requête est profilée à la fois : cProfile ne suit que le thread qui
+    l'active, et un profilage simultané sur plusieurs threads n'est pas possible
+    sur toutes les versions de Python.
+
+    Chaque profil est écrit dans `directory/<route>/` sous deux formes : `.prof`
+    (lisible par `pstats`, snakeviz...) et `.collapsed` (piles repliées pour
+    flamegraph.pl ou speedscope). Seuls les `keep` derniers profils de chaque
+    route sont conservés.
+    """
+
+    def __init__(self, directory, sample_rate=0.0, token=None, keep=20):
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.token = token
+        self.keep = keep
+        self._busy = threading.Lock()
+
+    def start(self, header=None):
+        """
+        Démarre le profilage de la requête en cours si elle est retenue.
+
+        Args:
+            header (str, optional): Valeur de l'en-tête PROFILE_HEADER de la requête.
+
+        Returns:
+            cProfile.Profile | None: Profil actif, à passer à `finish`, ou None.
+        """
+        # Comparaison d'octets : l'en-tête peut contenir des caractères non ASCII (décodés
+        # en latin-1) et le jeton lu depuis l'environnement peut être un nombre.
+        requested = (
+            self.token is not None
+            and header is not None
+            and hmac.compare_digest(header.encode("latin-1", "replace"), str(self.token).encode())
+        )
+        if not requested and random.random() >= self.sample_rate:
+            return None
+        if not self._busy.acquire(blocking=False):
+            return None
+        profile = cProfile.Profile()
+        profile.enable()
+        return profile
+
+    def finish(self, profile, route):
+        """
+        Arrête un profil et l'écrit dans le dossier de la route, avec rotation.
+
+        Args:
+            profile (cProfile.Profile): Profil retourné par `start`.
+            route (str): Route de la requête (nom du dossier).
+
+        Returns:
+            str: Chemin du fichier `.prof` écrit.
+        """
+        try:
+            profile.disable()
+        finally:
+            self._busy.release()
+
+        folder = os.path.join(self.directory, route)
+        os.makedirs(folder, exist_ok=True)
+        base = os.path.join(folder, f"{time.time_ns()}-{os.getpid()}")
+        profile.dump_stats(f"{base}.prof")
+        with open(f"{base}.collapsed", "w") as f:
+            for stack, seconds in collapsed_stacks(pstats.Stats(profile).stats).items():
+                f.write(f"{stack} {max(round(seconds * 1_000_000), 1)}\n")
+        self.rotate(folder)
+        return f"{base}.prof"
+
+    def rotate(self, folder):
+        """Supprime les profils les plus anciens d'une route au-delà de `keep`."""
+        names = sorted(name[: -len(".prof")] for name in os.listdir(folder) if name.endswith(".prof"))
+        for name in names[: max(len(names) - self.keep, 0)]:
+            for extension in (".prof", ".collapsed"):
+                try:
+                    os.remove(os.path.join(folder, name + extension))
+                except FileNotFoundError:
+                    pass
+
+
+def function_label(function):
+    """Nom lisible d'une fonction de `pstats` : module:fonction:ligne, ou nom de la fonction native."""
+    filename, line, name = function
+    if filename == "~":
+        return name
+    return f"{os.path.splitext(os.path.basename(filename))[0]}:{name}:{line}"
+
+
+def collapsed_stacks(stats):
+    """
+    Reconstitue des piles repliées (format de flamegraph.pl) à partir de statistiques cProfile.
+
+    cProfile ne garde que les arcs appelant -> appelé : le temps d'une fonction
+    appelée depuis plusieurs endroits est réparti entre les piles au prorata du
+    temps de chaque arc. Les appels récursifs ne sont pas dépliés.
+
+    Args:
+        stats (dict): `pstats.Stats.stats`, {fonction: (cc, nc, tt, ct, appelants)}.
+
+    Returns:
+        dict: {"a;b;c": temps propre (secondes) de c dans cette pile}
+    """
+    callees = defaultdict(dict)
+    for function, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees[caller][function] = edge[3]
+
+    stacks = defaultdict(float)
+
+    def walk(function, path, seconds):
+        total = stats[function][3]
+        share = seconds / total if total else 0.0
+        path = path + (function,)
+        stacks[";".join(function_label(f) for f in path)] += stats[function][2] * share
+        for callee, edge_time in callees[function].items():
+            if callee not in path and edge_time * share >= MIN_STACK_TIME:
+                walk(callee, path, edge_time * share)
+
+    for function, (_, _, _, total, callers) in stats.items():
+        if not callers:
+            walk(function, (), total)
+    return {stack: seconds for stack, seconds in stacks.items() if seconds > 0}
+
+
+def hotspot_report(directory, top=20, sort="tottime", routes=None):
+    """
+    Agrège les profils écrits par route et liste les fonctions les plus coûteuses
+    (temps moyens par requête profilée).
+
+    Args:
+        directory (str): Dossier des profils (PROFILE_DIR).
+        top (int): Nombre de fonctions par route.
+        sort (str): "tottime" (temps propre) ou "cumtime" (temps cumulé).
+        routes (iterable, optional): Routes à inclure (toutes par défaut).
+
+    Returns:
+        str: Rapport texte, une section par route.
+    """
+    column = {"tottime": 2, "cumtime": 3}[sort]
+    sections = []
+    for route in sorted(os.listdir(directory)) if os.path.isdir(directory) else []:
+        folder = os.path.join(directory, route)
+        files = sorted(os.path.join(folder, n) for n in os.listdir(folder) if n.endswith(".prof"))
+        if not files or (routes and route not in routes):
+            continue
+        stats = pstats.Stats(*files).stats
+        ranked = sorted(stats.items(), key=lambda item: item[1][column], reverse=True)[:top]
+        lines = [
+            f"{route} ({len(files)} profiled requests)",
+            f"{'calls':>10} {'self ms/req':>12} {'cum ms/req':>12}  function",
+        ]
+        for function, (_, calls, tottime, cumtime, _) in ranked:
+            lines.append(
+                f"{calls:>10} {tottime * 1000 / len(files):>12.3f} {cumtime * 1000 / len(files):>12.3f}  "
+                f"{function_label(function)}"
+            )
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections) if sections else f"No profiles found in {directory}."
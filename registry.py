@@ -0,0 +1,330 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from itertools import count
+
+from models import DATE_FORMAT, competition_date
+
+
+def encode_cursor(key):
+    """
+    Encode une clé (date, nom) de l'index des compétitions en curseur de pagination.
+
+    Le curseur désigne une position dans l'ordre (date, nom), et non un rang :
+    il reste valide si des compétitions sont ajoutées ou supprimées entre deux pages.
+    """
+    date, name = key
+    return f"{date.strftime(DATE_FORMAT)}|{name}"
+
+
+def decode_cursor(cursor):
+    """
+    Décode un curseur produit par `encode_cursor`.
+
+    Raises:
+        ValueError: si le curseur est mal formé.
+    """
+    date, _, name = cursor.partition("|")
+    return datetime.strptime(date, DATE_FORMAT), name
+
+
+class Registry:
+    """
+    Registre en mémoire des clubs et des compétitions.
+
+    Le registre possède les listes chargées et maintient des index (dictionnaires)
+    par email et par nom, afin que les recherches effectuées par les routes se
+    fassent en O(1) au lieu d'un parcours complet des listes.
+
+    Les compétitions sont aussi indexées par (date, nom) dans une liste triée :
+    les vues « à venir », « passées » et « dans les N prochains jours », ainsi
+    que leur pagination par curseur, sont obtenues par recherche dichotomique
+    puis découpage, sans parcourir tout le catalogue.
+
+    Les index sont tenus à jour à chaque ajout, suppression, modification d'une
+    clé (nom, email, date) ou rechargement complet des données.
+
+    Un numéro de version global (`version`) change à chaque modification des
+    données : les contenus calculés à partir des données (pages rendues, JSON)
+    peuvent être mis en cache tant que la version ne change pas. Chaque club et
+    chaque compétition a aussi sa propre version (`record_stamp`), qui ne change
+    que si cet enregistrement est modifié (ou lors d'une modification globale,
+    comme un rechargement).
+    """
+
+    def __init__(self, clubs=None, competitions=None):
+        self.clubs = []
+        self.competitions = []
+        self._clubs_by_email = {}
+        self._clubs_by_name = {}
+        self._competitions_by_name = {}
+        self._date_keys = []
+        self._competitions_by_date = []
+        self._versions = count(1)
+        self.version = 0
+        self.modified_at = None
+        self._epoch = (0, None)
+        self._record_stamps = {}
+        self.reload(clubs if clubs is not None else [], competitions if competitions is not None else [])
+
+    def reload(self, clubs, competitions):
+        """
+        Remplace les données du registre et reconstruit tous les index.
+
+        En cas de doublon, le premier enregistrement rencontré est conservé,
+        comme le faisaient les anciennes recherches par parcours de liste.
+
+        Args:
+            clubs (list): Nouvelle liste des clubs.
+            competitions (list): Nouvelle liste des compétitions.
+        """
+        clubs_by_email = {}
+        clubs_by_name = {}
+        for club in clubs:
+            clubs_by_email.setdefault(club["email"], club)
+            clubs_by_name.setdefault(club["name"], club)
+
+        competitions_by_name = {}
+        for competition in competitions:
+            competitions_by_name.setdefault(competition["name"], competition)
+
+        dated = sorted((((competition_date(c), c["name"]), c) for c in competitions), key=lambda item: item[0])
+
+        self.clubs = clubs
+        self.competitions = competitions
+        self._clubs_by_email = clubs_by_email
+        self._clubs_by_name = clubs_by_name
+        self._competitions_by_name = competitions_by_name
+        self._date_keys = [key for key, _ in dated]
+        self._competitions_by_date = [competition for _, competition in dated]
+        self._record_stamps = {}
+        self.touch()
+
+    def touch(self, club=None, competition=None):
+        """
+        Signale une modification des données : change la version globale.
+
+        Si un club et/ou une compétition sont donnés (ex. une réservation), seules
+        leurs versions propres changent ; sinon la modification est globale et
+        toutes les versions d'enregistrements sont périmées.
+
+        Args:
+            club (Club, optional): Club modifié.
+            competition (Competition, optional): Compétition modifiée.
+
+        Returns:
+            int: Nouvelle version globale.
+        """
+        # next() sur itertools.count est atomique : aucune incrémentation n'est perdue entre threads
+        version = next(self._versions)
+        stamp = (version, datetime.now(timezone.utc).replace(microsecond=0))
+        if club is None and competition is None:
+            self._epoch = stamp
+        if club is not None:
+            self._record_stamps[("club", club["name"])] = stamp
+        if competition is not None:
+            self._record_stamps[("competition", competition["name"])] = stamp
+        self.version, self.modified_at = stamp
+        return version
+
+    def record_stamp(self, kind, name):
+        """
+        Version et date de dernière modification d'un enregistrement.
+
+        Args:
+            kind (str): "club" ou "competition".
+            name (str): Nom de l'enregistrement.
+
+        Returns:
+            tuple: (version, datetime UTC de la modification)
+        """
+        return max(self._record_stamps.get((kind, name), self._epoch), self._epoch)
+
+    def club_by_email(self, email):
+        """Retourne le club associé à l'email, ou None."""
+        return self._clubs_by_email.get(email)
+
+    def club_by_name(self, name):
+        """Retourne le club portant ce nom, ou None."""
+        return self._clubs_by_name.get(name)
+
+    def competition_by_name(self, name):
+        """Retourne la compétition portant ce nom, ou None."""
+        return self._competitions_by_name.get(name)
+
+    def upcoming_competitions(self, now=None):
+        """
+        Compétitions à venir (date >= maintenant), triées par date.
+
+        Args:
+            now (datetime, optional): Instant de référence (maintenant par défaut).
+
+        Returns:
+            list: Compétitions à venir.
+        """
+        return self.competitions_page("upcoming", now=now)[0]
+
+    def past_competitions(self, now=None):
+        """
+        Compétitions passées (date < maintenant), triées par date.
+
+        Args:
+            now (datetime, optional): Instant de référence (maintenant par défaut).
+
+        Returns:
+            list: Compétitions passées.
+        """
+        return self.competitions_page("past", now=now)[0]
+
+    def competitions_within(self, days, now=None):
+        """
+        Compétitions ayant lieu dans les `days` prochains jours, triées par date.
+
+        Args:
+            days (int | float): Taille de la fenêtre en jours.
+            now (datetime, optional): Instant de référence (maintenant par défaut).
+
+        Returns:
+            list: Compétitions comprises entre maintenant et maintenant + `days` jours.
+        """
+        return self.competitions_page("upcoming", days=days, now=now)[0]
+
+    def competitions_page(self, view="upcoming", days=None, after=None, limit=None, now=None):
+        """
+        Page de compétitions triées par (date, nom), avec pagination par curseur.
+
+        Args:
+            view (str): "upcoming" (date >= maintenant), "past" (date < maintenant) ou "all".
+            days (int | float, optional): Pour "upcoming", limite aux N prochains jours
+                (une valeur hors des dates représentables ne limite pas la page).
+            after (str, optional): Curseur renvoyé par la page précédente.
+            limit (int, optional): Taille maximale de la page (illimitée si None).
+            now (datetime, optional): Instant de référence (maintenant par défaut).
+
+        Returns:
+            tuple: (liste des compétitions de la page, curseur de la page suivante ou None)
+        """
+        now = now or datetime.now()
+        start, end = 0, len(self._date_keys)
+        if view == "upcoming":
+            start = bisect_left(self._date_keys, (now,))
+            if days is not None:
+                try:
+                    end = bisect_left(self._date_keys, (now + timedelta(days=days, microseconds=1),))
+                except OverflowError:
+                    # Fenêtre au-delà des dates représentables : aucune borne (ou rien si négative)
+                    end = end if days > 0 else start
+        elif view == "past":
+            end = bisect_left(self._date_keys, (now,))
+
+        if after:
+            start = max(start, bisect_right(self._date_keys, decode_cursor(after)))
+
+        stop = end if limit is None else min(end, start + limit)
+        page = self._competitions_by_date[start:stop]
+        next_cursor = encode_cursor(self._date_keys[stop - 1]) if page and stop < end else None
+        return page, next_cursor
+
+    def is_past(self, competition, now=None):
+        """Indique si la compétition a déjà eu lieu."""
+        return competition_date(competition) < (now or datetime.now())
+
+    def add_club(self, club):
+        """Ajoute un club à la liste et aux index."""
+        self.clubs.append(club)
+        self._clubs_by_email.setdefault(club["email"], club)
+        self._clubs_by_name.setdefault(club["name"], club)
+        self.touch()
+
+    def add_competition(self, competition):
+        """Ajoute une compétition à la liste et à l'index par nom."""
+        self.competitions.append(competition)
+        self._competitions_by_name.setdefault(competition["name"], competition)
+        self._index_date(competition)
+        self.touch()
+
+    def remove_club(self, club):
+        """Retire un club de la liste et des index."""
+        self.clubs.remove(club)
+        self._unindex(self._clubs_by_email, club["email"], club, self.clubs, "email")
+        self._unindex(self._clubs_by_name, club["name"], club, self.clubs, "name")
+        self.touch()
+
+    def remove_competition(self, competition):
+        """Retire une compétition de la liste et de l'index par nom."""
+        self.competitions.remove(competition)
+        self._unindex(self._competitions_by_name, competition["name"], competition, self.competitions, "name")
+        self._unindex_date(competition)
+        self.touch()
+
+    def update_club(self, club, **changes):
+        """
+        Modifie les champs d'un club en gardant les index cohérents.
+
+        Args:
+            club (Club | dict): Club présent dans le registre.
+            **changes: Champs à modifier (ex. email="...", points=10).
+        """
+        old_email, old_name = club["email"], club["name"]
+        for field, value in changes.items():
+            club[field] = value
+        if club["email"] != old_email:
+            self._unindex(self._clubs_by_email, old_email, club, self.clubs, "email")
+            self._clubs_by_email.setdefault(club["email"], club)
+        if club["name"] != old_name:
+            self._unindex(self._clubs_by_name, old_name, club, self.clubs, "name")
+            self._clubs_by_name.setdefault(club["name"], club)
+        self.touch()
+
+    def update_competition(self, competition, **changes):
+        """
+        Modifie les champs d'une compétition en gardant les index (nom, date) cohérents.
+
+        Args:
+            competition (Competition | dict): Compétition présente dans le registre.
+            **changes: Champs à modifier (ex. name="...", date="2030-01-01 10:00:00").
+        """
+        old_name = competition["name"]
+        reindex_date = "date" in changes or "name" in changes
+        if reindex_date:
+            self._unindex_date(competition)
+        for field, value in changes.items():
+            competition[field] = value
+        if reindex_date:
+            self._index_date(competition)
+        if competition["name"] != old_name:
+            self._unindex(self._competitions_by_name, old_name, competition, self.competitions, "name")
+            self._competitions_by_name.setdefault(competition["name"], competition)
+        self.touch()
+
+    def _index_date(self, competition):
+        """Insère la compétition à sa place dans l'index trié par date."""
+        key = (competition_date(competition), competition["name"])
+        position = bisect_right(self._date_keys, key)
+        self._date_keys.insert(position, key)
+        self._competitions_by_date.insert(position, competition)
+
+    def _unindex_date(self, competition):
+        """Retire la compétition de l'index trié par date."""
+        key = (competition_date(competition), competition["name"])
+        start, end = bisect_left(self._date_keys, key), bisect_right(self._date_keys, key)
+        for position in range(start, end):
+            if self._competitions_by_date[position] is competition:
+                del self._date_keys[position]
+                del self._competitions_by_date[position]
+                return
+
+    @staticmethod
+    def _unindex(index, key, record, records, field):
+        """
+        Retire `record` de l'index pour `key`.
+
+        Si un autre enregistrement partage la même clé, il prend la place dans
+        l'index (cas rare des doublons, traité par un parcours de liste).
+        """
+        if index.get(key) is not record:
+            return
+        del index[key]
+        for other in records:
+            if other is not record and other[field] == key:
+                index[key] = other
+                break
@@ -0,0 +1,180 @@
+import os
+import threading
+
+from json_stream import iter_records
+
+
+def file_signature(path):
+    """
+    Signature bon marché d'un fichier : inode, taille et date de modification (ns).
+
+    Un remplacement atomique (nouvel inode), une réécriture ou un ajout changent
+    la signature sans qu'il soit nécessaire de relire le contenu.
+
+    Returns:
+        tuple | None: Signature, ou None si le fichier n'existe pas.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def merge_records(current, baseline, records, make):
+    """
+    Fusionne à trois voies une nouvelle version d'un fichier de données dans les
+    enregistrements en mémoire.
+
+    Seules les modifications faites dans le fichier depuis sa dernière version
+    connue (`baseline`) sont reportées : une réservation faite en mémoire entre-temps
+    n'est pas annulée, sauf si le même champ a été modifié dans le fichier.
+
+        - enregistrement nouveau dans le fichier : ajouté ;
+        - enregistrement absent du fichier : retiré ;
+        - enregistrement existant : les champs modifiés dans le fichier sont
+          recopiés sur l'objet en mémoire (qui garde son identité).
+
+    Args:
+        current (list): Enregistrements en mémoire.
+        baseline (dict): Dernière version connue du fichier, {nom: dict au format JSON}.
+        records (iterable): Enregistrements du fichier (dictionnaires bruts).
+        make (callable): Construit un modèle depuis un dictionnaire (ex. `Club.from_dict`).
+
+    Returns:
+        tuple: (nouvelle liste, dans l'ordre du fichier ; nouvelle version connue du fichier)
+    """
+    live = {}
+    for record in current:
+        live.setdefault(record["name"], record)
+
+    merged = []
+    seen = {}
+    for raw in records:
+        # Normalisation au format des modèles, pour comparer "10" et 10 comme égaux
+        record = make(raw)
+        fields = record.to_dict()
+        name = fields["name"]
+        seen[name] = fields
+        existing = live.pop(name, None)
+        if existing is None:
+            merged.append(record)
+            continue
+        previous = baseline.get(name, {})
+        for field, value in fields.items():
+            if previous.get(field) != value:
+                existing[field] = value
+        merged.append(existing)
+    return merged, seen
+
+
+class DataWatcher:
+    """
+    Détecte les modifications extérieures (ex. édition par l'équipe d'administration)
+    des fichiers de données.
+
+    Pour chaque fichier, le watcher retient la signature (`file_signature`) et le
+    contenu ({nom: enregistrement}) de la dernière version connue : celle chargée,
+    fusionnée, ou écrite par l'application elle-même. Un fichier dont la signature
+    a changé a été modifié par un tiers.
+
+    Un thread peut vérifier les signatures toutes les `interval` secondes (`start`)
+    et appeler `on_change(chemins modifiés)`.
+    """
+
+    def __init__(self, files):
+        """
+        Args:
+            files (dict): {chemin: (enregistrements chargés, fonction de construction du modèle)}.
+                Un fichier sans fonction de construction (None) est seulement surveillé :
+                il n'est pas fusionné, l'appelant le relit entièrement.
+        """
+        self._lock = threading.Lock()
+        self._signatures = {}
+        self._baselines = {}
+        self._makers = {}
+        for path, (records, make) in files.items():
+            self._makers[path] = make
+            self.seen(path, records)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def seen(self, path, records):
+        """
+        Enregistre la version actuelle d'un fichier comme connue (après lecture ou écriture).
+
+        Args:
+            path (str): Fichier concerné.
+            records (iterable): Contenu du fichier (modèles ou dictionnaires au format JSON).
+        """
+        baseline = {}
+        for record in records:
+            fields = record.to_dict() if hasattr(record, "to_dict") else dict(record)
+            baseline.setdefault(fields["name"], fields)
+        with self._lock:
+            self._baselines[path] = baseline
+            self._signatures[path] = file_signature(path)
+
+    def watches(self, path):
+        """Indique si le fichier est surveillé."""
+        return path in self._makers
+
+    def changed_externally(self, path):
+        """Indique si le fichier a été modifié depuis sa dernière version connue."""
+        with self._lock:
+            known = self._signatures.get(path)
+        return file_signature(path) != known
+
+    def changes(self):
+        """Liste des fichiers surveillés modifiés depuis leur dernière version connue."""
+        return [path for path in self._makers if self.changed_externally(path)]
+
+    def merge(self, path, current, key):
+        """
+        Relit un fichier modifié et le fusionne dans les enregistrements en mémoire
+        (voir `merge_records`), puis retient cette version comme connue.
+
+        Args:
+            path (str): Fichier modifié.
+            current (list): Enregistrements en mémoire correspondants.
+            key (str): Clé de la liste dans le fichier ("clubs" ou "competitions").
+
+        Returns:
+            list: Nouvelle liste d'enregistrements.
+        """
+        signature = file_signature(path)
+        with self._lock:
+            baseline = self._baselines.get(path, {})
+        merged, seen = merge_records(current, baseline, iter_records(path, key), self._makers[path])
+        with self._lock:
+            self._baselines[path] = seen
+            self._signatures[path] = signature
+        return merged
+
+    def start(self, interval, on_change):
+        """
+        Lance la vérification périodique dans un thread démon.
+
+        Args:
+            interval (float): Délai entre deux vérifications (secondes).
+            on_change (callable): Appelé avec la liste des fichiers modifiés.
+        """
+        self._thread = threading.Thread(target=self._run, args=(interval, on_change), name="data-reload", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arrête la vérification périodique."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, interval, on_change):
+        """Boucle de vérification : une série de `os.stat` par période, relecture seulement si besoin."""
+        while not self._stop.wait(interval):
+            paths = self.changes()
+            if paths:
+                try:
+                    on_change(paths)
+                except Exception:  # un fichier en cours d'édition ne doit pas arrêter la surveillance
+                    continue
@@ -1,71 +1,771 @@
+import atexit
 import json
+import os
+import queue
+import uuid
+import zlib
+from contextlib import contextmanager, nullcontext
+from math import ceil
+import click
 from flask import Flask, render_template, request, redirect, flash, url_for
-from datetime import datetime
+from flask import g, get_flashed_messages, get_template_attribute, session, stream_template
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import escape
+from datetime import datetime, timezone
 
+from admission import ConcurrencyLimiter, RateLimiter
+from booking_queue import BookingQueue, QueueTimeout
+from cache import VersionedCache
+from holds import SeatHolds
+from json_stream import iter_records
+from ledger import MAX_PLACES_PER_COMPETITION
+from locks import StripedLocks
+from metrics import Metrics
+from models import Club, Competition, competition_date
+from profiling import PROFILE_HEADER, RequestProfiler, hotspot_report
+from registry import Registry
+from reloader import DataWatcher
+from shared_state import SharedCounters
+from storage import BookingConflict, create_storage
 
-def loadClubs():
+
+def updateData():
     """
-    Charge la liste des clubs depuis le fichier JSON 'clubs.json'.
+    Sauvegarde l'état complet des clubs et compétitions via le backend de stockage.
 
-    Returns:
-        list: Liste des clubs sous forme de dictionnaires.
+    Note:
+        Si l'application est en mode TESTING (app.config["TESTING"] == True),
+        rien n'est écrit.
     """
-    with open("clubs.json") as c:
-        listOfClubs = json.load(c)["clubs"]
-        return listOfClubs
+    if app.config.get("TESTING"):
+        return
+
+    with timed("persistence"):
+        storage.save(clubs, competitions)
 
 
-def loadCompetitions():
+def recordBooking(club, competition, places):
     """
-    Charge la liste des compétitions depuis le fichier JSON 'competitions.json'.
+    Persiste une réservation qui vient d'être appliquée en mémoire.
 
-    Returns:
-        list: Liste des compétitions sous forme de dictionnaires.
+    Le backend décide de la forme de l'écriture : réécriture des fichiers JSON,
+    ajout d'une ligne au journal ou transaction SQLite sur deux lignes.
+
+    Args:
+        club (Club): Club ayant réservé.
+        competition (Competition): Compétition concernée.
+        places (int): Nombre de places réservées.
+
+    Note:
+        En mode TESTING, rien n'est écrit.
     """
-    with open("competitions.json") as comps:
-        listOfCompetitions = json.load(comps)["competitions"]
-        return listOfCompetitions
+    if app.config.get("TESTING"):
+        return
 
+    with timed("persistence"):
+        storage.record_booking(clubs, competitions, club, competition, places)
 
-def updateData():
+
+def recordBookings(club, bookings):
     """
-    Sauvegarde les données de clubs et compétitions dans leurs fichiers JSON.
+    Persiste en une seule écriture un lot de réservations qui vient d'être appliqué en mémoire.
 
-    Cette fonction :
-        - Convertit les points des clubs et le nombre de places des compétitions
-          en entiers pour garantir la cohérence.
-        - Écrit les données normalisées dans leurs fichiers JSON respectifs.
+    Args:
+        club (Club): Club ayant réservé.
+        bookings (list): Couples (compétition, places réservées).
 
     Note:
-        Si l'application est en mode TESTING (app.config["TESTING"] == True),
-        les fichiers JSON ne sont pas modifiés.
+        En mode TESTING, rien n'est écrit.
     """
     if app.config.get("TESTING"):
         return
 
-    # Normalisation des points des clubs
-    for club in clubs:
-        club["points"] = int(club["points"])
+    with timed("persistence"):
+        storage.record_bookings(clubs, competitions, club, bookings)
 
-    # Normalisation du nombre de places des compétitions
-    for competition in competitions:
-        competition["numberOfPlaces"] = int(competition["numberOfPlaces"])
 
-    # Écriture dans les fichiers JSON
-    with open("clubs.json", "w") as c:
-        json.dump({"clubs": clubs}, c, indent=4)
+def recordBatches(batches):
+    """
+    Persiste en une seule écriture les lots de réservations de plusieurs clubs
+    (file de réservations, voir `process_bookings`).
+
+    Args:
+        batches (list): Couples (club, liste de couples (compétition, places)).
+
+    Returns:
+        list: Pour chaque lot, None ou le `BookingConflict` qui l'a refusé.
+
+    Note:
+        En mode TESTING, rien n'est écrit.
+    """
+    if app.config.get("TESTING"):
+        return [None] * len(batches)
+
+    with timed("persistence"):
+        return storage.record_batches(clubs, competitions, batches)
+
+
+def places_left(club, competition):
+    """
+    Places de la compétition encore réservables par le club : places restantes,
+    moins celles retenues par les autres clubs (BOOKING_HOLD_TTL).
+    """
+    places = int(competition["numberOfPlaces"])
+    if seat_holds is not None:
+        places -= seat_holds.held(competition["name"], exclude=club["name"])
+    return places
+
+
+def validate_booking(club, competition, places_required):
+    """
+    Vérifie les règles métier d'une réservation.
+
+    La limite de places par compétition porte sur le total du club, réservations
+    précédentes comprises (registre `ledger`, consulté en temps constant). Les
+    places retenues par d'autres clubs ne sont pas disponibles.
+
+    Args:
+        club (Club): Club qui réserve.
+        competition (Competition): Compétition visée.
+        places_required (int): Nombre de places demandées.
+
+    Returns:
+        str | None: Message de la première règle non respectée, ou None si tout est valide.
+    """
+    # Liste de validations avec message et condition
+    validations = [
+        ("You cannot book a place on a past competition.", competition_date(competition) < datetime.now()),
+        ("Number of places must be greater than zero.", places_required <= 0),
+        ("Not enough places left in this competition.", places_required > places_left(club, competition)),
+        ("You do not have enough points to book these places.", places_required > int(club["points"])),
+        (
+            f"Cannot book more than {MAX_PLACES_PER_COMPETITION} places per competition.",
+            places_required + ledger.booked(club["name"], competition["name"]) > MAX_PLACES_PER_COMPETITION,
+        ),
+    ]
+
+    # Vérification de chaque condition
+    for message, condition in validations:
+        if condition:
+            return message
+    return None
+
+
+def book_places(club, competition, places_required):
+    """
+    Réserve des places de façon atomique (vérification puis décrément).
+
+    La vérification, la persistance et la mise à jour en mémoire se font sous les
+    verrous du club et de la compétition : deux requêtes concurrentes ne peuvent
+    pas valider toutes les deux sur les mêmes compteurs. Avec le backend SQLite,
+    la base refait la vérification dans sa transaction, ce qui protège aussi contre
+    les autres processus ; en cas de conflit, les compteurs en mémoire sont
+    réalignés sur la base.
+
+    En mode multi-processus (SHARED_STATE_FILE), la réservation se fait sous le
+    verrou de l'état partagé, sur des compteurs resynchronisés, puis est publiée
+    aux autres workers.
+
+    Si BOOKING_QUEUE est activé, la réservation est confiée au thread d'écriture
+    unique (voir `process_bookings`) au lieu d'être faite dans le thread de la requête.
+
+    Args:
+        club (Club): Club qui réserve.
+        competition (Competition): Compétition visée.
+        places_required (int): Nombre de places demandées.
+
+    Returns:
+        str | None: Message d'erreur, ou None si la réservation est effectuée.
+    """
+    if booking_queue is not None:
+        return submit_booking(club, [(competition, places_required)], batch=False)
+
+    shared_lock = shared.locked() if shared is not None else nullcontext()
+    with booking_locks.holding(("club", club["name"]), ("competition", competition["name"])), shared_lock:
+        with timed("validation"):
+            error = validate_booking(club, competition, places_required)
+        if error:
+            return error
+
+        # Mise à jour des données si validation réussie
+        competition["numberOfPlaces"] = int(competition["numberOfPlaces"]) - places_required
+        club["points"] = int(club["points"]) - places_required
+        ledger.add(club["name"], competition["name"], places_required)
+
+        try:
+            recordBooking(club, competition, places_required)
+        except BookingConflict as conflict:
+            club["points"] = conflict.points
+            competition["numberOfPlaces"] = conflict.places
+            realign_ledger(club, competition, places_required, conflict)
+            get_registry().touch(club=club, competition=competition)
+            return "Booking could not be completed, please try again."
+
+        publish_bookings(club, [(competition, places_required)])
+    return None
+
+
+def validate_bookings(club, bookings):
+    """
+    Vérifie les règles métier sur un lot de réservations d'un club.
+
+    Chaque réservation est vérifiée comme une réservation isolée (voir
+    `validate_booking`), puis le total des places est comparé aux points du club.
+
+    Args:
+        club (Club): Club qui réserve.
+        bookings (list): Couples (compétition, places), une compétition au plus une fois.
+
+    Returns:
+        str | None: Message de la première règle non respectée, ou None si tout le lot est valide.
+    """
+    if not bookings:
+        return "No places requested."
+    for competition, places_required in bookings:
+        error = validate_booking(club, competition, places_required)
+        if error:
+            return f"{competition['name']}: {error}"
+    if sum(places for _, places in bookings) > int(club["points"]):
+        return "You do not have enough points to book these places."
+    return None
+
+
+def book_many(club, bookings):
+    """
+    Réserve un lot de places pour un club, en tout ou rien.
+
+    Le lot est vérifié puis appliqué sous les verrous du club et de toutes les
+    compétitions concernées (et de l'état partagé en mode multi-processus), avec
+    une seule écriture du backend de stockage pour tout le lot. Si une réservation
+    du lot est refusée, aucune n'est appliquée. Avec BOOKING_QUEUE, le lot passe
+    par la file à écrivain unique.
+
+    Args:
+        club (Club): Club qui réserve.
+        bookings (list): Couples (compétition, places), une compétition au plus une fois.
+
+    Returns:
+        str | None: Message d'erreur, ou None si tout le lot est réservé.
+    """
+    if booking_queue is not None:
+        return submit_booking(club, bookings, batch=True)
+
+    keys = [("club", club["name"])] + [("competition", competition["name"]) for competition, _ in bookings]
+    shared_lock = shared.locked() if shared is not None else nullcontext()
+    with booking_locks.holding(*keys), shared_lock:
+        with timed("validation"):
+            error = validate_bookings(club, bookings)
+        if error:
+            return error
+
+        apply_bookings(club, bookings)
+        try:
+            recordBookings(club, bookings)
+        except BookingConflict as conflict:
+            realign_bookings(club, bookings, conflict)
+            return "Booking could not be completed, please try again."
+
+        publish_bookings(club, bookings)
+    return None
 
-    with open("competitions.json", "w") as comps:
-        json.dump({"competitions": competitions}, comps, indent=4)
+
+def apply_bookings(club, bookings):
+    """
+    Décrémente en mémoire les places des compétitions et les points du club d'un lot
+    validé, et ajoute les places au registre des réservations.
+    """
+    for competition, places_required in bookings:
+        competition["numberOfPlaces"] = int(competition["numberOfPlaces"]) - places_required
+        ledger.add(club["name"], competition["name"], places_required)
+    club["points"] = int(club["points"]) - sum(places for _, places in bookings)
+
+
+def realign_bookings(club, bookings, conflict):
+    """Réaligne les compteurs d'un lot refusé par le stockage sur les valeurs du conflit et l'annule du registre."""
+    club["points"] = conflict.points
+    for competition, places_required in bookings:
+        competition["numberOfPlaces"] = conflict.places[competition["name"]]
+        realign_ledger(club, competition, places_required, conflict)
+        get_registry().touch(club=club, competition=competition)
+
+
+def realign_ledger(club, competition, places_required, conflict):
+    """
+    Annule du registre une réservation refusée par le stockage.
+
+    Si le stockage fournit ses totaux (`BookingConflict.booked`), la ligne du
+    registre est réalignée dessus : les réservations d'autres processus deviennent
+    visibles pour la vérification de la limite de places.
+    """
+    if conflict.booked is None:
+        ledger.add(club["name"], competition["name"], -places_required)
+    else:
+        booked = conflict.booked[competition["name"]]
+        ledger.add(club["name"], competition["name"], booked - ledger.booked(club["name"], competition["name"]))
+
+
+def publish_bookings(club, bookings):
+    """
+    Publie un lot enregistré : état partagé entre workers et versions du registre.
+    Les places retenues par le club sur ces compétitions sont converties en réservation.
+    """
+    for competition, _ in bookings:
+        if shared is not None:
+            shared.store(club, competition)
+        if seat_holds is not None:
+            seat_holds.convert(club["name"], competition["name"])
+        get_registry().touch(club=club, competition=competition)
+
+
+def submit_booking(club, bookings, batch):
+    """
+    Confie une réservation (ou un lot) à la file à écrivain unique et attend son résultat.
+
+    Args:
+        club (Club): Club qui réserve.
+        bookings (list): Couples (compétition, places).
+        batch (bool): Lot de `purchaseBatch` (règles de `validate_bookings`) plutôt
+            qu'une réservation isolée (règles de `validate_booking`).
+
+    Returns:
+        str | None: Message d'erreur, ou None si la réservation est effectuée.
+    """
+    try:
+        return booking_queue.submit((club, bookings, batch)).result()
+    except (queue.Full, QueueTimeout):
+        return "Too many bookings in progress, please try again."
+
+
+def process_bookings(commands):
+    """
+    Traite une série de commandes de réservation (thread d'écriture de la file).
+
+    Seul le thread d'écriture modifie les compteurs : les commandes sont
+    vérifiées et appliquées en mémoire l'une après l'autre, sans verrou par
+    club ou compétition, puis toutes les réservations acceptées sont persistées
+    en une seule écriture (`recordBatches`).
+
+    Args:
+        commands (list): Triplets (club, liste de couples (compétition, places), lot ?).
+
+    Returns:
+        list: Pour chaque commande, message d'erreur ou None.
+    """
+    shared_lock = shared.locked() if shared is not None else nullcontext()
+    # Tous les verrous : sans concurrence entre réservations, seul un rechargement peut attendre
+    with booking_locks.holding_all(), shared_lock:
+        results = []
+        accepted = []
+        for index, (club, bookings, batch) in enumerate(commands):
+            with timed("validation"):
+                error = validate_bookings(club, bookings) if batch else validate_booking(club, *bookings[0])
+            results.append(error)
+            if error is None:
+                apply_bookings(club, bookings)
+                accepted.append(index)
+
+        conflicts = recordBatches([commands[index][:2] for index in accepted])
+        for index, conflict in zip(accepted, conflicts):
+            club, bookings, _ = commands[index]
+            if conflict is not None:
+                realign_bookings(club, bookings, conflict)
+                results[index] = "Booking could not be completed, please try again."
+            else:
+                publish_bookings(club, bookings)
+    return results
 
 
 # Création de l'application Flask
 app = Flask(__name__)
 app.secret_key = "something_special"  # Clé secrète pour les sessions et flash messages
 
+# Configuration par défaut, surchargeable par des variables d'environnement GUDLFT_*
+app.config.from_mapping(
+    STORAGE_BACKEND="json",  # "json", "journal" ou "sqlite"
+    CLUBS_FILE="clubs.json",
+    COMPETITIONS_FILE="competitions.json",
+    JOURNAL_FILE="bookings.journal",
+    JOURNAL_COMPACT_THRESHOLD=1024 * 1024,  # taille (octets) déclenchant une compaction
+    JOURNAL_FSYNC=False,
+    JSON_DURABILITY="write",  # "write", "fsync" ou "group" (écriture différée groupée)
+    GROUP_COMMIT_WINDOW=0.05,  # fenêtre de regroupement des écritures (secondes)
+    SQLITE_DATABASE="gudlft.sqlite3",
+    SNAPSHOT_FILE=None,  # instantané binaire écrit avec les fichiers JSON, lu au démarrage (désactivé si None)
+    LEDGER_FILE="bookings.json",  # places réservées par club et par compétition (backends json et journal)
+    RELOAD_INTERVAL=0,  # vérification des fichiers JSON modifiés toutes les N secondes (0 : désactivée)
+    SHARED_STATE_FILE=None,  # fichier mappé en mémoire partagé entre workers (désactivé si None)
+    SHARED_LEDGER_CAPACITY=65536,  # couples (club, compétition) réservés au plus dans l'état partagé
+    COMPETITIONS_PAGE_SIZE=50,  # compétitions par page sur 'welcome.html' et '/api/competitions' (0 : toutes)
+    STREAM_TEMPLATES=False,  # envoie 'welcome.html' au fil du rendu
+    POINTS_PAGE_SIZE=0,  # clubs par page sur '/points' (0 : tous)
+    BOOKING_QUEUE=False,  # réservations appliquées par un thread d'écriture unique
+    BOOKING_QUEUE_MAX_BATCH=64,  # commandes traitées (et persistées) ensemble au plus
+    BOOKING_QUEUE_MAX_PENDING=1024,  # commandes en attente au plus (0 : illimité)
+    BOOKING_QUEUE_TIMEOUT=5.0,  # attente maximale dans la file (secondes)
+    METRICS=False,  # mesures par route et par étape, exposées sur '/metrics'
+    PROFILE_SAMPLE_RATE=0.0,  # proportion de requêtes profilées avec cProfile (0 : aucune)
+    PROFILE_TOKEN=None,  # jeton de l'en-tête X-Gudlft-Profile demandant le profilage d'une requête
+    PROFILE_DIR="profiles",  # dossier des profils, un sous-dossier par route
+    PROFILE_KEEP=20,  # profils conservés par route
+    FRAGMENT_CACHE_SIZE=4096,  # éléments de la liste des compétitions gardés rendus (0 : aucun)
+    TEMPLATE_CACHE_DIR=None,  # dossier des gabarits compilés, partagé entre workers (désactivé si None)
+    BOOKING_RATE=0,  # réservations par seconde et par club (0 : illimité)
+    BOOKING_BURST=5,  # réservations enchaînées par un club avant limitation
+    BOOKING_CONCURRENCY=0,  # réservations en cours au plus (0 : illimité)
+    BOOKING_RETRY_AFTER=1,  # délai (secondes) conseillé aux réservations refusées pour surcharge
+    BOOKING_HOLD_TTL=0,  # durée (secondes) des places retenues à l'ouverture de 'booking.html' (0 : aucune retenue)
+    BOOKING_HOLD_PLACES=1,  # places retenues par défaut (paramètre 'places' de la page de réservation)
+)
+app.config.from_prefixed_env("GUDLFT")
+
+if app.config["TEMPLATE_CACHE_DIR"]:
+    # Les gabarits compilés sont relus depuis le disque : un nouveau worker ne recompile pas templates/*.html
+    os.makedirs(app.config["TEMPLATE_CACHE_DIR"], exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(app.config["TEMPLATE_CACHE_DIR"])
+
 # Chargement initial des données
-competitions = loadCompetitions()
-clubs = loadClubs()
+storage = create_storage(app.config)
+clubs, competitions = storage.load()
+# Places réservées au total par club et par compétition, persistées par le backend
+ledger = storage.load_ledger()
+registry = Registry(clubs, competitions)
+booking_locks = StripedLocks()
+# Pages rendues et calculs dérivés des données, valables pour une version du registre
+response_cache = VersionedCache()
+# Éléments HTML de la liste des compétitions de 'welcome.html' (voir `competition_items`)
+fragment_cache = VersionedCache(maxsize=app.config["FRAGMENT_CACHE_SIZE"])
+# Identifiant propre à ce processus, préfixe des ETags : les numéros de version repartent
+# de zéro à chaque démarrage et diffèrent d'un worker à l'autre.
+instance_id = uuid.uuid4().hex[:12]
+started_at = datetime.now(timezone.utc).replace(microsecond=0)
+shared = (
+    SharedCounters(
+        app.config["SHARED_STATE_FILE"],
+        clubs,
+        competitions,
+        on_change=registry.touch,
+        ledger=ledger,
+        ledger_capacity=app.config["SHARED_LEDGER_CAPACITY"],
+    )
+    if app.config["SHARED_STATE_FILE"]
+    else None
+)
+
+
+@contextmanager
+def bookings_suspended():
+    """
+    Suspend les réservations de ce processus (tous les verrous) et, avec
+    SHARED_STATE_FILE, celles des autres workers, l'état partagé étant à jour.
+    """
+    with booking_locks.holding_all(), shared.locked() if shared is not None else nullcontext():
+        yield
+
+
+if hasattr(storage, "copy_guard"):
+    # Les écritures différées copient un état où aucune réservation n'est en cours
+    storage.copy_guard = bookings_suspended
+data_watcher = None
+if app.config["RELOAD_INTERVAL"]:
+    if app.config["STORAGE_BACKEND"] != "json" or shared is not None:
+        raise ValueError("RELOAD_INTERVAL requires the json storage backend without SHARED_STATE_FILE")
+    watched_files = {
+        app.config["CLUBS_FILE"]: (clubs, Club.from_dict),
+        app.config["COMPETITIONS_FILE"]: (competitions, Competition.from_dict),
+    }
+    if app.config["LEDGER_FILE"]:
+        # Registre relu entièrement s'il est modifié (ex. remis à zéro entre deux tests de charge)
+        watched_files[app.config["LEDGER_FILE"]] = ([], None)
+    data_watcher = DataWatcher(watched_files)
+    storage.watcher = data_watcher
+booking_queue = (
+    BookingQueue(
+        process_bookings,
+        max_batch=app.config["BOOKING_QUEUE_MAX_BATCH"],
+        max_pending=app.config["BOOKING_QUEUE_MAX_PENDING"],
+        timeout=app.config["BOOKING_QUEUE_TIMEOUT"],
+    )
+    if app.config["BOOKING_QUEUE"]
+    else None
+)
+if booking_queue is not None:
+    # Enregistré après le backend : la file est vidée avant la dernière écriture différée
+    atexit.register(booking_queue.close)
+booking_rate_limiter = (
+    RateLimiter(float(app.config["BOOKING_RATE"]), int(app.config["BOOKING_BURST"]))
+    if app.config["BOOKING_RATE"]
+    else None
+)
+booking_slots = ConcurrencyLimiter(app.config["BOOKING_CONCURRENCY"]) if app.config["BOOKING_CONCURRENCY"] else None
+# Places retenues entre l'ouverture de la page de réservation et l'achat
+seat_holds = SeatHolds(float(app.config["BOOKING_HOLD_TTL"])) if app.config["BOOKING_HOLD_TTL"] else None
+metrics = Metrics() if app.config["METRICS"] else None
+profiler = (
+    RequestProfiler(
+        app.config["PROFILE_DIR"],
+        sample_rate=float(app.config["PROFILE_SAMPLE_RATE"]),
+        token=app.config["PROFILE_TOKEN"],
+        keep=app.config["PROFILE_KEEP"],
+    )
+    if app.config["PROFILE_SAMPLE_RATE"] or app.config["PROFILE_TOKEN"]
+    else None
+)
+
+
+def timed(phase):
+    """
+    Chronomètre une étape de la requête en cours (voir `Metrics.phase`).
+
+    Args:
+        phase (str): Nom de l'étape ("lookup", "validation", "persistence" ou "rendering").
+
+    Returns:
+        Gestionnaire de contexte ; sans effet si METRICS est désactivé.
+    """
+    return metrics.phase(phase) if metrics is not None else nullcontext()
+
+
+@app.before_request
+def refresh_shared_state():
+    """
+    En mode multi-processus, reprend les compteurs modifiés par les autres workers
+    avant de traiter la requête (aucune lecture si rien n'a changé).
+    """
+    if shared is not None:
+        shared.refresh()
+
+
+@app.before_request
+def start_request_timer():
+    """Commence la mesure de la requête (METRICS)."""
+    if metrics is not None:
+        metrics.start_request(request.endpoint or "unmatched")
+
+
+@app.after_request
+def record_request_metrics(response):
+    """Enregistre la durée et le statut de la requête (METRICS)."""
+    if metrics is not None:
+        metrics.end_request(response.status_code)
+    return response
+
+
+@app.before_request
+def start_profiling():
+    """Profile la requête si elle est tirée au sort ou demandée par l'en-tête X-Gudlft-Profile."""
+    if profiler is not None:
+        g.profile = profiler.start(request.headers.get(PROFILE_HEADER))
+
+
+@app.teardown_request
+def finish_profiling(exception=None):
+    """Écrit le profil de la requête, s'il y en a un, dans le dossier de sa route."""
+    profile = g.pop("profile", None)
+    if profile is not None:
+        profiler.finish(profile, request.endpoint or "unmatched")
+
+
+@app.cli.command("profile-report")
+@click.option("--top", default=20, show_default=True, help="Functions listed per route.")
+@click.option("--sort", type=click.Choice(["tottime", "cumtime"]), default="tottime", show_default=True)
+@click.option("--route", "routes", multiple=True, help="Only this route (repeatable).")
+def profile_report(top, sort, routes):
+    """Aggregate the request profiles in PROFILE_DIR into a hotspot report per route."""
+    click.echo(hotspot_report(app.config["PROFILE_DIR"], top=top, sort=sort, routes=routes))
+
+
+def reload_data(paths):
+    """
+    Fusionne dans les données en mémoire les fichiers JSON modifiés par un tiers.
+
+    Appelée par le thread de surveillance (RELOAD_INTERVAL). Les nouvelles versions
+    des fichiers sont fusionnées à trois voies (voir `reloader.merge_records`) :
+    les réservations faites depuis la dernière écriture sont conservées. Les
+    nouvelles listes remplacent ensuite les anciennes d'un seul coup, et le
+    registre est reconstruit dessus ; les requêtes en cours gardent une vue
+    cohérente (ancienne ou nouvelle).
+
+    Un LEDGER_FILE modifié remplace entièrement les places réservées en mémoire.
+
+    Les réservations sont suspendues pendant la fusion ; les lectures ne le sont pas.
+
+    Args:
+        paths (list): Fichiers modifiés (CLUBS_FILE, COMPETITIONS_FILE et/ou LEDGER_FILE).
+    """
+    global clubs, competitions
+
+    with booking_locks.holding_all():
+        new_clubs, new_competitions = clubs, competitions
+        if app.config["CLUBS_FILE"] in paths:
+            new_clubs = data_watcher.merge(app.config["CLUBS_FILE"], clubs, "clubs")
+        if app.config["COMPETITIONS_FILE"] in paths:
+            new_competitions = data_watcher.merge(app.config["COMPETITIONS_FILE"], competitions, "competitions")
+        if app.config["LEDGER_FILE"] in paths:
+            ledger.replace(iter_records(app.config["LEDGER_FILE"], "bookings"))
+            data_watcher.seen(app.config["LEDGER_FILE"], [])
+        clubs, competitions = new_clubs, new_competitions
+        registry.reload(clubs, competitions)
+        # Réécrit l'état fusionné : réservations éventuellement non écrites pendant la modification
+        updateData()
+
+
+if data_watcher is not None:
+    data_watcher.start(app.config["RELOAD_INTERVAL"], reload_data)
+
+
+def get_registry():
+    """
+    Retourne le registre indexé des clubs et compétitions.
+
+    Les listes `clubs` et `competitions` du module restent la référence : si
+    elles ont été réassignées (rechargement, tests), le registre est reconstruit
+    sur les nouvelles listes avant d'être utilisé.
+
+    Returns:
+        Registry: Registre à jour.
+    """
+    if registry.clubs is not clubs or registry.competitions is not competitions:
+        registry.reload(clubs, competitions)
+    return registry
+
+
+def competitions_for_view(data):
+    """
+    Sélectionne la page de compétitions à afficher sur 'welcome.html'.
+
+    Paramètres de la requête :
+        - view : "upcoming" (défaut, compétitions à venir), "past" ou "all" ;
+        - days : restreint aux compétitions des N prochains jours ;
+        - after : curseur de la page précédente (un curseur invalide ramène à la première page).
+
+    La taille des pages est fixée par COMPETITIONS_PAGE_SIZE (0 : pas de pagination).
+    Les vues et la pagination s'appuient sur l'index trié par date du registre.
+
+    Args:
+        data (Registry): Registre des données.
+
+    Returns:
+        dict: Variables de gabarit `competitions`, `view`, `days` et `next_cursor`.
+    """
+    view = request.values.get("view", "upcoming")
+    if view not in ("upcoming", "past", "all"):
+        view = "upcoming"
+    days = request.values.get("days", type=int)
+    limit = app.config["COMPETITIONS_PAGE_SIZE"] or None
+
+    try:
+        shown, next_cursor = data.competitions_page(view, days=days, after=request.values.get("after"), limit=limit)
+    except ValueError:
+        shown, next_cursor = data.competitions_page(view, days=days, limit=limit)
+    return {"competitions": shown, "view": view, "days": days, "next_cursor": next_cursor}
+
+
+# Nom de club provisoire des éléments mis en cache, tel qu'il apparaît dans l'URL de réservation
+CLUB_PLACEHOLDER = "\x00"
+QUOTED_CLUB_PLACEHOLDER = "%00"
+
+
+def competition_items(club, competitions):
+    """
+    Éléments HTML (<li>) de la liste des compétitions de 'welcome.html'.
+
+    Un élément ne dépend que de la compétition (nom, date, places, et donc
+    possibilité de réserver) et du nom du club dans le lien « Book Places ». Il est
+    rendu une fois avec un nom de club provisoire puis mis en cache, avec pour clé
+    les valeurs affichées : après une réservation, seul l'élément de la compétition
+    réservée est rendu à nouveau. Le lien est complété pour chaque club au moment
+    de l'assemblage.
+
+    Les éléments sont produits à la demande : en mode STREAM_TEMPLATES, chacun est
+    rendu au moment où le gabarit l'envoie, et non tous avant le premier octet.
+
+    Args:
+        club (Club): Club connecté.
+        competitions (list): Compétitions affichées.
+
+    Yields:
+        Markup: Éléments HTML, dans l'ordre des compétitions.
+    """
+    render_item = get_template_attribute("competition_item.html", "competition_item")
+    # Nom du club encodé comme dans l'URL de réservation (même encodage que `url_for`)
+    club_url = url_for("book", competition=CLUB_PLACEHOLDER, club=club["name"])
+    club_segment = escape(club_url.partition(f"/{QUOTED_CLUB_PLACEHOLDER}/")[2])
+
+    def render(competition):
+        html = render_item(competition, CLUB_PLACEHOLDER)
+        if int(competition["numberOfPlaces"]) <= 0:
+            return html, None
+        # Le lien est le dernier élément du <li> : le nom affiché plus haut n'est pas concerné
+        before, _, after = html.rpartition(QUOTED_CLUB_PLACEHOLDER)
+        return before, after
+
+    for competition in competitions:
+        key = (competition["name"], str(competition_date(competition)), int(competition["numberOfPlaces"]))
+        before, after = fragment_cache.get_or_compute(key, None, lambda: render(competition))
+        yield before if after is None else before + club_segment + after
+
+
+def render_welcome(club, data):
+    """
+    Affiche la page 'welcome.html' pour un club, avec la page de compétitions demandée.
+
+    Si STREAM_TEMPLATES est activé, la page est envoyée au fil du rendu
+    (`stream_template`) : les premiers octets partent avant que toute la liste
+    ne soit rendue.
+
+    Args:
+        club (Club): Club connecté.
+        data (Registry): Registre des données.
+    """
+    with timed("rendering"):
+        context = competitions_for_view(data)
+        if app.config["FRAGMENT_CACHE_SIZE"]:
+            context["competition_items"] = competition_items(club, context["competitions"])
+        if app.config["STREAM_TEMPLATES"]:
+            # Les messages flash sont lus avant l'envoi des en-têtes : la session (cookie)
+            # est enregistrée avant le corps de la réponse et ne doit plus les contenir.
+            get_flashed_messages()
+            return app.response_class(stream_template("welcome.html", club=club, **context))
+        return render_template("welcome.html", club=club, **context)
+
+
+def conditional_response(etag, last_modified, render, private=False):
+    """
+    Réponse HTTP conditionnelle pour une route GET.
+
+    Si le client présente un validateur encore valable (If-None-Match, ou à défaut
+    If-Modified-Since), répond 304 sans appeler `render`. Sinon, rend la page et
+    ajoute ETag, Last-Modified et Cache-Control (revalidation obligatoire).
+
+    Args:
+        etag (str): ETag fort de la représentation.
+        last_modified (datetime | None): Date de dernière modification (UTC).
+        render (callable): Fonction sans argument produisant le corps de la réponse.
+        private (bool): Réponse propre au client (non stockable par un proxy partagé).
+
+    Returns:
+        Response: Réponse 304 ou 200.
+    """
+    if request.if_none_match:
+        fresh = request.if_none_match.contains(etag)
+    else:
+        fresh = last_modified is not None and request.if_modified_since is not None
+        fresh = fresh and last_modified <= request.if_modified_since
+
+    if fresh:
+        response = app.response_class(status=304)
+    else:
+        with timed("rendering"):
+            response = app.make_response(render())
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.cache_control.no_cache = True
+    if private:
+        response.cache_control.private = True
+    else:
+        response.cache_control.public = True
+    return response
 
 
 @app.route("/")
@@ -73,9 +773,15 @@ def index():
     """
     Page d'accueil du site.
 
-    Affiche le formulaire de connexion par email pour le secrétaire.
+    Affiche le formulaire de connexion par email pour le secrétaire. La page ne
+    dépend pas des données : elle est revalidée par ETag, sauf si des messages
+    flash sont en attente (la page n'est alors pas mise en cache).
     """
-    return render_template("index.html")
+    if "_flashes" in session:
+        response = app.make_response(render_template("index.html"))
+        response.cache_control.no_store = True
+        return response
+    return conditional_response(f"{instance_id}-index", started_at, lambda: render_template("index.html"))
 
 
 @app.route("/showSummary", methods=["POST"])
@@ -85,22 +791,24 @@ def showSummary():
 
     Processus :
         1. Récupère l'email depuis le formulaire POST.
-        2. Cherche le club correspondant dans la liste `clubs`.
+        2. Cherche le club correspondant via l'index par email du registre.
         3. Si aucun club n'est trouvé, redirige vers la page d'accueil avec un message flash.
-        4. Sinon, affiche la page 'welcome.html' avec les informations du club et les compétitions.
+        4. Sinon, affiche la page 'welcome.html' avec les informations du club et les
+           compétitions (à venir par défaut, voir `competitions_for_view`).
 
     Flash messages :
         - "Sorry, that email wasn't found." si email non reconnu.
     """
     email = request.form["email"]
-    matching_clubs = [club for club in clubs if club["email"] == email]
+    data = get_registry()
+    with timed("lookup"):
+        club = data.club_by_email(email)
 
-    if not matching_clubs:
+    if club is None:
         flash("Sorry, that email wasn't found.")
         return redirect(url_for("index"))
 
-    club = matching_clubs[0]
-    return render_template("welcome.html", club=club, competitions=competitions)
+    return render_welcome(club, data)
 
 
 @app.route("/book/<competition>/<club>")
@@ -113,16 +821,163 @@ def book(competition, club):
         club (str): Nom du club
 
     Returns:
-        render_template: Page 'booking.html' si club et compétition trouvés,
-                         sinon retour à 'welcome.html' avec un message flash.
+        render_template: Page 'booking.html' si club et compétition trouvés ;
+                         sinon, avec un message flash, retour à 'welcome.html'
+                         (club connu) ou à l'accueil (club inconnu).
+
+    L'ETag dépend uniquement des versions du club et de la compétition : une
+    réservation sur d'autres enregistrements ne force pas le rechargement de la page.
+
+    Avec BOOKING_HOLD_TTL, chaque ouverture de la page retient des places pour le
+    club (voir `hold_places`) ; la page, propre à la retenue, n'est alors pas mise en cache.
     """
-    foundClub = [c for c in clubs if c["name"] == club][0]
-    foundCompetition = [c for c in competitions if c["name"] == competition][0]
+    data = get_registry()
+    with timed("lookup"):
+        foundClub = data.club_by_name(club)
+        foundCompetition = data.competition_by_name(competition)
+    if foundClub and foundCompetition and seat_holds is not None:
+        held, ttl = hold_places(foundClub, foundCompetition, request.args.get("places", type=int))
+        return render_template(
+            "booking.html",
+            club=foundClub,
+            competition=foundCompetition,
+            booked=ledger.booked(foundClub["name"], foundCompetition["name"]),
+            max_places=MAX_PLACES_PER_COMPETITION,
+            available=places_left(foundClub, foundCompetition),
+            held=held,
+            hold_ttl=ceil(ttl),
+        )
     if foundClub and foundCompetition:
-        return render_template("booking.html", club=foundClub, competition=foundCompetition)
+        club_stamp = data.record_stamp("club", foundClub["name"])
+        competition_stamp = data.record_stamp("competition", foundCompetition["name"])
+        return conditional_response(
+            f"{instance_id}-{club_stamp[0]}-{competition_stamp[0]}",
+            max(club_stamp, competition_stamp)[1],
+            lambda: render_template(
+                "booking.html",
+                club=foundClub,
+                competition=foundCompetition,
+                booked=ledger.booked(foundClub["name"], foundCompetition["name"]),
+                max_places=MAX_PLACES_PER_COMPETITION,
+            ),
+            private=True,
+        )
     else:
         flash("Something went wrong-please try again")
-        return render_template("welcome.html", club=club, competitions=competitions)
+        if foundClub is None:
+            return redirect(url_for("index"))
+        return render_welcome(foundClub, data)
+
+
+def hold_places(club, competition, places=None):
+    """
+    Retient des places pour un club sur une compétition pendant BOOKING_HOLD_TTL secondes.
+
+    Le nombre de places retenues est borné par les places non retenues par les
+    autres clubs, les points du club et ce qui lui reste sous la limite par
+    compétition. La retenue est prise sous les verrous du club et de la
+    compétition, comme une réservation : elle ne peut pas porter sur des places
+    en cours de réservation par une autre requête.
+
+    Args:
+        club (Club): Club qui réserve.
+        competition (Competition): Compétition visée.
+        places (int, optional): Places souhaitées (BOOKING_HOLD_PLACES par défaut).
+
+    Returns:
+        tuple: (places retenues, secondes avant échéance) ; (0, 0) si rien n'est retenu.
+    """
+    places = places if places is not None else int(app.config["BOOKING_HOLD_PLACES"])
+    with booking_locks.holding(("club", club["name"]), ("competition", competition["name"])):
+        places = min(
+            places,
+            int(club["points"]),
+            MAX_PLACES_PER_COMPETITION - ledger.booked(club["name"], competition["name"]),
+        )
+        return seat_holds.hold(club["name"], competition["name"], places, int(competition["numberOfPlaces"]))
+
+
+@app.route("/history/<club>")
+def history(club):
+    """
+    Historique des réservations d'un club : places réservées au total sur chaque compétition.
+
+    Le registre des réservations ne change qu'avec les points du club : l'ETag
+    dépend uniquement de la version du club.
+
+    Args:
+        club (str): Nom du club
+
+    Returns:
+        Response: Page 'history.html', ou 404 si le club est inconnu.
+    """
+    data = get_registry()
+    with timed("lookup"):
+        foundClub = data.club_by_name(club)
+    if foundClub is None:
+        return "Club not found.", 404
+
+    def render():
+        bookings = []
+        for name, places in ledger.history(foundClub["name"]).items():
+            competition = data.competition_by_name(name)
+            date = competition["date"] if competition is not None else ""
+            bookings.append({"competition": name, "date": date, "places": places})
+        return render_template("history.html", club=foundClub, bookings=bookings)
+
+    club_stamp = data.record_stamp("club", foundClub["name"])
+    return conditional_response(f"{instance_id}-{club_stamp[0]}", club_stamp[1], render, private=True)
+
+
+def shed_booking(status, retry_after, message):
+    """
+    Réponse de délestage d'une réservation : 429 (club trop rapide) ou 503 (surcharge),
+    avec l'en-tête Retry-After. La réponse est volontairement légère (pas de rendu de page).
+
+    Args:
+        status (int): 429 ou 503.
+        retry_after (float): Délai conseillé avant un nouvel essai (secondes).
+        message (str): Message d'erreur.
+    """
+    headers = {"Retry-After": str(max(ceil(retry_after), 1))}
+    if request.is_json:
+        return {"error": message}, status, headers
+    return message, status, headers
+
+
+@contextmanager
+def booking_admission(club):
+    """
+    Contrôle d'admission des réservations (BOOKING_RATE et BOOKING_CONCURRENCY).
+
+    Une réservation est refusée si le club a épuisé son seau de jetons (429) ou
+    si BOOKING_CONCURRENCY réservations sont déjà en cours (503). Le refus est
+    immédiat : les requêtes en excès n'attendent ni les verrous ni l'écriture, et
+    les routes de lecture restent rapides.
+
+    Usage :
+        with booking_admission(club) as refused:
+            if refused is not None:
+                return refused
+            ...
+
+    Yields:
+        Réponse de refus, ou None si la réservation est admise (sa place est
+        libérée à la sortie du bloc).
+    """
+    if booking_rate_limiter is not None:
+        wait = booking_rate_limiter.acquire(club["name"])
+        if wait:
+            yield shed_booking(429, wait, "Too many bookings for this club, please wait a moment.")
+            return
+    if booking_slots is not None and not booking_slots.try_acquire():
+        yield shed_booking(503, app.config["BOOKING_RETRY_AFTER"], "Too many bookings in progress, please try again.")
+        return
+    try:
+        yield None
+    finally:
+        if booking_slots is not None:
+            booking_slots.release()
 
 
 @app.route("/purchasePlaces", methods=["POST"])
@@ -137,39 +992,141 @@ def purchasePlaces():
         - Le club a assez de points.
         - Limite de 12 places par compétition.
 
-    Si toutes les validations passent :
+    Si le club ou la compétition est introuvable, redirige vers l'accueil.
+
+    Si toutes les validations passent (voir `book_places`) :
         - Décrémente les places disponibles et les points du club.
-        - Met à jour les fichiers JSON.
+        - Persiste la réservation via le backend de stockage.
         - Affiche un message de succès.
     """
-    competition = next(c for c in competitions if c["name"] == request.form["competition"])
-    club = next(c for c in clubs if c["name"] == request.form["club"])
+    data = get_registry()
+    with timed("lookup"):
+        competition = data.competition_by_name(request.form["competition"])
+        club = data.club_by_name(request.form["club"])
+    if competition is None or club is None:
+        flash("Something went wrong-please try again")
+        return redirect(url_for("index"))
+
     places_required = int(request.form["places"])
 
-    competition_date = datetime.strptime(competition["date"], "%Y-%m-%d %H:%M:%S")
+    with booking_admission(club) as refused:
+        if refused is not None:
+            return refused
+        error = book_places(club, competition, places_required)
+    if error:
+        flash(error)
+        return render_welcome(club, data)
 
-    # Liste de validations avec message et condition
-    validations = [
-        ("You cannot book a place on a past competition.", competition_date < datetime.now()),
-        ("Number of places must be greater than zero.", places_required <= 0),
-        ("Not enough places left in this competition.", places_required > int(competition["numberOfPlaces"])),
-        ("You do not have enough points to book these places.", places_required > int(club["points"])),
-        ("Cannot book more than 12 places per competition.", places_required > 12),
-    ]
+    flash("Great-booking complete!")
+    return render_welcome(club, data)
 
-    # Vérification de chaque condition
-    for message, condition in validations:
-        if condition:
-            flash(message)
-            return render_template("welcome.html", club=club, competitions=competitions)
 
-    # Mise à jour des données si validation réussie
-    competition["numberOfPlaces"] = int(competition["numberOfPlaces"]) - places_required
-    club["points"] = int(club["points"]) - places_required
+def read_batch_request():
+    """
+    Lit une demande de réservation groupée (JSON ou formulaire).
+
+    Formats acceptés :
+        - JSON : {"club": "...", "bookings": [{"competition": "...", "places": 2}, ...]} ;
+        - formulaire : champ `club`, puis champs `competition` et `places` répétés
+          (dans le même ordre). Les lignes sans nombre de places sont ignorées.
+
+    Returns:
+        tuple: (nom du club, liste de couples (nom de compétition, places))
+
+    Raises:
+        ValueError: si la demande est mal formée.
+    """
+    if request.is_json:
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict) or not isinstance(payload.get("bookings"), list):
+            raise ValueError("Malformed batch request")
+        try:
+            club_name = payload["club"]
+            bookings = [(item["competition"], int(item["places"])) for item in payload["bookings"]]
+        except (TypeError, KeyError):
+            raise ValueError("Malformed batch request")
+        # Les noms servent de clés d'index : une liste ou un objet lèverait TypeError
+        if not isinstance(club_name, str) or not all(isinstance(name, str) for name, _ in bookings):
+            raise ValueError("Malformed batch request")
+        return club_name, bookings
+
+    pairs = zip(request.form.getlist("competition"), request.form.getlist("places"))
+    return request.form.get("club"), [(name, int(places)) for name, places in pairs if places.strip()]
+
+
+@app.route("/purchaseBatch", methods=["POST"])
+def purchaseBatch():
+    """
+    Réserve en une seule opération des places sur plusieurs compétitions pour un club.
+
+    Toutes les règles de `purchasePlaces` sont vérifiées sur l'ensemble du lot
+    (les demandes répétées pour une même compétition sont additionnées, y compris
+    pour la limite de 12 places) ; le lot est appliqué en tout ou rien, avec une
+    seule écriture du backend de stockage (voir `book_many`).
+
+    Réponse :
+        - requête JSON : {"club", "points", "bookings"} (200), ou {"error"} avec
+          le code 400 (demande mal formée), 404 (club ou compétition inconnu)
+          ou 409 (règle non respectée) ;
+        - formulaire : page 'welcome.html' avec un message flash.
+    """
+    try:
+        club_name, requested = read_batch_request()
+    except ValueError:
+        if request.is_json:
+            return {"error": "Malformed batch request"}, 400
+        flash("Something went wrong-please try again")
+        return redirect(url_for("index"))
+
+    data = get_registry()
+    club = data.club_by_name(club_name)
+    totals = {}
+    for name, places in requested:
+        totals[name] = totals.get(name, 0) + places
+    bookings = [(data.competition_by_name(name), places) for name, places in totals.items()]
+    if club is None or any(competition is None for competition, _ in bookings):
+        if request.is_json:
+            return {"error": "Unknown club or competition"}, 404
+        flash("Something went wrong-please try again")
+        return redirect(url_for("index"))
+
+    with booking_admission(club) as refused:
+        if refused is not None:
+            return refused
+        error = book_many(club, bookings)
+    if request.is_json:
+        if error:
+            return {"error": error}, 409
+        return {
+            "club": club["name"],
+            "points": int(club["points"]),
+            "bookings": [{"competition": competition["name"], "places": places} for competition, places in bookings],
+        }
+
+    flash(error or "Great-booking complete!")
+    return render_welcome(club, data)
 
-    updateData()
-    flash("Great-booking complete!")
-    return render_template("welcome.html", club=club, competitions=competitions)
+
+def sorted_clubs(data, sort):
+    """
+    Clubs dans l'ordre demandé, calculé une seule fois par version des données.
+
+    Args:
+        data (Registry): Registre des données.
+        sort (str | None): "points" (décroissant), "name", ou None (ordre de chargement).
+
+    Returns:
+        list: Clubs triés.
+    """
+
+    def compute():
+        if sort == "points":
+            return sorted(data.clubs, key=lambda club: int(club["points"]), reverse=True)
+        if sort == "name":
+            return sorted(data.clubs, key=lambda club: club["name"].lower())
+        return list(data.clubs)
+
+    return response_cache.get_or_compute(("clubs-order", sort), data.version, compute)
 
 
 @app.route("/points")
@@ -177,9 +1134,223 @@ def points():
     """
     Affiche un tableau public des clubs et de leurs points.
 
-    Accessible sans connexion.
+    Accessible sans connexion. Paramètres optionnels :
+        - sort : "points" ou "name" ;
+        - page : numéro de page (si POINTS_PAGE_SIZE est non nul).
+
+    La page rendue est mise en cache (octets) pour la version courante des
+    données : tant qu'aucune réservation ni aucun rechargement n'a eu lieu, les
+    visites suivantes ne refont ni tri ni rendu. Le client qui présente l'ETag
+    de cette version reçoit directement une réponse 304.
+    """
+    data = get_registry()
+    version, modified_at = data.version, data.modified_at
+    sort = request.args.get("sort")
+    if sort not in ("points", "name"):
+        sort = None
+    page_size = app.config["POINTS_PAGE_SIZE"]
+    pages = max(ceil(len(data.clubs) / page_size), 1) if page_size else 1
+    page = min(max(request.args.get("page", 1, type=int), 1), pages)
+
+    def render():
+        ordered = sorted_clubs(data, sort)
+        shown = ordered[(page - 1) * page_size : page * page_size] if page_size else ordered
+        return render_template("points.html", clubs=shown, sort=sort, page=page, pages=pages).encode()
+
+    return conditional_response(
+        f"{instance_id}-{version}",
+        modified_at,
+        lambda: response_cache.get_or_compute(("points", sort, page, page_size), version, render),
+    )
+
+
+def club_payload(club):
+    """
+    Représentation JSON d'un club (nom et points en entier).
+
+    L'email du secrétaire n'est jamais exposé : c'est l'identifiant demandé à
+    la connexion ('/showSummary'), et l'API n'est pas authentifiée.
+
+    Args:
+        club (Club | dict): Club à sérialiser.
+    """
+    return {"name": club["name"], "points": int(club["points"])}
+
+
+def competition_payload(competition):
+    """Représentation JSON d'une compétition (date au format des fichiers JSON, places en entier)."""
+    return {
+        "name": competition["name"],
+        "date": competition["date"],
+        "numberOfPlaces": int(competition["numberOfPlaces"]),
+    }
+
+
+def cached_json(key, version, last_modified, build):
+    """
+    Réponse JSON dont le corps sérialisé est mis en cache (octets) par version des données.
+
+    Le corps et son ETag sont calculés une seule fois par version : tant qu'aucune
+    réservation n'a eu lieu, les clients qui interrogent l'API en boucle reçoivent
+    les mêmes octets (ou un 304) sans nouvelle sérialisation.
+
+    Args:
+        key (tuple): Clé de cache propre à la ressource et à ses paramètres.
+        version (int): Version des données dont dépend le corps.
+        last_modified (datetime | None): Date de dernière modification (UTC).
+        build (callable): Fonction sans argument produisant l'objet à sérialiser.
+
+    Returns:
+        Response: Réponse 304 ou 200 (application/json).
+    """
+
+    def serialize():
+        body = json.dumps(build(), separators=(",", ":")).encode()
+        return body, f"{instance_id}-{version}-{zlib.crc32(body):08x}"
+
+    body, etag = response_cache.get_or_compute(("api",) + key, version, serialize)
+    return conditional_response(etag, last_modified, lambda: app.response_class(body, mimetype="application/json"))
+
+
+@app.route("/api/clubs")
+def api_clubs():
+    """
+    Liste JSON des clubs (nom et points, sans email), dans l'ordre de chargement.
+    """
+    data = get_registry()
+    return cached_json(
+        ("clubs",), data.version, data.modified_at, lambda: {"clubs": [club_payload(club) for club in data.clubs]}
+    )
+
+
+@app.route("/api/clubs/<name>")
+def api_club(name):
+    """
+    Club au format JSON (nom et points, sans email).
+
+    Le corps n'est invalidé que lorsque ce club est modifié (version propre de
+    l'enregistrement, voir `Registry.record_stamp`).
+
+    Args:
+        name (str): Nom du club.
+
+    Returns:
+        Response: Club, ou 404 si aucun club ne porte ce nom.
+    """
+    data = get_registry()
+    club = data.club_by_name(name)
+    if club is None:
+        return {"error": "Club not found"}, 404
+    version, modified_at = data.record_stamp("club", club["name"])
+    return cached_json(("club", name), version, modified_at, lambda: club_payload(club))
+
+
+@app.route("/api/competitions")
+def api_competitions():
+    """
+    Page JSON de compétitions triées par date.
+
+    Paramètres optionnels :
+        - view : "upcoming" (défaut), "past" ou "all" ;
+        - days : restreint aux compétitions des N prochains jours ;
+        - after : curseur `next` renvoyé par la page précédente ;
+        - limit : taille de la page, au moins 1 (COMPETITIONS_PAGE_SIZE par défaut).
+
+    Returns:
+        Response: {"competitions": [...], "next": curseur ou null}, ou 400 si
+                  un paramètre est invalide.
+    """
+    view = request.args.get("view", "upcoming")
+    if view not in ("upcoming", "past", "all"):
+        return {"error": "Invalid view"}, 400
+    days = request.args.get("days", type=int)
+    limit = request.args.get("limit", type=int)
+    if limit is not None and limit < 1:
+        return {"error": "Invalid limit"}, 400
+    limit = limit or app.config["COMPETITIONS_PAGE_SIZE"] or None
+    after = request.args.get("after")
+
+    data = get_registry()
+    version, modified_at = data.version, data.modified_at
+    try:
+        page, next_cursor = data.competitions_page(view, days=days, after=after, limit=limit)
+    except ValueError:
+        return {"error": "Invalid cursor"}, 400
+
+    # Les vues datées dépendent de l'heure courante : la clé décrit la page
+    # effectivement sélectionnée (et non seulement les paramètres de la requête).
+    first = page[0]["name"] if page else None
+    return cached_json(
+        ("competitions", view, days, after, limit, first, len(page), next_cursor),
+        version,
+        modified_at,
+        lambda: {"competitions": [competition_payload(c) for c in page], "next": next_cursor},
+    )
+
+
+@app.route("/api/points")
+def api_points():
+    """
+    Tableau public des points au format JSON (nom et points, sans email).
+
+    Paramètre optionnel `sort` : "points" (décroissant) ou "name", comme '/points'.
     """
-    return render_template("points.html", clubs=clubs)
+    data = get_registry()
+    sort = request.args.get("sort")
+    if sort not in ("points", "name"):
+        sort = None
+    return cached_json(
+        ("points", sort),
+        data.version,
+        data.modified_at,
+        lambda: {"clubs": [club_payload(club) for club in sorted_clubs(data, sort)]},
+    )
+
+
+@app.route("/metrics")
+def metrics_endpoint():
+    """
+    Métriques au format texte de Prometheus (METRICS) : requêtes, erreurs et
+    durées par route, durées des étapes (recherche, validation, persistance,
+    rendu), ainsi que l'état de la file de réservations et du cache des réponses.
+
+    Returns:
+        Response: Texte Prometheus, ou 404 si METRICS est désactivé.
+    """
+    if metrics is None:
+        return "Metrics are disabled.", 404
+
+    gauges = {
+        "gudlft_response_cache_hits_total": ("Responses served from the cache.", "counter", response_cache.hits),
+        "gudlft_response_cache_misses_total": ("Responses computed for the cache.", "counter", response_cache.misses),
+    }
+    if booking_rate_limiter is not None:
+        gauges["gudlft_bookings_rate_limited_total"] = (
+            "Bookings refused with 429 (club over BOOKING_RATE).",
+            "counter",
+            booking_rate_limiter.limited,
+        )
+    if booking_slots is not None:
+        gauges["gudlft_bookings_overloaded_total"] = (
+            "Bookings refused with 503 (BOOKING_CONCURRENCY reached).",
+            "counter",
+            booking_slots.overloaded,
+        )
+    if booking_queue is not None:
+        stats = booking_queue.stats()
+        gauges["gudlft_booking_queue_depth"] = ("Bookings waiting in the queue.", "gauge", stats["depth"])
+        gauges["gudlft_booking_queue_processed_total"] = ("Bookings processed.", "counter", stats["processed"])
+        gauges["gudlft_booking_queue_batches_total"] = ("Batches written.", "counter", stats["batches"])
+        gauges["gudlft_booking_queue_expired_total"] = ("Bookings that waited too long.", "counter", stats["expired"])
+    if seat_holds is not None:
+        gauges["gudlft_seat_holds"] = ("Seat holds not yet expired.", "gauge", seat_holds.expire())
+        gauges["gudlft_seat_holds_expired_total"] = ("Seat holds that expired.", "counter", seat_holds.expired)
+        gauges["gudlft_seat_holds_converted_total"] = (
+            "Seat holds turned into bookings.",
+            "counter",
+            seat_holds.converted,
+        )
+    return metrics.render(gauges), 200, {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
 
 
 @app.route("/logout")
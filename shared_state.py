@@ -0,0 +1,319 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# En-tête : signature, empreinte des noms, génération, nombre de clubs, nombre de compétitions,
+# nombre total d'entrées écrites dans l'anneau des modifications, capacité de la table du registre
+HEADER = struct.Struct("<8s16sqqqqq")
+MAGIC = b"GUDLFTS3"
+GENERATION_OFFSET = 24
+HEAD_OFFSET = 48
+CAPACITY_OFFSET = 56
+COUNTER = struct.Struct("<q")
+# Entrées de l'anneau des compteurs modifiés : au-delà, un worker en retard recopie tout
+RING_SIZE = 1024
+# Entrée de la table du registre : numéro du club + 1 (0 : entrée libre), numéro de la compétition, places
+ENTRY = struct.Struct("<qqq")
+
+
+def _fingerprint(clubs, competitions):
+    """Empreinte des noms (et de leur ordre), qui fixe la disposition des compteurs dans le fichier."""
+    digest = hashlib.md5()
+    for record in clubs:
+        digest.update(record["name"].encode() + b"\0")
+    digest.update(b"\1")
+    for record in competitions:
+        digest.update(record["name"].encode() + b"\0")
+    return digest.digest()
+
+
+class SharedCounters:
+    """
+    Compteurs réservables (points des clubs, places des compétitions) partagés
+    entre processus via un fichier mappé en mémoire.
+
+    Le fichier contient un en-tête puis un entier 64 bits par club et par
+    compétition, dans l'ordre de chargement. Tous les workers mappent le même
+    fichier : une réservation faite par l'un est visible des autres sans relire
+    les fichiers JSON. Un compteur de génération, incrémenté à chaque écriture,
+    permet à chaque worker de ne resynchroniser ses enregistrements en mémoire
+    que lorsque quelque chose a changé.
+
+    Chaque écriture ajoute les numéros des compteurs modifiés à un anneau de
+    RING_SIZE entrées : un worker ne recopie que ces compteurs. S'il a pris plus
+    de RING_SIZE entrées de retard, il recopie tous les compteurs.
+
+    Les écritures sont protégées par un verrou de fichier (flock) entre processus
+    et par un verrou de thread dans chaque processus.
+
+    Le premier worker qui trouve un fichier absent ou décrit par d'autres données
+    (empreinte des noms différente) l'initialise avec ses propres valeurs ; les
+    suivants adoptent les valeurs du fichier. Supprimer le fichier force une
+    réinitialisation depuis le backend de stockage.
+
+    `on_change`, si fourni, est appelé après chaque resynchronisation ayant
+    modifié les enregistrements en mémoire, avec le club ou la compétition modifié
+    (`on_change(club=...)`, `on_change(competition=...)`), ou sans argument après
+    une recopie complète (ex. `Registry.touch`).
+
+    Si `ledger` (`ledger.BookingLedger`) est fourni, le fichier contient aussi les
+    places réservées par les clubs sur les compétitions : la limite de places par
+    compétition est vérifiée sur le total de tous les workers, et chacun persiste
+    le même registre complet. Seuls les couples (club, compétition) ayant des
+    réservations occupent une entrée, dans une table à adressage ouvert d'au moins
+    `ledger_capacity` entrées (puissance de deux, fixée à l'initialisation du fichier).
+    Les entrées modifiées passent par l'anneau comme les autres compteurs.
+    """
+
+    def __init__(self, path, clubs, competitions, on_change=None, ledger=None, ledger_capacity=65536):
+        if fcntl is None:
+            raise RuntimeError("Shared state requires a POSIX system (fcntl).")
+
+        self.path = path
+        self.clubs = clubs
+        self.competitions = competitions
+        self.on_change = on_change
+        self._club_slots = {}
+        for slot, club in enumerate(clubs):
+            self._club_slots.setdefault(club["name"], slot)
+        self._competition_slots = {}
+        for slot, competition in enumerate(competitions):
+            self._competition_slots.setdefault(competition["name"], len(clubs) + slot)
+        self.ledger = ledger
+        self._counters = len(clubs) + len(competitions)
+        self._ring_offset = HEADER.size + COUNTER.size * self._counters
+        self._table_offset = self._ring_offset + COUNTER.size * RING_SIZE
+        self._entries = {}  # (numéro du club, numéro de la compétition) -> entrée de la table
+        self._thread_lock = threading.Lock()
+        self._generation = None
+        self._head = 0
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            fingerprint = _fingerprint(clubs, competitions)
+            header = os.pread(self._fd, HEADER.size, 0)
+            valid = len(header) == HEADER.size and HEADER.unpack(header)[:2] == (MAGIC, fingerprint)
+            capacity = HEADER.unpack(header)[-1] if valid else 0
+            valid = valid and (capacity > 0) == (ledger is not None)
+            if not valid or os.fstat(self._fd).st_size != self._table_offset + ENTRY.size * capacity:
+                capacity = 0
+                if ledger is not None:
+                    # Taux de remplissage initial d'au plus 1/2 : les sondages restent courts
+                    capacity = 1 << max(ledger_capacity - 1, 2 * len(ledger), 1).bit_length()
+                self._capacity = capacity
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, self._table_offset + ENTRY.size * capacity)
+                self._mmap = mmap.mmap(self._fd, self._table_offset + ENTRY.size * capacity)
+                HEADER.pack_into(self._mmap, 0, MAGIC, fingerprint, 1, len(clubs), len(competitions), 0, capacity)
+                values = [int(club["points"]) for club in clubs]
+                values += [int(competition["numberOfPlaces"]) for competition in competitions]
+                struct.pack_into(f"<{len(values)}q", self._mmap, HEADER.size, *values)
+                for record in ledger.to_records() if ledger is not None else ():
+                    club_slot = self._club_slots.get(record["club"])
+                    competition_slot = self._competition_slots.get(record["competition"])
+                    if club_slot is not None and competition_slot is not None:
+                        index = self._entry_index(club_slot, competition_slot)
+                        ENTRY.pack_into(
+                            self._mmap, self._entry_offset(index), club_slot + 1, competition_slot, record["places"]
+                        )
+            else:
+                self._capacity = capacity
+                self._mmap = mmap.mmap(self._fd, self._table_offset + ENTRY.size * capacity)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self.refresh()
+
+    @property
+    def generation(self):
+        """Génération courante du fichier partagé."""
+        return COUNTER.unpack_from(self._mmap, GENERATION_OFFSET)[0]
+
+    def refresh(self):
+        """
+        Recopie les compteurs partagés dans les enregistrements en mémoire si
+        un processus les a modifiés depuis la dernière synchronisation.
+
+        Seuls les compteurs inscrits dans l'anneau depuis la dernière
+        synchronisation sont relus ; tous le sont au premier appel ou si l'anneau
+        a été dépassé entre-temps.
+
+        Returns:
+            bool: True si les enregistrements ont été mis à jour.
+        """
+        if self.generation == self._generation:
+            return False
+        # Pas de recopie pendant qu'un autre thread du processus réserve sous `locked()`
+        with self._thread_lock:
+            return self._sync()
+
+    def _sync(self):
+        """Recopie les compteurs modifiés ; appelé avec le verrou de thread."""
+        generation = self.generation
+        if generation == self._generation:
+            return False
+        # La génération est écrite en dernier : l'anneau contient au moins ses modifications
+        head = COUNTER.unpack_from(self._mmap, HEAD_OFFSET)[0]
+        slots = None
+        if self._generation is not None and head - self._head <= RING_SIZE:
+            slots = {
+                COUNTER.unpack_from(self._mmap, self._ring_offset + COUNTER.size * (position % RING_SIZE))[0]
+                for position in range(self._head, head)
+            }
+            # Des écritures concurrentes ont pu recouvrir les entrées lues
+            if COUNTER.unpack_from(self._mmap, HEAD_OFFSET)[0] - self._head > RING_SIZE:
+                slots = None
+
+        if slots is None:
+            self._copy_all()
+        else:
+            for slot in sorted(slots):
+                self._copy_slot(slot)
+        self._generation = generation
+        self._head = head
+        return True
+
+    @contextmanager
+    def locked(self):
+        """
+        Verrou exclusif sur l'état partagé (threads du processus et autres processus).
+
+        Les enregistrements en mémoire sont resynchronisés à l'entrée, afin que les
+        vérifications faites sous le verrou portent sur les valeurs à jour.
+        """
+        with self._thread_lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                self._sync()
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def store(self, club, competition):
+        """
+        Publie les compteurs d'un club et d'une compétition dans le fichier partagé,
+        ainsi que les places réservées par le club sur la compétition (avec `ledger`).
+
+        Doit être appelé sous `locked()`.
+
+        Args:
+            club (Club): Club dont les points ont changé.
+            competition (Competition): Compétition dont les places ont changé.
+
+        Raises:
+            RuntimeError: si la table du registre est pleine (voir `ledger_capacity`).
+        """
+        club_slot = self._club_slots[club["name"]]
+        competition_slot = self._competition_slots[competition["name"]]
+        slots = [club_slot, competition_slot]
+        if self.ledger is not None:
+            # Entrée cherchée avant toute écriture : une table pleine ne laisse pas de publication partielle
+            index = self._entry_index(club_slot, competition_slot)
+            booked = self.ledger.booked(club["name"], competition["name"])
+            ENTRY.pack_into(self._mmap, self._entry_offset(index), club_slot + 1, competition_slot, booked)
+            slots.append(self._counters + index)
+        COUNTER.pack_into(self._mmap, self._offset(club_slot), int(club["points"]))
+        COUNTER.pack_into(self._mmap, self._offset(competition_slot), int(competition["numberOfPlaces"]))
+
+        head = COUNTER.unpack_from(self._mmap, HEAD_OFFSET)[0]
+        for slot in slots:
+            COUNTER.pack_into(self._mmap, self._ring_offset + COUNTER.size * (head % RING_SIZE), slot)
+            head += 1
+        COUNTER.pack_into(self._mmap, HEAD_OFFSET, head)
+        # Resynchronisé à l'entrée de `locked()` : ses propres écritures ne seront pas recopiées
+        self._head = head
+        self._generation = self.generation + 1
+        COUNTER.pack_into(self._mmap, GENERATION_OFFSET, self._generation)
+
+    def close(self):
+        """Démappe et ferme le fichier partagé."""
+        self._mmap.close()
+        os.close(self._fd)
+
+    def _copy_all(self):
+        """Recopie tous les compteurs partagés (premier chargement ou anneau dépassé)."""
+        values = struct.unpack_from(f"<{self._counters}q", self._mmap, HEADER.size)
+        for club, value in zip(self.clubs, values):
+            club["points"] = value
+        for competition, value in zip(self.competitions, values[len(self.clubs):]):
+            competition["numberOfPlaces"] = value
+        if self.ledger is not None:
+            self._entries = {}
+            records = []
+            table = self._mmap[self._table_offset:self._entry_offset(self._capacity)]
+            for index, (key, competition_slot, places) in enumerate(ENTRY.iter_unpack(table)):
+                if key:
+                    self._entries[(key - 1, competition_slot)] = index
+                    if places:
+                        records.append(self._entry_record(key - 1, competition_slot, places))
+            self.ledger.replace(records)
+        if self.on_change is not None:
+            self.on_change()
+
+    def _copy_slot(self, slot):
+        """Recopie un compteur partagé (club, compétition ou entrée du registre) en mémoire."""
+        value = COUNTER.unpack_from(self._mmap, self._offset(slot))[0]
+        if slot < len(self.clubs):
+            club = self.clubs[slot]
+            club["points"] = value
+            if self.on_change is not None:
+                self.on_change(club=club)
+        elif slot < len(self.clubs) + len(self.competitions):
+            competition = self.competitions[slot - len(self.clubs)]
+            competition["numberOfPlaces"] = value
+            if self.on_change is not None:
+                self.on_change(competition=competition)
+        else:
+            index = slot - self._counters
+            key, competition_slot, places = ENTRY.unpack_from(self._mmap, self._entry_offset(index))
+            self._entries[(key - 1, competition_slot)] = index
+            record = self._entry_record(key - 1, competition_slot, places)
+            booked = self.ledger.booked(record["club"], record["competition"])
+            self.ledger.add(record["club"], record["competition"], places - booked)
+
+    def _entry_index(self, club_slot, competition_slot):
+        """
+        Entrée de la table du registre d'un couple (club, compétition) ; une entrée
+        libre lui est attribuée s'il n'en a pas encore (sondage linéaire).
+
+        Returns:
+            int: Entrée de la table.
+
+        Raises:
+            RuntimeError: si la table est pleine.
+        """
+        index = self._entries.get((club_slot, competition_slot))
+        if index is None:
+            index = (club_slot * 0x9E3779B1 + competition_slot) % self._capacity
+            for _ in range(self._capacity):
+                key, slot, _places = ENTRY.unpack_from(self._mmap, self._entry_offset(index))
+                if key == 0 or (key - 1, slot) == (club_slot, competition_slot):
+                    break
+                index = (index + 1) % self._capacity
+            else:
+                raise RuntimeError("Shared booking ledger is full; increase SHARED_LEDGER_CAPACITY.")
+            self._entries[(club_slot, competition_slot)] = index
+        return index
+
+    def _entry_record(self, club_slot, competition_slot, places):
+        """Enregistrement du registre correspondant à une entrée de la table."""
+        return {
+            "club": self.clubs[club_slot]["name"],
+            "competition": self.competitions[competition_slot - len(self.clubs)]["name"],
+            "places": places,
+        }
+
+    def _entry_offset(self, index):
+        return self._table_offset + ENTRY.size * index
+
+    @staticmethod
+    def _offset(slot):
+        return HEADER.size + COUNTER.size * slot
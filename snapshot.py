@@ -0,0 +1,130 @@
+import mmap
+import os
+import struct
+from datetime import datetime, timedelta
+
+from models import Club, Competition, competition_date
+
+# En-tête : signature, version du format, nombre de clubs, nombre de compétitions,
+# séquences de journal déjà intégrées (clubs, compétitions)
+HEADER = struct.Struct("<8sIqqqq")
+MAGIC = b"GUDLFTBS"
+FORMAT_VERSION = 1
+# Club : position et longueur du nom, position et longueur de l'email, points
+CLUB = struct.Struct("<QIQIq")
+# Compétition : position et longueur du nom, date (secondes depuis EPOCH), places
+COMPETITION = struct.Struct("<QIqq")
+EPOCH = datetime(1970, 1, 1)
+
+
+class SnapshotError(ValueError):
+    """Levée quand un instantané binaire est absent, périmé ou illisible."""
+
+
+def write_snapshot(path, clubs, competitions, clubs_seq=0, competitions_seq=0, fsync=True):
+    """
+    Écrit un instantané binaire des clubs et compétitions, de façon atomique.
+
+    Le fichier contient un en-tête, un enregistrement de taille fixe par club
+    puis par compétition, et une table des chaînes (UTF-8) à laquelle les
+    enregistrements renvoient par position et longueur.
+
+    Args:
+        path (str): Chemin du fichier.
+        clubs (list): Clubs (modèles ou dictionnaires au format JSON).
+        competitions (list): Compétitions (modèles ou dictionnaires au format JSON).
+        clubs_seq (int): Séquence de journal intégrée dans les clubs.
+        competitions_seq (int): Séquence de journal intégrée dans les compétitions.
+        fsync (bool): Force l'écriture sur disque avant le renommage.
+    """
+    strings = bytearray()
+
+    def intern(text):
+        data = text.encode("utf-8")
+        offset = len(strings)
+        strings.extend(data)
+        return offset, len(data)
+
+    records = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, len(clubs), len(competitions), clubs_seq, competitions_seq))
+    for club in clubs:
+        records += CLUB.pack(*intern(club["name"]), *intern(club["email"]), int(club["points"]))
+    for competition in competitions:
+        seconds = int((competition_date(competition) - EPOCH).total_seconds())
+        records += COMPETITION.pack(*intern(competition["name"]), seconds, int(competition["numberOfPlaces"]))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(records)
+        f.write(strings)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path):
+    """
+    Lit un instantané binaire (fichier mappé en mémoire) et reconstruit les modèles.
+
+    Aucune analyse de texte n'est nécessaire : les enregistrements sont décodés
+    par `struct` et seules les chaînes sont converties depuis la table UTF-8.
+
+    Returns:
+        tuple: (clubs, competitions, séquence des clubs, séquence des compétitions)
+
+    Raises:
+        SnapshotError: si le fichier n'est pas un instantané valide.
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version, club_count, competition_count, clubs_seq, competitions_seq = HEADER.unpack_from(mm, 0)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise SnapshotError(f"Not a snapshot (version {FORMAT_VERSION}): {path}")
+            clubs_end = HEADER.size + CLUB.size * club_count
+            strings_start = clubs_end + COMPETITION.size * competition_count
+            if strings_start > len(mm):
+                raise SnapshotError(f"Truncated snapshot: {path}")
+            strings = mm[strings_start:]
+
+            clubs = [
+                Club(
+                    strings[name_at : name_at + name_len].decode("utf-8"),
+                    strings[email_at : email_at + email_len].decode("utf-8"),
+                    points,
+                )
+                for name_at, name_len, email_at, email_len, points in CLUB.iter_unpack(mm[HEADER.size : clubs_end])
+            ]
+            competitions = [
+                Competition(
+                    strings[name_at : name_at + name_len].decode("utf-8"), EPOCH + timedelta(seconds=date), places
+                )
+                for name_at, name_len, date, places in COMPETITION.iter_unpack(mm[clubs_end:strings_start])
+            ]
+    except (OSError, ValueError, struct.error) as error:
+        if isinstance(error, SnapshotError):
+            raise
+        raise SnapshotError(f"Unreadable snapshot {path}: {error}") from error
+    return clubs, competitions, clubs_seq, competitions_seq
+
+
+def read_fresh_snapshot(path, *sources):
+    """
+    Lit l'instantané binaire s'il est au moins aussi récent que tous les fichiers sources.
+
+    Args:
+        path (str): Chemin de l'instantané.
+        *sources: Fichiers JSON dont l'instantané est une copie.
+
+    Returns:
+        tuple: voir `read_snapshot`.
+
+    Raises:
+        SnapshotError: si l'instantané est absent, plus ancien qu'une source, ou illisible.
+    """
+    try:
+        written = os.stat(path).st_mtime_ns
+        if any(os.stat(source).st_mtime_ns > written for source in sources):
+            raise SnapshotError(f"Snapshot older than its JSON files: {path}")
+    except FileNotFoundError as error:
+        raise SnapshotError(str(error)) from error
+    return read_snapshot(path)
@@ -0,0 +1,721 @@
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from contextlib import nullcontext
+
+from fileutils import write_json_atomic
+from journal import BookingJournal
+from json_stream import iter_records
+from ledger import MAX_PLACES_PER_COMPETITION, BookingLedger
+from models import Club, Competition
+from snapshot import SnapshotError, read_fresh_snapshot, write_snapshot
+
+
+def to_models(clubs, competitions):
+    """
+    Convertit des enregistrements JSON bruts en modèles `Club` et `Competition`.
+
+    Les enregistrements qui sont déjà des modèles sont conservés tels quels.
+
+    Args:
+        clubs (iterable): Enregistrements des clubs (liste ou itérateur).
+        competitions (iterable): Enregistrements des compétitions (liste ou itérateur).
+
+    Returns:
+        tuple: (clubs, competitions) sous forme de modèles.
+    """
+    return (
+        [club if isinstance(club, Club) else Club.from_dict(club) for club in clubs],
+        [c if isinstance(c, Competition) else Competition.from_dict(c) for c in competitions],
+    )
+
+
+def load_models(clubs_path, competitions_path):
+    """
+    Charge les fichiers JSON de données directement en modèles.
+
+    Chaque enregistrement est converti dès qu'il est lu : ni le texte complet des
+    fichiers ni la liste intermédiaire de dictionnaires ne sont gardés en mémoire.
+
+    Returns:
+        tuple: (clubs, competitions) sous forme de modèles.
+    """
+    return to_models(iter_records(clubs_path, "clubs"), iter_records(competitions_path, "competitions"))
+
+
+class BookingConflict(Exception):
+    """
+    Levée par un backend quand la réservation n'est plus possible dans le stockage partagé
+    (un autre processus a consommé les points ou les places entre-temps).
+
+    Attributes:
+        points (int): Points du club actuellement en stockage.
+        places (int | dict): Places de la compétition actuellement en stockage ; pour
+            un lot de réservations, places de chaque compétition du lot, par nom.
+        booked (dict | None): Places déjà réservées par le club en stockage sur chaque
+            compétition concernée, par nom (None si le backend ne les connaît pas).
+    """
+
+    def __init__(self, points, places, booked=None):
+        super().__init__(f"Booking conflict (points={points}, places={places})")
+        self.points = points
+        self.places = places
+        self.booked = booked
+
+
+class Storage:
+    """
+    Interface commune des backends de stockage des clubs et compétitions.
+
+    Un backend sait :
+        - charger l'état complet (`load`) ;
+        - sauvegarder l'état complet (`save`) ;
+        - persister une réservation déjà appliquée en mémoire (`record_booking`).
+          Par défaut, cela revient à tout sauvegarder ; les backends capables
+          d'écritures ciblées surchargent cette méthode. Un backend partagé entre
+          processus peut refuser la réservation en levant `BookingConflict` ;
+        - persister un lot de réservations en une seule écriture (`record_bookings`).
+
+    Le registre des réservations cumulées (`ledger.BookingLedger`) est chargé par
+    `load_ledger`, qui le rattache au backend : les écritures suivantes le
+    persistent avec les clubs et compétitions.
+    """
+
+    # Registre des réservations cumulées rattaché par `load_ledger`
+    ledger = None
+
+    def load(self):
+        """
+        Returns:
+            tuple: (clubs, competitions), listes de modèles `Club` et `Competition`.
+        """
+        raise NotImplementedError
+
+    def save(self, clubs, competitions):
+        """Sauvegarde l'état complet des clubs et compétitions."""
+        raise NotImplementedError
+
+    def load_ledger(self):
+        """
+        Charge le registre des réservations cumulées et le rattache au backend.
+
+        Returns:
+            BookingLedger: Registre chargé (vide si le backend ne le persiste pas).
+        """
+        self.ledger = BookingLedger()
+        return self.ledger
+
+    def record_booking(self, clubs, competitions, club, competition, places):
+        """
+        Persiste une réservation déjà appliquée sur `club` et `competition`.
+
+        Args:
+            clubs (list): Tous les clubs (état courant).
+            competitions (list): Toutes les compétitions (état courant).
+            club (Club): Club ayant réservé.
+            competition (Competition): Compétition concernée.
+            places (int): Nombre de places réservées.
+        """
+        self.save(clubs, competitions)
+
+    def record_bookings(self, clubs, competitions, club, bookings):
+        """
+        Persiste d'un seul coup un lot de réservations d'un club, déjà appliqué en mémoire.
+
+        Le lot est écrit entièrement ou pas du tout. Par défaut, une seule
+        sauvegarde complète est faite pour tout le lot.
+
+        Args:
+            clubs (list): Tous les clubs (état courant).
+            competitions (list): Toutes les compétitions (état courant).
+            club (Club): Club ayant réservé.
+            bookings (list): Couples (compétition, places réservées), une compétition au plus une fois.
+        """
+        self.save(clubs, competitions)
+
+    def record_batches(self, clubs, competitions, batches):
+        """
+        Persiste en une seule écriture les lots de réservations de plusieurs clubs.
+
+        Chaque lot est accepté ou refusé en entier ; un backend partagé entre
+        processus peut refuser certains lots sans refuser les autres.
+
+        Args:
+            clubs (list): Tous les clubs (état courant).
+            competitions (list): Toutes les compétitions (état courant).
+            batches (list): Couples (club, liste de couples (compétition, places)).
+
+        Returns:
+            list: Pour chaque lot, None s'il est enregistré, ou le `BookingConflict`
+                  qui l'a refusé (valeurs en stockage après l'écriture).
+        """
+        self.save(clubs, competitions)
+        return [None] * len(batches)
+
+    def close(self):
+        """Libère les ressources du backend."""
+
+
+class JsonStorage(Storage):
+    """
+    Backend historique : deux fichiers JSON réécrits entièrement.
+
+    Chaque fichier est remplacé de façon atomique (fichier temporaire + renommage).
+    Le niveau de durabilité règle le compromis latence / durabilité :
+        - "write" (défaut) : écriture synchrone à chaque réservation, sans fsync ;
+        - "fsync" : écriture synchrone à chaque réservation, avec fsync ;
+        - "group" : écriture différée (group commit). Les réservations marquent les
+          fichiers comme modifiés ; un thread d'écriture regroupe toutes les
+          modifications survenues pendant `group_commit_window` secondes en une
+          seule écriture (avec fsync) des seuls fichiers modifiés. L'état est
+          copié sous `copy_guard` puis écrit hors de ce contexte. Une dernière
+          écriture est garantie à l'arrêt du processus.
+
+    Si `snapshot_path` est fourni, un instantané binaire (voir `snapshot`) est
+    écrit après chaque écriture des fichiers JSON ; au démarrage, il est lu à la
+    place des fichiers JSON tant qu'il n'est pas plus ancien qu'eux.
+
+    Si `ledger_path` est fourni, le registre des réservations cumulées est écrit
+    dans ce troisième fichier JSON, en même temps que les deux autres.
+    """
+
+    DURABILITY_LEVELS = ("write", "fsync", "group")
+
+    def __init__(
+        self,
+        clubs_path="clubs.json",
+        competitions_path="competitions.json",
+        durability="write",
+        group_commit_window=0.05,
+        snapshot_path=None,
+        ledger_path=None,
+    ):
+        if durability not in self.DURABILITY_LEVELS:
+            raise ValueError(f"Unknown durability level: {durability}")
+
+        self.clubs_path = clubs_path
+        self.competitions_path = competitions_path
+        self.snapshot_path = snapshot_path
+        self.ledger_path = ledger_path
+        self.durability = durability
+        self.group_commit_window = group_commit_window
+        # Contexte pris le temps de copier l'état d'une écriture groupée, pour n'écrire
+        # aucune réservation à moitié appliquée (ex. tous les verrous de réservation)
+        self.copy_guard = nullcontext
+        # Surveillance optionnelle des modifications extérieures (voir `reloader.DataWatcher`)
+        self.watcher = None
+        self._lock = threading.Lock()
+        self._pending = threading.Condition()
+        self._dirty = set()
+        self._state = None
+        self._closing = False
+        self._writer = None
+
+        if durability == "group":
+            self._writer = threading.Thread(target=self._run_writer, name="json-group-commit", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+
+    def load(self):
+        if self.snapshot_path:
+            try:
+                clubs, competitions, _, _ = read_fresh_snapshot(
+                    self.snapshot_path, self.clubs_path, self.competitions_path
+                )
+                return clubs, competitions
+            except SnapshotError:
+                pass
+        return load_models(self.clubs_path, self.competitions_path)
+
+    def load_ledger(self):
+        if self.ledger_path and os.path.exists(self.ledger_path):
+            self.ledger = BookingLedger.from_records(iter_records(self.ledger_path, "bookings"))
+        else:
+            self.ledger = BookingLedger()
+        return self.ledger
+
+    def save(self, clubs, competitions):
+        """
+        Sauvegarde immédiatement les données de clubs et compétitions (et le registre
+        des réservations) dans leurs fichiers JSON.
+        """
+        with self._pending:
+            self._dirty.clear()
+        self._write(clubs, competitions, ("clubs", "competitions", "bookings"), fsync=self.durability != "write")
+
+    def record_booking(self, clubs, competitions, club, competition, places):
+        if self.durability == "group":
+            self.mark_dirty(clubs, competitions, "clubs", "competitions", "bookings")
+        else:
+            self.save(clubs, competitions)
+
+    def record_bookings(self, clubs, competitions, club, bookings):
+        self.record_booking(clubs, competitions, club, None, None)
+
+    def record_batches(self, clubs, competitions, batches):
+        self.record_booking(clubs, competitions, None, None, None)
+        return [None] * len(batches)
+
+    def mark_dirty(self, clubs, competitions, *files):
+        """
+        Signale au thread d'écriture que des fichiers doivent être réécrits.
+
+        Args:
+            clubs (list): État courant des clubs.
+            competitions (list): État courant des compétitions.
+            *files: Fichiers modifiés parmi "clubs", "competitions" et "bookings".
+        """
+        with self._pending:
+            self._state = (clubs, competitions)
+            self._dirty.update(files)
+            self._pending.notify()
+
+    def flush(self):
+        """
+        Écrit immédiatement les fichiers marqués comme modifiés (avec fsync).
+
+        Les enregistrements sont copiés sous `copy_guard`, puis écrits hors de
+        ce contexte : les réservations ne sont suspendues que le temps de la copie.
+        """
+        with self._pending:
+            dirty, self._dirty = self._dirty, set()
+            state = self._state
+        if dirty:
+            with self.copy_guard():
+                clubs, competitions, bookings = self._copy(*state, dirty)
+            self._write(clubs, competitions, sorted(dirty), fsync=True, bookings=bookings)
+
+    def close(self):
+        """Arrête le thread d'écriture puis effectue la dernière écriture en attente."""
+        if self._writer is not None:
+            with self._pending:
+                self._closing = True
+                self._pending.notify()
+            self._writer.join()
+            self._writer = None
+        self.flush()
+
+    def _run_writer(self):
+        """Boucle du thread d'écriture groupée."""
+        while True:
+            with self._pending:
+                while not self._dirty and not self._closing:
+                    self._pending.wait()
+                if self._closing:
+                    return
+            # Fenêtre de regroupement : les réservations suivantes rejoignent la même écriture
+            time.sleep(self.group_commit_window)
+            self.flush()
+
+    def _copy(self, clubs, competitions, files):
+        """
+        Copie les enregistrements des fichiers à écrire (et de l'instantané).
+
+        Returns:
+            tuple: (clubs, compétitions, réservations), None pour ce qui n'est pas écrit.
+        """
+        snapshot = bool(self.snapshot_path)
+        return (
+            [club.to_dict() for club in clubs] if snapshot or "clubs" in files else None,
+            [competition.to_dict() for competition in competitions] if snapshot or "competitions" in files else None,
+            self.ledger.to_records() if "bookings" in files and self.ledger is not None else None,
+        )
+
+    def _write(self, clubs, competitions, files, fsync, bookings=None):
+        """
+        Écrit les fichiers demandés.
+
+        Les modèles portent déjà des compteurs entiers : aucune normalisation n'est
+        nécessaire avant sérialisation. Les écritures sont sérialisées : deux
+        threads ne réécrivent jamais les fichiers en même temps.
+
+        Si un fichier surveillé a été modifié par un tiers depuis sa dernière
+        version connue, il n'est pas écrasé : le rechargement à chaud fusionne
+        d'abord la modification, puis réécrit l'état complet.
+
+        Les réservations cumulées sont lues dans le registre, sauf si leurs
+        enregistrements sont fournis (`bookings`).
+        """
+        with self._lock:
+            for name, path, records in (
+                ("clubs", self.clubs_path, clubs),
+                ("competitions", self.competitions_path, competitions),
+            ):
+                if name not in files:
+                    continue
+                if self.watcher is not None and self.watcher.changed_externally(path):
+                    continue
+                write_json_atomic(path, {name: records}, fsync=fsync, indent=4)
+                if self.watcher is not None:
+                    self.watcher.seen(path, records)
+
+            if "bookings" in files and self.ledger_path and self.ledger is not None:
+                watched = self.watcher is not None and self.watcher.watches(self.ledger_path)
+                if not (watched and self.watcher.changed_externally(self.ledger_path)):
+                    if bookings is None:
+                        bookings = self.ledger.to_records()
+                    write_json_atomic(self.ledger_path, {"bookings": bookings}, fsync=fsync, indent=4)
+                    if watched:
+                        self.watcher.seen(self.ledger_path, [])
+
+            if self.snapshot_path:
+                write_snapshot(self.snapshot_path, clubs, competitions, fsync=fsync)
+
+
+class JournalStorage(Storage):
+    """
+    Backend JSON avec journal des réservations en ajout seul (voir `journal.BookingJournal`).
+
+    Chaque réservation ajoute une ligne au journal ; une sauvegarde complète écrit
+    un nouvel instantané et vide le journal.
+    """
+
+    def __init__(self, journal_path, clubs_path="clubs.json", competitions_path="competitions.json", **options):
+        self.journal = BookingJournal(journal_path, clubs_path, competitions_path, **options)
+
+    def load(self):
+        return to_models(*self.journal.load())
+
+    def load_ledger(self):
+        self.ledger = self.journal.load_ledger()
+        return self.ledger
+
+    def save(self, clubs, competitions):
+        self.journal.checkpoint(clubs, competitions, self.ledger)
+
+    def record_booking(self, clubs, competitions, club, competition, places):
+        self.journal.append(club["name"], competition["name"], places)
+
+    def record_bookings(self, clubs, competitions, club, bookings):
+        self.journal.append_batch(club["name"], [(competition["name"], places) for competition, places in bookings])
+
+    def record_batches(self, clubs, competitions, batches):
+        self.journal.append_batches(
+            [
+                (club["name"], [(competition["name"], places) for competition, places in bookings])
+                for club, bookings in batches
+            ]
+        )
+        return [None] * len(batches)
+
+    def close(self):
+        self.journal.close()
+
+
+class SqliteStorage(Storage):
+    """
+    Backend SQLite en mode WAL.
+
+    Les clubs et compétitions sont stockés dans deux tables indexées (email et nom
+    des clubs, nom des compétitions). Une réservation est une unique transaction
+    (BEGIN IMMEDIATE) qui revérifie puis met à jour deux lignes, ce qui permet à
+    plusieurs processus de partager la même base de façon cohérente.
+
+    Si la base est vide au premier démarrage, elle est initialisée à partir des
+    fichiers JSON.
+
+    Le registre des réservations cumulées est une troisième table, mise à jour
+    dans la même transaction que les compteurs. La limite de `max_places` places
+    par club et par compétition y est revérifiée : elle tient aussi entre processus
+    (None : pas de limite).
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS clubs (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            points INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS clubs_email ON clubs (email);
+        CREATE INDEX IF NOT EXISTS clubs_name ON clubs (name);
+        CREATE TABLE IF NOT EXISTS competitions (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            date TEXT NOT NULL,
+            numberOfPlaces INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS competitions_name ON competitions (name);
+        CREATE TABLE IF NOT EXISTS bookings (
+            club TEXT NOT NULL,
+            competition TEXT NOT NULL,
+            places INTEGER NOT NULL,
+            PRIMARY KEY (club, competition)
+        );
+    """
+    # Ajout de places au total d'un club sur une compétition
+    ADD_BOOKING = """
+        INSERT INTO bookings (club, competition, places) VALUES (?, ?, ?)
+        ON CONFLICT (club, competition) DO UPDATE SET places = places + excluded.places
+    """
+
+    def __init__(
+        self,
+        database,
+        clubs_path="clubs.json",
+        competitions_path="competitions.json",
+        max_places=MAX_PLACES_PER_COMPETITION,
+    ):
+        self.database = database
+        self.max_places = max_places
+        self.clubs_path = clubs_path
+        self.competitions_path = competitions_path
+        # Une connexion par thread : les connexions sqlite3 ne se partagent pas entre threads
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+        conn = self._connection()
+        conn.executescript(self.SCHEMA)
+        if conn.execute("SELECT 1 FROM clubs UNION ALL SELECT 1 FROM competitions LIMIT 1").fetchone() is None:
+            self.save(*load_models(clubs_path, competitions_path))
+
+    def load(self):
+        conn = self._connection()
+        clubs = [Club(*row) for row in conn.execute("SELECT name, email, points FROM clubs ORDER BY id")]
+        competitions = [
+            Competition(*row) for row in conn.execute("SELECT name, date, numberOfPlaces FROM competitions ORDER BY id")
+        ]
+        return clubs, competitions
+
+    def load_ledger(self):
+        rows = self._connection().execute("SELECT club, competition, places FROM bookings ORDER BY rowid")
+        self.ledger = BookingLedger.from_records(
+            {"club": club, "competition": competition, "places": places} for club, competition, places in rows
+        )
+        return self.ledger
+
+    def save(self, clubs, competitions):
+        conn = self._connection()
+        with _Transaction(conn):
+            conn.execute("DELETE FROM clubs")
+            conn.executemany(
+                "INSERT INTO clubs (name, email, points) VALUES (?, ?, ?)",
+                [(club.name, club.email, club.points) for club in clubs],
+            )
+            conn.execute("DELETE FROM competitions")
+            conn.executemany(
+                "INSERT INTO competitions (name, date, numberOfPlaces) VALUES (?, ?, ?)",
+                [(c.name, c["date"], c.numberOfPlaces) for c in competitions],
+            )
+            if self.ledger is not None:
+                conn.execute("DELETE FROM bookings")
+                conn.executemany(
+                    "INSERT INTO bookings (club, competition, places) VALUES (?, ?, ?)",
+                    [(r["club"], r["competition"], r["places"]) for r in self.ledger.to_records()],
+                )
+
+    def record_booking(self, clubs, competitions, club, competition, places):
+        """
+        Vérifie et décrémente les deux compteurs dans une seule transaction.
+
+        Raises:
+            BookingConflict: si la base n'a plus assez de points ou de places, ou si
+                la limite de places par compétition serait dépassée (modifiés par
+                un autre processus).
+        """
+        conn = self._connection()
+        with _Transaction(conn):
+            (points,) = conn.execute("SELECT points FROM clubs WHERE name = ?", (club["name"],)).fetchone()
+            (places_left,) = conn.execute(
+                "SELECT numberOfPlaces FROM competitions WHERE name = ?", (competition["name"],)
+            ).fetchone()
+            booked = self._booked(conn, club["name"], competition["name"])
+            if points < places or places_left < places or not self._within_cap(booked, places):
+                raise BookingConflict(points, places_left, {competition["name"]: booked})
+
+            conn.execute("UPDATE clubs SET points = points - ? WHERE name = ?", (places, club["name"]))
+            conn.execute(
+                "UPDATE competitions SET numberOfPlaces = numberOfPlaces - ? WHERE name = ?",
+                (places, competition["name"]),
+            )
+            conn.execute(self.ADD_BOOKING, (club["name"], competition["name"], places))
+
+    def record_bookings(self, clubs, competitions, club, bookings):
+        """
+        Vérifie et décrémente les compteurs de tout le lot dans une seule transaction.
+
+        Raises:
+            BookingConflict: si la base n'a plus assez de points ou de places pour
+                l'une des réservations, ou si l'une dépasserait la limite de places
+                par compétition ; `places` donne alors les places de chaque
+                compétition du lot.
+        """
+        conn = self._connection()
+        with _Transaction(conn):
+            (points,) = conn.execute("SELECT points FROM clubs WHERE name = ?", (club["name"],)).fetchone()
+            places_left, booked = self._batch_state(conn, club, bookings)
+            total = sum(places for _, places in bookings)
+            if (
+                points < total
+                or any(places_left[c["name"]] < places for c, places in bookings)
+                or not all(self._within_cap(booked[c["name"]], places) for c, places in bookings)
+            ):
+                raise BookingConflict(points, places_left, booked)
+
+            conn.execute("UPDATE clubs SET points = points - ? WHERE name = ?", (total, club["name"]))
+            conn.executemany(
+                "UPDATE competitions SET numberOfPlaces = numberOfPlaces - ? WHERE name = ?",
+                [(places, competition["name"]) for competition, places in bookings],
+            )
+            conn.executemany(
+                self.ADD_BOOKING, [(club["name"], competition["name"], places) for competition, places in bookings]
+            )
+
+    def record_batches(self, clubs, competitions, batches):
+        """
+        Applique plusieurs lots dans une seule transaction, chacun sous un point de sauvegarde.
+
+        Un lot dont la revérification échoue est annulé (ROLLBACK TO) sans annuler
+        les autres ; son conflit porte les valeurs de la base en fin de transaction.
+        """
+        conn = self._connection()
+        rejected = []
+        with _Transaction(conn):
+            for index, (club, bookings) in enumerate(batches):
+                conn.execute("SAVEPOINT batch")
+                total = sum(places for _, places in bookings)
+                accepted = all(
+                    self._within_cap(self._booked(conn, club["name"], competition["name"]), places)
+                    for competition, places in bookings
+                )
+                if accepted:
+                    cursor = conn.execute(
+                        "UPDATE clubs SET points = points - ? WHERE name = ? AND points >= ?",
+                        (total, club["name"], total),
+                    )
+                    accepted = cursor.rowcount > 0
+                for competition, places in bookings:
+                    if accepted:
+                        cursor = conn.execute(
+                            "UPDATE competitions SET numberOfPlaces = numberOfPlaces - ? "
+                            "WHERE name = ? AND numberOfPlaces >= ?",
+                            (places, competition["name"], places),
+                        )
+                        accepted = cursor.rowcount > 0
+                if accepted:
+                    conn.executemany(
+                        self.ADD_BOOKING,
+                        [(club["name"], competition["name"], places) for competition, places in bookings],
+                    )
+                conn.execute("RELEASE batch" if accepted else "ROLLBACK TO batch")
+                if not accepted:
+                    conn.execute("RELEASE batch")
+                    rejected.append(index)
+
+            conflicts = [None] * len(batches)
+            for index in rejected:
+                club, bookings = batches[index]
+                (points,) = conn.execute("SELECT points FROM clubs WHERE name = ?", (club["name"],)).fetchone()
+                conflicts[index] = BookingConflict(points, *self._batch_state(conn, club, bookings))
+        return conflicts
+
+    def _batch_state(self, conn, club, bookings):
+        """
+        Places restantes de chaque compétition d'un lot et places déjà réservées par le club.
+
+        Returns:
+            tuple: ({compétition: places restantes}, {compétition: places réservées})
+        """
+        places_left, booked = {}, {}
+        for competition, _ in bookings:
+            (places_left[competition["name"]],) = conn.execute(
+                "SELECT numberOfPlaces FROM competitions WHERE name = ?", (competition["name"],)
+            ).fetchone()
+            booked[competition["name"]] = self._booked(conn, club["name"], competition["name"])
+        return places_left, booked
+
+    @staticmethod
+    def _booked(conn, club_name, competition_name):
+        """Places réservées en base par un club sur une compétition."""
+        row = conn.execute(
+            "SELECT places FROM bookings WHERE club = ? AND competition = ?", (club_name, competition_name)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _within_cap(self, booked, places):
+        """Indique si `places` de plus restent sous la limite de places par compétition."""
+        return self.max_places is None or booked + places <= self.max_places
+
+    def close(self):
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+        self._local = threading.local()
+
+    def _connection(self):
+        """Retourne la connexion du thread courant, en l'ouvrant si besoin."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.database, isolation_level=None, check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+
+class _Transaction:
+    """Transaction SQLite d'écriture : BEGIN IMMEDIATE, puis COMMIT ou ROLLBACK."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+def create_storage(config):
+    """
+    Construit le backend de stockage choisi par la configuration.
+
+    Clés utilisées :
+        - STORAGE_BACKEND : "json" (défaut), "journal" ou "sqlite"
+        - CLUBS_FILE, COMPETITIONS_FILE : fichiers JSON de données
+        - SNAPSHOT_FILE : instantané binaire des backends "json" et "journal" (désactivé si vide)
+        - LEDGER_FILE : registre des réservations cumulées des backends "json" et "journal" (désactivé si vide)
+        - JSON_DURABILITY, GROUP_COMMIT_WINDOW : backend "json"
+        - JOURNAL_FILE, JOURNAL_COMPACT_THRESHOLD, JOURNAL_FSYNC : backend "journal"
+        - SQLITE_DATABASE : backend "sqlite"
+
+    Args:
+        config (dict): Configuration de l'application (ex. `app.config`).
+
+    Returns:
+        Storage: Backend initialisé.
+
+    Raises:
+        ValueError: si le backend demandé est inconnu.
+    """
+    backend = config["STORAGE_BACKEND"]
+    paths = {"clubs_path": config["CLUBS_FILE"], "competitions_path": config["COMPETITIONS_FILE"]}
+
+    if backend == "json":
+        return JsonStorage(
+            durability=config["JSON_DURABILITY"],
+            group_commit_window=config["GROUP_COMMIT_WINDOW"],
+            snapshot_path=config.get("SNAPSHOT_FILE"),
+            ledger_path=config.get("LEDGER_FILE"),
+            **paths,
+        )
+    if backend == "journal":
+        return JournalStorage(
+            config["JOURNAL_FILE"],
+            compact_threshold=config["JOURNAL_COMPACT_THRESHOLD"],
+            fsync=config["JOURNAL_FSYNC"],
+            snapshot_path=config.get("SNAPSHOT_FILE"),
+            ledger_path=config.get("LEDGER_FILE"),
+            **paths,
+        )
+    if backend == "sqlite":
+        return SqliteStorage(config["SQLITE_DATABASE"], **paths)
+    raise ValueError(f"Unknown storage backend: {backend}")
@@ -0,0 +1,14 @@
+import pytest
+
+from ledger import BookingLedger
+
+
+@pytest.fixture(autouse=True)
+def empty_ledger(mocker):
+    """
+    Registre des réservations vide pour chaque test : les places réservées par un
+    test ne comptent pas dans la limite par compétition des tests suivants.
+    """
+    ledger = BookingLedger()
+    mocker.patch("server.ledger", ledger)
+    return ledger
@@ -0,0 +1,257 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import server
+from storage import create_storage
+from tests.tests_performance.datagen import generate_clubs, generate_competitions, write_fixtures
+
+ROUTES = ("index", "showSummary", "book", "purchasePlaces", "points")
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_THRESHOLD = 0.20
+
+
+def percentile(values, fraction):
+    """Percentile (méthode du rang le plus proche) d'une liste triée."""
+    return values[min(int(fraction * len(values)), len(values) - 1)]
+
+
+def make_requests(clubs, competitions, seed=0):
+    """
+    Fabrique, pour chaque route, une fonction qui envoie une requête aléatoire
+    (club et compétition tirés au hasard, compétitions à venir pour les réservations).
+
+    Args:
+        clubs (list): Clubs chargés.
+        competitions (list): Compétitions chargées.
+        seed (int): Graine du tirage (requêtes reproductibles).
+
+    Returns:
+        dict: {route: fonction(client) -> réponse}
+    """
+    rng = random.Random(seed)
+    now = datetime.now()
+    upcoming = [c for c in competitions if c.date >= now]
+
+    def index(client):
+        return client.get("/")
+
+    def show_summary(client):
+        return client.post("/showSummary", data={"email": rng.choice(clubs)["email"]})
+
+    def book(client):
+        return client.get(f"/book/{rng.choice(upcoming)['name']}/{rng.choice(clubs)['name']}")
+
+    def purchase(client):
+        data = {"club": rng.choice(clubs)["name"], "competition": rng.choice(upcoming)["name"], "places": 1}
+        return client.post("/purchasePlaces", data=data)
+
+    def points(client):
+        return client.get("/points")
+
+    return {"index": index, "showSummary": show_summary, "book": book, "purchasePlaces": purchase, "points": points}
+
+
+def measure_route(client, send, requests):
+    """
+    Mesure une route : latences et débit sur `requests` requêtes, puis pic de
+    mémoire (tracemalloc) sur une seconde série plus courte, afin que le suivi
+    des allocations ne fausse pas les latences.
+
+    Returns:
+        dict: Percentiles de latence (ms), débit (requêtes/s) et pic de mémoire (Kio).
+    """
+    send(client)  # préchauffage (gabarits compilés, caches)
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = send(client)
+        latencies.append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            raise RuntimeError(f"Unexpected status {response.status_code}")
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        for _ in range(max(requests // 10, 1)):
+            send(client)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p90_ms": round(percentile(latencies, 0.90) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+        "throughput_rps": round(requests / elapsed, 1),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def temporary_config(directory, clubs, competitions):
+    """
+    Configuration de stockage de l'application dont tous les fichiers
+    (données, instantané, registre des réservations, journal, base SQLite)
+    sont placés dans `directory`, où sont écrits les clubs et compétitions.
+
+    Returns:
+        dict: Configuration utilisable par `create_storage`.
+    """
+    clubs_path, competitions_path = write_fixtures(directory, clubs, competitions)
+    config = dict(server.app.config)
+    config.update(
+        CLUBS_FILE=clubs_path,
+        COMPETITIONS_FILE=competitions_path,
+        SNAPSHOT_FILE=os.path.join(directory, "snapshot.bin") if config.get("SNAPSHOT_FILE") else None,
+        LEDGER_FILE=os.path.join(directory, "bookings.json"),
+        JOURNAL_FILE=os.path.join(directory, "journal.log"),
+        SQLITE_DATABASE=os.path.join(directory, "gudlft.sqlite3"),
+    )
+    return config
+
+
+def run(sizes=DEFAULT_SIZES, requests=200, routes=ROUTES):
+    """
+    Exécute le benchmark pour chaque taille de jeu de données.
+
+    Les données synthétiques (autant de clubs que de compétitions) sont écrites
+    dans un répertoire temporaire, puis chargées par un backend de stockage
+    construit comme celui de l'application (STORAGE_BACKEND, JSON_DURABILITY...)
+    mais dont tous les fichiers pointent vers ce répertoire : les réservations
+    sont réellement persistées, donc mesurées, sans toucher aux données de
+    l'application, qui sont restaurées à la fin.
+
+    Args:
+        sizes (iterable): Tailles des jeux de données.
+        requests (int): Requêtes mesurées par route.
+        routes (iterable): Routes à mesurer (parmi ROUTES).
+
+    Returns:
+        dict: {"meta": {...}, "results": {taille: {route: mesures}}}
+    """
+    saved = server.clubs, server.competitions, server.ledger, server.storage, server.app.config.get("TESTING")
+    server.app.config["TESTING"] = False
+    results = {}
+    try:
+        for size in sizes:
+            with tempfile.TemporaryDirectory() as directory:
+                config = temporary_config(directory, generate_clubs(size), generate_competitions(size))
+                storage = create_storage(config)
+                try:
+                    clubs, competitions = storage.load()
+                    server.clubs, server.competitions = clubs, competitions
+                    server.ledger, server.storage = storage.load_ledger(), storage
+                    senders = make_requests(clubs, competitions)
+                    with server.app.test_client() as client:
+                        results[str(size)] = {
+                            route: measure_route(client, senders[route], requests) for route in routes
+                        }
+                finally:
+                    storage.close()
+    finally:
+        server.clubs, server.competitions, server.ledger, server.storage, server.app.config["TESTING"] = saved
+
+    meta = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "requests": requests,
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare des résultats à une référence.
+
+    Une mesure est une régression si sa latence médiane (p50) ou p99 dépasse
+    celle de la référence de plus de `threshold` (ex. 0.20 = +20 %), ou si son
+    débit baisse de plus de `threshold`.
+
+    Returns:
+        list: Régressions, sous forme de messages lisibles.
+    """
+    regressions = []
+    for size, routes in current["results"].items():
+        for route, measures in routes.items():
+            reference = baseline["results"].get(size, {}).get(route)
+            if reference is None:
+                continue
+            for metric in ("p50_ms", "p99_ms"):
+                if measures[metric] > reference[metric] * (1 + threshold):
+                    regressions.append(
+                        f"{route} @ {size}: {metric} {reference[metric]} -> {measures[metric]}"
+                    )
+            if measures["throughput_rps"] < reference["throughput_rps"] * (1 - threshold):
+                regressions.append(
+                    f"{route} @ {size}: throughput_rps {reference['throughput_rps']} -> {measures['throughput_rps']}"
+                )
+    return regressions
+
+
+def format_report(report):
+    """Tableau texte des résultats (une ligne par taille et par route)."""
+    lines = [
+        f"{'size':>8} {'route':<15} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9} "
+        f"{'req/s':>9} {'peak KiB':>10}"
+    ]
+    for size, routes in report["results"].items():
+        for route, m in routes.items():
+            lines.append(
+                f"{size:>8} {route:<15} {m['p50_ms']:>9} {m['p90_ms']:>9} {m['p99_ms']:>9} {m['max_ms']:>9} "
+                f"{m['throughput_rps']:>9} {m['peak_kib']:>10}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+    Point d'entrée en ligne de commande.
+
+    Exemples (depuis la racine du dépôt) :
+        python -m tests.tests_performance.benchmark --output benchmark.json
+        python -m tests.tests_performance.benchmark --compare benchmark.json --threshold 0.25
+
+    Returns:
+        int: Code de sortie (1 si des régressions sont détectées).
+    """
+    parser = argparse.ArgumentParser(description="Benchmark every route on synthetic datasets.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="dataset sizes")
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per route")
+    parser.add_argument("--routes", nargs="+", choices=ROUTES, default=list(ROUTES), help="routes to measure")
+    parser.add_argument("--output", help="write results to this JSON file (e.g. a new baseline)")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.requests, args.routes)
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regression beyond {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+import argparse
+import bisect
+import itertools
+import json
+import os
+import random
+from datetime import datetime, timedelta
+
+from models import DATE_FORMAT
+
+
+def generate_clubs(count, points=1000):
+    """
+    Génère des clubs au format des fichiers JSON.
+
+    Args:
+        count (int): Nombre de clubs.
+        points (int): Points de départ de chaque club.
+
+    Returns:
+        list: Clubs {"name", "email", "points"}.
+    """
+    return [
+        {"name": f"Club {i:06d}", "email": f"secretary{i}@club{i}.example", "points": str(points)} for i in range(count)
+    ]
+
+
+def generate_competitions(count, places=1000, past_ratio=0.5, now=None, seed=0):
+    """
+    Génère des compétitions au format des fichiers JSON, réparties sur deux ans
+    autour de `now` (une part `past_ratio` d'entre elles est déjà passée).
+
+    Args:
+        count (int): Nombre de compétitions.
+        places (int): Places de départ de chaque compétition.
+        past_ratio (float): Proportion de compétitions passées.
+        now (datetime, optional): Date de référence (maintenant par défaut).
+        seed (int): Graine du générateur (données reproductibles).
+
+    Returns:
+        list: Compétitions {"name", "date", "numberOfPlaces"}.
+    """
+    rng = random.Random(seed)
+    now = (now or datetime.now()).replace(microsecond=0)
+    competitions = []
+    for i in range(count):
+        days = rng.uniform(1, 365)
+        date = now - timedelta(days=days) if rng.random() < past_ratio else now + timedelta(days=days)
+        competitions.append(
+            {"name": f"Competition {i:06d}", "date": date.strftime(DATE_FORMAT), "numberOfPlaces": str(places)}
+        )
+    return competitions
+
+
+def write_fixtures(directory, clubs, competitions):
+    """
+    Écrit les clubs et compétitions dans `clubs.json` et `competitions.json`.
+
+    Returns:
+        tuple: (chemin clubs.json, chemin competitions.json)
+    """
+    os.makedirs(directory, exist_ok=True)
+    clubs_path = os.path.join(directory, "clubs.json")
+    competitions_path = os.path.join(directory, "competitions.json")
+    with open(clubs_path, "w") as f:
+        json.dump({"clubs": clubs}, f, indent=4)
+    with open(competitions_path, "w") as f:
+        json.dump({"competitions": competitions}, f, indent=4)
+    return clubs_path, competitions_path
+
+
+def build_dataset(clubs=1000, competitions=100, points=1000, places=1000, hot_places=None, seed=0):
+    """
+    Génère un jeu de données complet et reproductible pour les tests de charge.
+
+    La première compétition à venir est la compétition « phare » : avec
+    `hot_places`, son nombre de places est limité pour qu'elle puisse être
+    épuisée pendant le test.
+
+    Args:
+        clubs (int): Nombre de clubs.
+        competitions (int): Nombre de compétitions.
+        points (int): Points de départ de chaque club.
+        places (int): Places de départ de chaque compétition.
+        hot_places (int, optional): Places de la compétition phare.
+        seed (int): Graine du générateur.
+
+    Returns:
+        tuple: (clubs, compétitions, indices des compétitions à venir)
+    """
+    club_records = generate_clubs(clubs, points)
+    competition_records = generate_competitions(competitions, places, seed=seed)
+    now = datetime.now()
+    upcoming = [
+        i for i, competition in enumerate(competition_records)
+        if datetime.strptime(competition["date"], DATE_FORMAT) >= now
+    ]
+    if hot_places is not None and upcoming:
+        competition_records[upcoming[0]]["numberOfPlaces"] = str(hot_places)
+    return club_records, competition_records, upcoming
+
+
+class ZipfSampler:
+    """
+    Tire des indices entre 0 et `count` - 1 selon une loi de Zipf : l'indice de
+    rang r est choisi avec un poids 1 / (r + 1) ** exponent. Avec un exposant nul,
+    le tirage est uniforme ; plus il est grand, plus les premiers indices
+    concentrent les tirages (clubs et compétitions « chauds »).
+    """
+
+    def __init__(self, count, exponent=1.0, rng=None):
+        self._cumulative = list(itertools.accumulate(1 / (rank + 1) ** exponent for rank in range(count)))
+        self._rng = rng or random.Random()
+
+    def sample(self):
+        """Tire un indice."""
+        return bisect.bisect_left(self._cumulative, self._rng.random() * self._cumulative[-1])
+
+
+def main(argv=None):
+    """
+    Écrit un jeu de données synthétique (clubs.json et competitions.json).
+
+    Exemple (depuis la racine du dépôt) :
+        python -m tests.tests_performance.datagen load_data --clubs 1000 --competitions 100 --hot-places 500
+    """
+    parser = argparse.ArgumentParser(description="Write synthetic clubs.json and competitions.json files.")
+    parser.add_argument("directory", help="output directory")
+    parser.add_argument("--clubs", type=int, default=1000, help="number of clubs")
+    parser.add_argument("--competitions", type=int, default=100, help="number of competitions")
+    parser.add_argument("--points", type=int, default=1000, help="starting points of each club")
+    parser.add_argument("--places", type=int, default=1000, help="starting places of each competition")
+    parser.add_argument("--hot-places", type=int, help="places of the first upcoming competition")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args(argv)
+
+    clubs, competitions, _ = build_dataset(
+        args.clubs, args.competitions, args.points, args.places, args.hot_places, args.seed
+    )
+    for path in write_fixtures(args.directory, clubs, competitions):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,73 +1,197 @@
-from locust import HttpUser, TaskSet, task, between
+import itertools
+import json
+import os
+import random
 
-# Email et nom d'un club existant dans clubs.json
-CLUB_EMAIL = "john@simplylift.co"
-CLUB_NAME = "Simply Lift"
-COMPETITION_NAME = "Spring Festival"
+from locust import HttpUser, between, events, task
+from locust.runners import WorkerRunner
 
+from tests.tests_performance.datagen import ZipfSampler, build_dataset, write_fixtures
 
-class SecretaryScenario(TaskSet):
+# Poids des actions de chaque profil de charge
+PROFILES = {
+    # Parcours complet d'un secrétaire : connexion, compétition, achat, points
+    "journey": None,
+    # Surtout des consultations, quelques réservations
+    "read-heavy": {"index": 2, "summary": 4, "book": 4, "purchase": 1, "points": 4},
+    # Surtout des réservations, réparties sur les clubs et compétitions tirés
+    "booking-heavy": {"summary": 1, "book": 1, "purchase": 8},
+    # Tous les utilisateurs réservent la même compétition jusqu'à épuisement
+    "sellout": {"book": 1, "purchase": 9},
+}
+
+BOOKED = b"Great-booking complete!"
+SOLD_OUT = b"Not enough places left in this competition."
+CAPPED = b"Cannot book more than 12 places per competition."
+
+# Jeu de données du test en cours (identique dans tous les processus : il est déterminé par les options)
+dataset = {}
+# Attribution de clubs distincts aux utilisateurs (distribution "distinct")
+next_user = itertools.count()
+
+
+@events.init_command_line_parser.add_listener
+def add_options(parser):
+    """Options du jeu de données et du profil de charge (aussi lisibles depuis l'environnement)."""
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="journey", env_var="GUDLFT_LOAD_PROFILE")
+    parser.add_argument("--clubs", type=int, default=1000, env_var="GUDLFT_LOAD_CLUBS", help="number of clubs")
+    parser.add_argument(
+        "--competitions", type=int, default=100, env_var="GUDLFT_LOAD_COMPETITIONS", help="number of competitions"
+    )
+    parser.add_argument(
+        "--distribution",
+        choices=["distinct", "uniform", "zipf"],
+        default="zipf",
+        env_var="GUDLFT_LOAD_DISTRIBUTION",
+        help="how users pick clubs and competitions",
+    )
+    parser.add_argument("--zipf-exponent", type=float, default=1.1, env_var="GUDLFT_LOAD_ZIPF_EXPONENT")
+    parser.add_argument(
+        "--hot-places",
+        type=int,
+        default=500,
+        env_var="GUDLFT_LOAD_HOT_PLACES",
+        help="places of the competition sold out by the sellout profile",
+    )
+    parser.add_argument("--seed", type=int, default=0, env_var="GUDLFT_LOAD_SEED")
+    parser.add_argument(
+        "--data-dir",
+        default="tests/tests_performance/load_data",
+        env_var="GUDLFT_LOAD_DATA_DIR",
+        help="where the reset hook writes clubs.json, competitions.json and bookings.json",
+    )
+
+
+def generate(options):
+    """Génère le jeu de données décrit par les options de la ligne de commande."""
+    return build_dataset(options.clubs, options.competitions, hot_places=options.hot_places, seed=options.seed)
+
+
+@events.init.add_listener
+def load_dataset(environment, **kwargs):
+    """Calcule les noms des clubs et compétitions utilisés par les utilisateurs simulés."""
+    if environment.parsed_options is None:
+        return
+    clubs, competitions, upcoming = generate(environment.parsed_options)
+    dataset.update(clubs=clubs, competitions=competitions, upcoming=upcoming)
+
+
+@events.test_start.add_listener
+def reset_data(environment, **kwargs):
     """
-    Scénario de test pour un secrétaire de club utilisant Locust.
+    Réinitialise les fichiers de données au début de chaque test, pour que les
+    exécutions partent du même état et restent comparables.
+
+    Le registre des places réservées (`bookings.json`) est vidé : la limite de
+    places par compétition étant cumulative, il repartirait sinon du test précédent.
 
-    Ce scénario simule le parcours suivant :
-    1. Connexion avec l'email du secrétaire
-    2. Sélection d'une compétition
-    3. Achat de places
-    4. Consultation des points du club
+    L'application doit lire ces fichiers (GUDLFT_CLUBS_FILE, GUDLFT_COMPETITIONS_FILE
+    et GUDLFT_LEDGER_FILE) et les recharger à chaud (GUDLFT_RELOAD_INTERVAL),
+    ou être redémarrée entre deux tests. Seul le processus principal écrit les fichiers.
     """
+    if isinstance(environment.runner, WorkerRunner):
+        return
+    clubs, competitions, _ = generate(environment.parsed_options)
+    write_fixtures(environment.parsed_options.data_dir, clubs, competitions)
+    with open(os.path.join(environment.parsed_options.data_dir, "bookings.json"), "w") as f:
+        json.dump({"bookings": []}, f)
 
-    @task
-    def secretary_journey(self):
-        """Simule le parcours complet du secrétaire sur le site."""
-
-        # 1. Connexion avec l'email du secrétaire
-        with self.client.post("/showSummary", {"email": CLUB_EMAIL}, catch_response=True) as response:
-            if response.elapsed.total_seconds() > 5:
-                response.failure("Connexion took too long (>5s)")
-            elif response.status_code != 200:
-                response.failure(f"Unexpected status {response.status_code}")
-            else:
-                response.success()
-
-        # 2. Sélection de la compétition
-        with self.client.get(f"/book/{COMPETITION_NAME}/{CLUB_NAME}", catch_response=True) as response:
-            if response.elapsed.total_seconds() > 5:
-                response.failure("Loading competition took too long (>5s)")
-            elif response.status_code != 200:
-                response.failure(f"Unexpected status {response.status_code}")
-            else:
-                response.success()
-
-        # 3. Achat de places
-        # Ici, on simule l'achat de 2 places pour la compétition sélectionnée
-        with self.client.post(
-            "/purchasePlaces", {"club": CLUB_NAME, "competition": COMPETITION_NAME, "places": "2"}, catch_response=True
-        ) as response:
-            if response.elapsed.total_seconds() > 2:
-                response.failure("Purchase took too long (>2s)")
-            elif response.status_code != 200:
-                response.failure(f"Unexpected status {response.status_code}")
-            else:
-                response.success()
-
-        # 4. Consultation des points (page publique)
-        with self.client.get("/points", catch_response=True) as response:
-            if response.elapsed.total_seconds() > 5:
-                response.failure("Points page took too long (>5s)")
-            elif response.status_code != 200:
-                response.failure(f"Unexpected status {response.status_code}")
-            else:
-                response.success()
+
+def check(response, limit, expected=(BOOKED,)):
+    """
+    Valide une réponse : statut 200, durée sous `limit` secondes et, pour un
+    achat, un des messages attendus dans la page.
+    """
+    if response.elapsed.total_seconds() > limit:
+        response.failure(f"Took too long (>{limit}s)")
+    elif response.status_code != 200:
+        response.failure(f"Unexpected status {response.status_code}")
+    elif expected is not None and not any(message in response.content for message in expected):
+        response.failure("Booking refused")
+    else:
+        response.success()
 
 
 class WebsiteUser(HttpUser):
     """
-    Classe représentant un utilisateur simulé du site web.
+    Utilisateur simulé : un secrétaire de club.
 
-    Elle exécute les tâches définies dans SecretaryScenario avec des pauses
-    aléatoires entre les actions pour simuler un comportement humain.
+    Chaque utilisateur représente un club et choisit les compétitions selon
+    la distribution demandée :
+        - distinct : chaque utilisateur a son propre club (dans la limite des clubs générés) ;
+        - uniform : clubs et compétitions tirés au hasard ;
+        - zipf : quelques clubs et compétitions concentrent la plupart des requêtes.
+
+    Les actions suivent le profil demandé (voir PROFILES). Les requêtes sont
+    regroupées par route dans les statistiques, quel que soit le club ou la compétition.
     """
 
-    tasks = [SecretaryScenario]
-    wait_time = between(1, 5)  # Pause aléatoire entre 1 et 5 secondes entre les scénarios
+    wait_time = between(1, 5)  # Pause aléatoire entre 1 et 5 secondes entre les actions
+
+    def on_start(self):
+        """Choisit le club de l'utilisateur et prépare les tirages."""
+        options = self.environment.parsed_options
+        self.profile = options.profile
+        self.rng = random.Random()
+        clubs, upcoming = dataset["clubs"], dataset["upcoming"]
+        exponent = options.zipf_exponent if options.distribution == "zipf" else 0
+        if options.distribution == "distinct":
+            self.club = clubs[next(next_user) % len(clubs)]
+        else:
+            self.club = clubs[ZipfSampler(len(clubs), exponent, self.rng).sample()]
+        self.competitions = ZipfSampler(len(upcoming), exponent, self.rng)
+        weights = PROFILES[self.profile]
+        if weights is not None:
+            self.actions, self.weights = zip(*weights.items())
+
+    def competition(self):
+        """Compétition visée : la compétition phare pour le profil sellout, sinon un tirage."""
+        upcoming = dataset["upcoming"]
+        index = upcoming[0] if self.profile == "sellout" else upcoming[self.competitions.sample()]
+        return dataset["competitions"][index]["name"]
+
+    @task
+    def step(self):
+        """Exécute le parcours complet, ou une action tirée selon les poids du profil."""
+        if self.profile == "journey":
+            self.summary()
+            competition = self.competition()
+            self.book(competition)
+            self.purchase(competition, places=2)
+            self.points()
+            return
+        action = self.rng.choices(self.actions, self.weights)[0]
+        getattr(self, action)()
+
+    def index(self):
+        """Page d'accueil."""
+        with self.client.get("/", catch_response=True) as response:
+            check(response, 5, expected=None)
+
+    def summary(self):
+        """Connexion avec l'email du secrétaire."""
+        with self.client.post("/showSummary", {"email": self.club["email"]}, catch_response=True) as response:
+            check(response, 5, expected=None)
+
+    def book(self, competition=None):
+        """Sélection d'une compétition."""
+        competition = competition or self.competition()
+        url = f"/book/{competition}/{self.club['name']}"
+        with self.client.get(url, name="/book/[competition]/[club]", catch_response=True) as response:
+            check(response, 5, expected=None)
+
+    def purchase(self, competition=None, places=1):
+        """
+        Achat de places. La limite de places par club et par compétition est un refus
+        attendu (les utilisateurs réservent plusieurs fois les mêmes compétitions), tout
+        comme une compétition épuisée pour le profil sellout.
+        """
+        data = {"club": self.club["name"], "competition": competition or self.competition(), "places": str(places)}
+        expected = (BOOKED, CAPPED, SOLD_OUT) if self.profile == "sellout" else (BOOKED, CAPPED)
+        with self.client.post("/purchasePlaces", data, catch_response=True) as response:
+            check(response, 2, expected)
+
+    def points(self):
+        """Consultation des points (page publique)."""
+        with self.client.get("/points", catch_response=True) as response:
+            check(response, 5, expected=None)
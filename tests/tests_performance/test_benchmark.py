@@ -0,0 +1,53 @@
+import copy
+import json
+import server
+from storage import JsonStorage
+from tests.tests_performance import benchmark
+
+
+def test_benchmark_reports_every_route(mocker):
+    """
+    Vérifie une exécution réduite du benchmark (200 clubs et compétitions) :
+
+        1. Chaque route mesurée a ses percentiles, son débit et son pic de mémoire.
+        2. Les réservations passent par le backend de stockage (persistance mesurée).
+        3. Les données, le registre des réservations et le stockage de l'application sont restaurés.
+    """
+    clubs, competitions, ledger, storage = server.clubs, server.competitions, server.ledger, server.storage
+    record_booking = mocker.spy(JsonStorage, "record_booking")
+
+    report = benchmark.run(sizes=[200], requests=20)
+
+    assert set(report["results"]["200"]) == set(benchmark.ROUTES)
+    for measures in report["results"]["200"].values():
+        assert measures["p50_ms"] <= measures["p90_ms"] <= measures["p99_ms"] <= measures["max_ms"]
+        assert measures["throughput_rps"] > 0
+        assert measures["peak_kib"] > 0
+    assert record_booking.call_count > 0
+    assert all(call.args[0] is not storage for call in record_booking.call_args_list)
+    assert server.clubs is clubs and server.competitions is competitions
+    assert server.ledger is ledger and server.storage is storage
+
+
+def test_compare_flags_regressions(tmp_path):
+    """
+    Vérifie le mode comparaison : une latence p50 doublée est signalée comme
+    régression et fait échouer la ligne de commande, un écart sous le seuil non.
+    """
+    baseline = benchmark.run(sizes=[100], requests=10, routes=["index"])
+    slower = copy.deepcopy(baseline)
+    slower["results"]["100"]["index"]["p50_ms"] *= 2
+    within = copy.deepcopy(baseline)
+    within["results"]["100"]["index"]["p50_ms"] *= 1.1
+
+    assert benchmark.compare(within, baseline, threshold=0.2) == []
+    regressions = benchmark.compare(slower, baseline, threshold=0.2)
+    assert len(regressions) == 1 and "index @ 100: p50_ms" in regressions[0]
+
+    # Référence impossible à tenir : la ligne de commande doit signaler la régression
+    impossible = copy.deepcopy(baseline)
+    impossible["results"]["100"]["index"].update(p50_ms=0.0, p99_ms=0.0)
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(impossible))
+    argv = ["--sizes", "100", "--requests", "10", "--routes", "index", "--compare", str(baseline_path)]
+    assert benchmark.main(argv) == 1
@@ -0,0 +1,69 @@
+import json
+import time
+from storage import JsonStorage
+
+CLUBS = 100000
+COMPETITIONS = 1000
+
+
+def best_of(load, runs=3):
+    """
+    Exécute plusieurs fois un chargement et garde la meilleure durée.
+
+    Returns:
+        tuple: (résultat du dernier chargement, meilleure durée en secondes)
+    """
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = load()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def test_cold_start_snapshot_vs_json(tmp_path):
+    """
+    Compare le temps de chargement au démarrage de 100 000 clubs :
+
+        - depuis les fichiers JSON (lecture incrémentale et conversion en modèles) ;
+        - depuis l'instantané binaire écrit lors de la dernière sauvegarde.
+
+    Les durées sont affichées (pytest -s) ; l'instantané doit donner les mêmes
+    données, plus vite.
+    """
+    clubs_path, competitions_path = tmp_path / "clubs.json", tmp_path / "competitions.json"
+    clubs_path.write_text(
+        json.dumps(
+            {
+                "clubs": [
+                    {"name": f"Club {i}", "email": f"club{i}@example.com", "points": str(i % 30)}
+                    for i in range(CLUBS)
+                ]
+            },
+            indent=4,
+        )
+    )
+    competitions_path.write_text(
+        json.dumps(
+            {
+                "competitions": [
+                    {"name": f"Competition {i}", "date": "2030-03-27 10:00:00", "numberOfPlaces": "25"}
+                    for i in range(COMPETITIONS)
+                ]
+            },
+            indent=4,
+        )
+    )
+    json_storage = JsonStorage(str(clubs_path), str(competitions_path))
+    snapshot_storage = JsonStorage(
+        str(clubs_path), str(competitions_path), snapshot_path=str(tmp_path / "data.snapshot")
+    )
+    snapshot_storage.save(*json_storage.load())
+
+    (json_clubs, _), json_seconds = best_of(json_storage.load)
+    (snapshot_clubs, _), snapshot_seconds = best_of(snapshot_storage.load)
+
+    print(f"\ncold start, {CLUBS} clubs: json {json_seconds * 1000:.0f} ms, snapshot {snapshot_seconds * 1000:.0f} ms")
+    assert [club.to_dict() for club in snapshot_clubs] == [club.to_dict() for club in json_clubs]
+    assert snapshot_seconds < json_seconds
@@ -0,0 +1,31 @@
+import random
+from collections import Counter
+from tests.tests_performance.datagen import ZipfSampler, build_dataset
+
+
+def test_build_dataset_is_reproducible():
+    """
+    Vérifie que le jeu de données des tests de charge est reproductible et que
+    la compétition phare (première à venir) a le nombre de places demandé.
+    """
+    clubs, competitions, upcoming = build_dataset(clubs=50, competitions=40, hot_places=7, seed=3)
+    again = build_dataset(clubs=50, competitions=40, hot_places=7, seed=3)
+
+    assert [c["name"] for c in competitions] == [c["name"] for c in again[1]]
+    assert upcoming == again[2] and upcoming
+    assert competitions[upcoming[0]]["numberOfPlaces"] == "7"
+    assert len(clubs) == 50
+
+
+def test_zipf_sampler_concentrates_on_first_ranks():
+    """
+    Vérifie le tirage de Zipf : avec un exposant de 1.1, le premier indice est
+    tiré bien plus souvent que le dixième ; avec un exposant nul, le tirage est uniforme.
+    """
+    zipf_sampler, uniform_sampler = ZipfSampler(100, 1.1, random.Random(0)), ZipfSampler(100, 0, random.Random(0))
+    zipf = Counter(zipf_sampler.sample() for _ in range(20000))
+    uniform = Counter(uniform_sampler.sample() for _ in range(20000))
+
+    assert set(zipf) <= set(range(100))
+    assert zipf[0] > 8 * zipf[9]
+    assert max(uniform.values()) < 2 * min(uniform.values())
@@ -0,0 +1,83 @@
+import json
+import time
+import tracemalloc
+import pytest
+from storage import load_models, to_models
+
+CLUBS = 50000
+COMPETITIONS = 5000
+
+
+@pytest.fixture(scope="module")
+def large_files(tmp_path_factory):
+    """
+    Génère des fichiers de données volumineux au format de l'application.
+
+    Crée :
+        - 50 000 clubs
+        - 5 000 compétitions
+
+    Returns:
+        tuple: (chemin clubs.json, chemin competitions.json)
+    """
+    directory = tmp_path_factory.mktemp("large")
+    clubs_path, competitions_path = directory / "clubs.json", directory / "competitions.json"
+    clubs = [{"name": f"Club {i}", "email": f"club{i}@example.com", "points": str(i % 30)} for i in range(CLUBS)]
+    competitions = [
+        {"name": f"Competition {i}", "date": f"2030-{i % 12 + 1:02d}-01 10:00:00", "numberOfPlaces": str(i % 40)}
+        for i in range(COMPETITIONS)
+    ]
+    clubs_path.write_text(json.dumps({"clubs": clubs}, indent=4))
+    competitions_path.write_text(json.dumps({"competitions": competitions}, indent=4))
+    return str(clubs_path), str(competitions_path)
+
+
+def measure(load):
+    """
+    Mesure la durée et le pic de mémoire (tracemalloc) d'un chargement.
+
+    Returns:
+        tuple: (résultat, secondes, pic en octets)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = load()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def test_streaming_load_peak_memory(large_files):
+    """
+    Compare le chargement complet en modèles :
+
+        - `json.load` puis conversion (texte + arbre de dictionnaires + modèles) ;
+        - lecture incrémentale (`load_models`), chaque enregistrement étant converti dès sa lecture.
+
+    Les durées et pics de mémoire sont affichés (pytest -s) ; le chargement
+    incrémental doit produire les mêmes données avec un pic plus faible.
+    """
+    clubs_path, competitions_path = large_files
+
+    def json_load():
+        with open(clubs_path) as f:
+            clubs = json.load(f)["clubs"]
+        with open(competitions_path) as f:
+            competitions = json.load(f)["competitions"]
+        return to_models(clubs, competitions)
+
+    (clubs, competitions), json_seconds, json_peak = measure(json_load)
+    (streamed_clubs, streamed_competitions), stream_seconds, stream_peak = measure(
+        lambda: load_models(clubs_path, competitions_path)
+    )
+
+    print(
+        f"\njson.load: {json_seconds:.2f}s, peak {json_peak / 2**20:.1f} MiB"
+        f"\nstreaming: {stream_seconds:.2f}s, peak {stream_peak / 2**20:.1f} MiB"
+    )
+    assert [club.to_dict() for club in streamed_clubs] == [club.to_dict() for club in clubs]
+    assert len(streamed_competitions) == len(competitions) == COMPETITIONS
+    assert stream_peak < json_peak
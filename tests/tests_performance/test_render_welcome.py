@@ -0,0 +1,52 @@
+import time
+import server
+from cache import VersionedCache
+from storage import to_models
+from tests.tests_performance.datagen import generate_clubs, generate_competitions
+
+SIZES = (100, 1000, 10000)
+
+
+def render_time(club, runs=5):
+    """Meilleure durée (secondes) du rendu de 'welcome.html' pour un club, sur plusieurs rendus."""
+    best = None
+    for _ in range(runs):
+        with server.app.test_request_context("/showSummary", method="POST", data={"view": "all"}):
+            start = time.perf_counter()
+            server.render_welcome(club, server.get_registry())
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def test_render_welcome_vs_catalogue_size(mocker):
+    """
+    Compare le rendu de 'welcome.html' (toutes les compétitions sur une page)
+    selon la taille du catalogue :
+
+        - sans cache des éléments (FRAGMENT_CACHE_SIZE = 0, rendu direct par la macro) ;
+        - avec le cache rempli par un autre club (éléments réutilisés).
+
+    Les durées sont affichées (pytest -s) ; le cache doit accélérer le rendu du
+    plus grand catalogue.
+    """
+    mocker.patch.dict(server.app.config, {"COMPETITIONS_PAGE_SIZE": 0, "TESTING": True})
+    timings = {}
+    for size in SIZES:
+        clubs, competitions = to_models(generate_clubs(2), generate_competitions(size, past_ratio=0))
+        mocker.patch("server.clubs", clubs)
+        mocker.patch("server.competitions", competitions)
+
+        mocker.patch.dict(server.app.config, {"FRAGMENT_CACHE_SIZE": 0})
+        uncached = render_time(clubs[0])
+        mocker.patch.dict(server.app.config, {"FRAGMENT_CACHE_SIZE": size})
+        mocker.patch("server.fragment_cache", VersionedCache(maxsize=size))
+        render_time(clubs[1], runs=1)
+        cached = render_time(clubs[0])
+        timings[size] = (uncached, cached)
+        print(
+            f"\n{size} competitions: {uncached * 1000:.1f} ms without fragments, {cached * 1000:.1f} ms with fragments"
+        )
+
+    uncached, cached = timings[SIZES[-1]]
+    assert cached < uncached
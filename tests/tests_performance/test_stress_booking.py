@@ -0,0 +1,110 @@
+import sys
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import server
+from booking_queue import BookingQueue
+from server import app
+
+REQUESTS = 2000
+THREADS = 32
+
+
+@pytest.fixture
+def sample_data(mocker):
+    """
+    Mocke les données globales avec plusieurs clubs et une compétition très disputée.
+
+    Crée :
+        - 40 clubs avec 150 points chacun (6000 points au total) ; chacun peut
+          réserver au plus MAX_PLACES_PER_COMPETITION places, soit 480 au total
+        - une compétition future avec 300 places
+
+    Returns:
+        tuple: (clubs, competition)
+    """
+    clubs = [{"name": f"Club {i}", "email": f"club{i}@club.com", "points": "150"} for i in range(40)]
+    competition = {
+        "name": "Spring Festival",
+        "numberOfPlaces": "300",
+        "date": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    mocker.patch("server.clubs", clubs)
+    mocker.patch("server.competitions", [competition])
+    return clubs, competition
+
+
+@pytest.fixture
+def frequent_thread_switches():
+    """
+    Réduit l'intervalle de bascule entre threads pour multiplier les entrelacements
+    et rendre une éventuelle course critique observable.
+    """
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.fixture(params=["locks", "queue"])
+def booking_mode(request, mocker):
+    """
+    Mode de réservation testé : verrous par club/compétition (défaut) ou file à
+    écrivain unique (BOOKING_QUEUE).
+
+    Returns:
+        BookingQueue | None: file utilisée, ou None en mode verrous.
+    """
+    if request.param == "locks":
+        yield None
+        return
+    booking_queue = BookingQueue(server.process_bookings, max_pending=0, timeout=None)
+    mocker.patch("server.booking_queue", booking_queue)
+    yield booking_queue
+    booking_queue.close()
+
+
+def test_concurrent_purchases_never_oversell(sample_data, frequent_thread_switches, booking_mode):
+    """
+    Test de charge concurrente :
+
+    Envoie des milliers d'achats simultanés depuis un pool de threads et vérifie que :
+        1. Les places et les points ne deviennent jamais négatifs.
+        2. Chaque place vendue correspond exactement à un point dépensé.
+        3. Le nombre de réservations réussies correspond aux places vendues.
+        4. Aucun club ne dépasse la limite de places par compétition, et le registre
+           des réservations correspond aux points dépensés.
+
+    En mode file, les percentiles d'attente dans la file sont affichés (pytest -s).
+    """
+    app.config["TESTING"] = True
+    clubs, competition = sample_data
+
+    def purchase(i):
+        with app.test_client() as client:
+            response = client.post(
+                "/purchasePlaces",
+                data={"club": clubs[i % len(clubs)]["name"], "competition": competition["name"], "places": 1},
+            )
+        return b"Great-booking complete!" in response.data
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        successes = sum(pool.map(purchase, range(REQUESTS)))
+
+    places_left = int(competition["numberOfPlaces"])
+    points_left = [int(club["points"]) for club in clubs]
+
+    assert places_left >= 0
+    assert all(points >= 0 for points in points_left)
+    assert successes == 300 - places_left
+    assert sum(150 - points for points in points_left) == successes
+    booked = [server.ledger.booked(club["name"], competition["name"]) for club in clubs]
+    assert max(booked) <= server.MAX_PLACES_PER_COMPETITION
+    assert booked == [150 - points for points in points_left]
+    # La demande dépasse l'offre : la compétition doit être complète
+    assert places_left == 0
+
+    if booking_mode is not None:
+        stats = booking_mode.stats()
+        assert stats["processed"] == REQUESTS
+        print(f"\nbooking queue: {stats['batches']} batches, wait {stats['wait_ms']}, latency {stats['latency_ms']}")
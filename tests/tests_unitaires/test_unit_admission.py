@@ -0,0 +1,113 @@
+import pytest
+import server
+from admission import ConcurrencyLimiter, RateLimiter
+from metrics import Metrics
+from server import app
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord.
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application.
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def mock_data(mocker):
+    """
+    Fixture qui mocke les données des clubs et compétitions.
+
+    Crée :
+        - deux clubs avec 20 points
+        - une compétition future avec 25 places
+    """
+    mocker.patch(
+        "server.clubs",
+        [
+            {"name": "Iron Temple", "email": "iron@club.com", "points": "20"},
+            {"name": "Power Gym", "email": "power@gym.com", "points": "20"},
+        ],
+    )
+    mocker.patch(
+        "server.competitions", [{"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": "25"}]
+    )
+
+
+def purchase(client, club="Iron Temple"):
+    """Réserve une place pour `club` sur la compétition de test."""
+    return client.post("/purchasePlaces", data={"club": club, "competition": "Spring Festival", "places": 1})
+
+
+def test_token_bucket_refills_over_time():
+    """
+    Vérifie le seau à jetons : `burst` opérations d'affilée, puis refus avec le
+    délai avant le prochain jeton, et remplissage au rythme de `rate`.
+    """
+    now = [0.0]
+    limiter = RateLimiter(rate=2, burst=2, clock=lambda: now[0])
+
+    assert [limiter.acquire("club") for _ in range(2)] == [0.0, 0.0]
+    assert limiter.acquire("club") == pytest.approx(0.5)
+    assert limiter.acquire("other") == 0.0
+    now[0] = 0.5
+    assert limiter.acquire("club") == 0.0
+    assert limiter.limited == 1
+
+
+def test_club_over_rate_gets_429(client, mock_data, mocker):
+    """
+    Vérifie la limitation par club :
+
+        1. Au-delà de son seau, un club reçoit 429 avec Retry-After, sans réservation.
+        2. Les autres clubs et les routes de lecture ne sont pas concernés.
+        3. Le refus est compté dans '/metrics'.
+    """
+    mocker.patch("server.booking_rate_limiter", RateLimiter(rate=0.1, burst=2))
+    mocker.patch("server.metrics", Metrics())
+
+    assert [purchase(client).status_code for _ in range(3)] == [200, 200, 429]
+    refused = purchase(client)
+
+    assert refused.status_code == 429
+    assert refused.headers["Retry-After"] == "10"
+    assert purchase(client, "Power Gym").status_code == 200
+    assert client.get("/points").status_code == 200
+    assert b"Spring Festival" in client.get("/book/Spring Festival/Iron Temple").data
+    assert "gudlft_bookings_rate_limited_total 2" in client.get("/metrics").get_data(as_text=True)
+
+
+def test_bookings_over_concurrency_cap_get_503(client, mock_data, mocker):
+    """
+    Vérifie le plafond de réservations simultanées :
+
+        1. Quand toutes les places sont prises, une réservation reçoit 503 avec
+           Retry-After (en JSON pour '/purchaseBatch'), sans modifier les données.
+        2. Une fois une place libérée, les réservations passent de nouveau.
+    """
+    slots = ConcurrencyLimiter(1)
+    mocker.patch("server.booking_slots", slots)
+    mocker.patch.dict(app.config, {"BOOKING_RETRY_AFTER": 3})
+    assert slots.try_acquire()  # réservation en cours dans un autre thread
+
+    response = purchase(client)
+    batch = client.post(
+        "/purchaseBatch",
+        json={"club": "Iron Temple", "bookings": [{"competition": "Spring Festival", "places": 1}]},
+    )
+
+    assert (response.status_code, response.headers["Retry-After"]) == (503, "3")
+    assert batch.status_code == 503
+    assert batch.get_json() == {"error": "Too many bookings in progress, please try again."}
+    assert client.get("/points").status_code == 200
+    assert slots.overloaded == 2
+    assert server.competitions[0]["numberOfPlaces"] == "25"
+
+    slots.release()
+    assert purchase(client).status_code == 200
+    assert purchase(client).status_code == 200
@@ -0,0 +1,109 @@
+import pytest
+import server
+from datetime import datetime, timedelta
+from server import app
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord.
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application.
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def sample_data(mocker):
+    """
+    Mocke les données globales : deux clubs, deux compétitions à venir et une passée.
+
+    Returns:
+        tuple: (clubs, competitions)
+    """
+    now = datetime.now()
+    soon, later = ((now + timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S") for days in (1, 60))
+    clubs = [
+        {"name": "Iron Temple", "email": "iron@club.com", "points": "4"},
+        {"name": "Power Gym", "email": "power@gym.com", "points": "10"},
+    ]
+    competitions = [
+        {"name": "Fall Classic", "numberOfPlaces": "10", "date": later},
+        {"name": "Spring Festival", "numberOfPlaces": "10", "date": soon},
+        {"name": "Old Cup", "numberOfPlaces": "5", "date": "2020-03-27 10:00:00"},
+    ]
+    mocker.patch("server.clubs", clubs)
+    mocker.patch("server.competitions", competitions)
+    return clubs, competitions
+
+
+def test_clubs_and_points(client, sample_data):
+    """
+    Vérifie /api/clubs, /api/clubs/<name> et /api/points :
+
+        1. Les points sont renvoyés en entiers.
+        2. Aucune route n'expose l'email du secrétaire (identifiant de connexion).
+        3. Le tableau public des points respecte le tri.
+        4. Un club inconnu donne une erreur 404 en JSON.
+    """
+    response = client.get("/api/clubs")
+    assert response.mimetype == "application/json"
+    assert response.get_json()["clubs"][0] == {"name": "Iron Temple", "points": 4}
+
+    assert client.get("/api/clubs/Power Gym").get_json() == {"name": "Power Gym", "points": 10}
+    assert b"@" not in client.get("/api/clubs").data
+    response = client.get("/api/clubs/Unknown")
+    assert response.status_code == 404
+    assert response.get_json() == {"error": "Club not found"}
+
+    ranking = client.get("/api/points?sort=points").get_json()["clubs"]
+    assert ranking == [{"name": "Power Gym", "points": 10}, {"name": "Iron Temple", "points": 4}]
+
+
+def test_competitions_views_and_pagination(client, sample_data):
+    """
+    Vérifie /api/competitions : vue par défaut (à venir), vue passée,
+    pagination par curseur et rejet d'un curseur ou d'une taille de page invalides.
+    """
+    data = client.get("/api/competitions").get_json()
+    assert [c["name"] for c in data["competitions"]] == ["Spring Festival", "Fall Classic"]
+    assert data["competitions"][0]["numberOfPlaces"] == 10
+
+    assert [c["name"] for c in client.get("/api/competitions?view=past").get_json()["competitions"]] == ["Old Cup"]
+
+    first = client.get("/api/competitions?limit=1").get_json()
+    assert [c["name"] for c in first["competitions"]] == ["Spring Festival"]
+    second = client.get("/api/competitions", query_string={"limit": 1, "after": first["next"]}).get_json()
+    assert [c["name"] for c in second["competitions"]] == ["Fall Classic"]
+    assert second["next"] is None
+
+    assert client.get("/api/competitions?after=garbage").status_code == 400
+    assert client.get("/api/competitions?view=soon").status_code == 400
+    assert client.get("/api/competitions?limit=0").status_code == 400
+    assert client.get("/api/competitions?limit=-1").status_code == 400
+
+
+def test_serialised_body_cached_until_booking(client, sample_data, mocker):
+    """
+    Vérifie que le corps JSON est sérialisé une seule fois par version des données :
+
+        1. Deux appels successifs ne sérialisent qu'une fois et renvoient le même ETag.
+        2. Le client qui présente l'ETag reçoit un 304.
+        3. Après une réservation, le corps est recalculé avec les nouveaux points.
+    """
+    payload = mocker.spy(server, "club_payload")
+    first = client.get("/api/clubs")
+    second = client.get("/api/clubs")
+    assert payload.call_count == 2  # une sérialisation : un appel par club
+    assert first.data == second.data
+    assert first.headers["ETag"] == second.headers["ETag"]
+    assert client.get("/api/clubs", headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+
+    client.post("/purchasePlaces", data={"club": "Power Gym", "competition": "Spring Festival", "places": 2})
+    response = client.get("/api/clubs")
+    assert payload.call_count == 4
+    assert response.get_json()["clubs"][1]["points"] == 8
@@ -0,0 +1,154 @@
+import pytest
+import server
+from datetime import datetime, timedelta
+from server import app
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord.
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application.
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def sample_data(mocker):
+    """
+    Mocke les données globales : un club de 20 points, deux compétitions à venir et une passée.
+
+    Returns:
+        tuple: (clubs, competitions)
+    """
+    date = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
+    clubs = [{"name": "Iron Temple", "email": "iron@club.com", "points": "20"}]
+    competitions = [
+        {"name": "Spring Festival", "numberOfPlaces": "10", "date": date},
+        {"name": "Fall Classic", "numberOfPlaces": "10", "date": date},
+        {"name": "Old Cup", "numberOfPlaces": "10", "date": "2020-03-27 10:00:00"},
+    ]
+    mocker.patch("server.clubs", clubs)
+    mocker.patch("server.competitions", competitions)
+    return clubs, competitions
+
+
+def test_form_batch_books_everything_with_one_flush(client, sample_data, mocker):
+    """
+    Vérifie qu'un lot valide envoyé par formulaire est appliqué en entier
+    avec une seule persistance, et que les lignes vides sont ignorées.
+    """
+    clubs, competitions = sample_data
+    record_batch = mocker.spy(server, "recordBookings")
+    record_single = mocker.spy(server, "recordBooking")
+
+    response = client.post(
+        "/purchaseBatch",
+        data={
+            "club": "Iron Temple",
+            "competition": ["Spring Festival", "Fall Classic", "Old Cup"],
+            "places": ["3", "4", ""],
+        },
+    )
+
+    assert b"Great-booking complete!" in response.data
+    assert int(clubs[0]["points"]) == 13
+    assert [int(c["numberOfPlaces"]) for c in competitions] == [7, 6, 10]
+    assert record_batch.call_count == 1
+    assert record_single.call_count == 0
+
+
+def test_batch_is_all_or_nothing(client, sample_data):
+    """
+    Vérifie qu'une seule réservation invalide (compétition passée) annule tout le lot.
+    """
+    clubs, competitions = sample_data
+    response = client.post(
+        "/purchaseBatch",
+        json={
+            "club": "Iron Temple",
+            "bookings": [{"competition": "Spring Festival", "places": 2}, {"competition": "Old Cup", "places": 1}],
+        },
+    )
+
+    assert response.status_code == 409
+    assert response.get_json()["error"] == "Old Cup: You cannot book a place on a past competition."
+    assert clubs[0]["points"] == "20"
+    assert competitions[0]["numberOfPlaces"] == "10"
+
+
+@pytest.mark.parametrize(
+    "bookings, error",
+    [
+        # 10 + 1 places demandées sur "Fall Classic", qui n'en a que 10
+        (
+            [
+                {"competition": "Spring Festival", "places": 1},
+                {"competition": "Fall Classic", "places": 10},
+                {"competition": "Fall Classic", "places": 1},
+            ],
+            "Fall Classic: Not enough places left in this competition.",
+        ),
+        (
+            [{"competition": "Spring Festival", "places": 7}, {"competition": "Spring Festival", "places": 6}],
+            "Spring Festival: Not enough places left in this competition.",
+        ),
+        ([], "No places requested."),
+    ],
+)
+def test_batch_rules_apply_to_the_whole_batch(client, sample_data, bookings, error):
+    """
+    Vérifie que les demandes répétées pour une même compétition sont additionnées
+    avant vérification, et qu'un lot vide est refusé.
+    """
+    response = client.post("/purchaseBatch", json={"club": "Iron Temple", "bookings": bookings})
+    assert response.status_code == 409
+    assert response.get_json()["error"] == error
+
+
+def test_batch_total_points_checked(client, sample_data):
+    """
+    Vérifie que le total des places du lot est comparé aux points du club,
+    même si chaque réservation prise seule est valide.
+    """
+    clubs, _ = sample_data
+    clubs[0]["points"] = "15"
+    response = client.post(
+        "/purchaseBatch",
+        json={
+            "club": "Iron Temple",
+            "bookings": [{"competition": "Spring Festival", "places": 8}, {"competition": "Fall Classic", "places": 8}],
+        },
+    )
+    assert response.status_code == 409
+    assert response.get_json()["error"] == "You do not have enough points to book these places."
+
+
+def test_batch_json_success_and_unknown_competition(client, sample_data):
+    """
+    Vérifie la réponse JSON d'un lot accepté, le 404 pour une compétition inconnue
+    et le 400 pour une demande mal formée (lot absent, nom qui n'est pas une chaîne).
+    """
+    response = client.post(
+        "/purchaseBatch",
+        json={"club": "Iron Temple", "bookings": [{"competition": "Spring Festival", "places": 2}]},
+    )
+    assert response.get_json() == {
+        "club": "Iron Temple",
+        "points": 18,
+        "bookings": [{"competition": "Spring Festival", "places": 2}],
+    }
+
+    response = client.post(
+        "/purchaseBatch", json={"club": "Iron Temple", "bookings": [{"competition": "Nope", "places": 1}]}
+    )
+    assert response.status_code == 404
+    assert client.post("/purchaseBatch", json={"club": "Iron Temple"}).status_code == 400
+    booking = {"competition": "Spring Festival", "places": 1}
+    assert client.post("/purchaseBatch", json={"club": ["Iron Temple"], "bookings": [booking]}).status_code == 400
+    booking = {"competition": ["Spring Festival"], "places": 1}
+    assert client.post("/purchaseBatch", json={"club": "Iron Temple", "bookings": [booking]}).status_code == 400
@@ -0,0 +1,140 @@
+import queue
+import threading
+import time
+import pytest
+import server
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from booking_queue import BookingQueue, QueueTimeout
+from server import app
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord.
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application.
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def queued(mocker):
+    """
+    Active la file de réservations à écrivain unique sur des données mockées.
+
+    Crée :
+        - un club avec 20 points
+        - une compétition future avec 10 places
+
+    Returns:
+        tuple: (club, competition, file de réservations)
+    """
+    club = {"name": "Iron Temple", "email": "iron@club.com", "points": "20"}
+    competition = {
+        "name": "Spring Festival",
+        "numberOfPlaces": "10",
+        "date": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    mocker.patch("server.clubs", [club])
+    mocker.patch("server.competitions", [competition])
+    booking_queue = BookingQueue(server.process_bookings)
+    mocker.patch("server.booking_queue", booking_queue)
+    yield club, competition, booking_queue
+    booking_queue.close()
+
+
+def test_queue_batches_pending_commands():
+    """
+    Vérifie que le thread d'écriture regroupe les commandes en attente et
+    résout chaque futur avec son propre résultat.
+
+    Le premier lot est bloqué le temps de déposer les commandes suivantes,
+    qui doivent alors être traitées ensemble.
+    """
+    release = threading.Event()
+    batches = []
+
+    def handler(commands):
+        if "block" in commands:
+            release.wait(5)
+        batches.append(list(commands))
+        return [command * 2 for command in commands]
+
+    booking_queue = BookingQueue(handler, max_batch=10)
+    first = booking_queue.submit("block")
+    while booking_queue.depth():
+        time.sleep(0.001)
+    futures = [booking_queue.submit(n) for n in range(5)]
+    release.set()
+
+    assert first.result(5) == "blockblock"
+    assert [future.result(5) for future in futures] == [0, 2, 4, 6, 8]
+    # Les commandes déposées pendant le traitement du premier lot forment un seul lot
+    assert [0, 1, 2, 3, 4] in [[command for command in batch if command != "block"] for batch in batches]
+    assert booking_queue.stats()["processed"] == 6
+    booking_queue.close()
+
+
+def test_queue_bounds_pending_and_wait():
+    """
+    Vérifie les bornes de latence :
+
+        1. Au-delà de `max_pending` commandes en attente, `submit` lève queue.Full.
+        2. Une commande restée dans la file plus longtemps que `timeout` n'est pas traitée.
+    """
+    release = threading.Event()
+    handled = []
+
+    def handler(commands):
+        release.wait(5)
+        handled.extend(commands)
+        return [None] * len(commands)
+
+    booking_queue = BookingQueue(handler, max_pending=1, timeout=0.05)
+    booking_queue.submit("first")
+    # Attend que le thread d'écriture ait retiré la première commande de la file
+    while booking_queue.depth():
+        time.sleep(0.001)
+    late = booking_queue.submit("late")
+    with pytest.raises(queue.Full):
+        booking_queue.submit("rejected")
+
+    threading.Timer(0.1, release.set).start()
+    with pytest.raises(QueueTimeout):
+        late.result(5)
+    booking_queue.close()
+    assert handled == ["first"]
+    assert booking_queue.stats()["expired"] == 1
+
+
+def test_purchases_go_through_queue(client, queued):
+    """
+    Vérifie que, file activée, les achats concurrents sont appliqués par le thread
+    d'écriture avec les règles habituelles, sans jamais survendre.
+    """
+    club, competition, booking_queue = queued
+
+    def purchase(_):
+        with app.test_client() as client:
+            response = client.post(
+                "/purchasePlaces", data={"club": "Iron Temple", "competition": "Spring Festival", "places": 1}
+            )
+            return b"Great-booking complete!" in response.data
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        successes = sum(pool.map(purchase, range(30)))
+
+    assert successes == 10
+    assert int(competition["numberOfPlaces"]) == 0
+    assert int(club["points"]) == 10
+    assert booking_queue.stats()["processed"] == 30
+
+    response = client.post(
+        "/purchaseBatch", json={"club": "Iron Temple", "bookings": [{"competition": "Spring Festival", "places": 1}]}
+    )
+    assert response.get_json()["error"] == "Spring Festival: Not enough places left in this competition."
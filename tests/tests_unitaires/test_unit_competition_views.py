@@ -0,0 +1,146 @@
+import pytest
+from bs4 import BeautifulSoup
+from datetime import datetime, timedelta
+from server import app
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord.
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application.
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def sample_data(mocker):
+    """
+    Mocke les données globales avec une compétition passée et une compétition future.
+
+    Returns:
+        tuple: (club, compétition passée, compétition future)
+    """
+    club = {"name": "Iron Temple", "email": "iron@club.com", "points": "10"}
+    past = {
+        "name": "Spring Festival 2020",
+        "numberOfPlaces": "5",
+        "date": (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    future = {
+        "name": "Fall Classic",
+        "numberOfPlaces": "5",
+        "date": (datetime.now() + timedelta(days=10)).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    mocker.patch("server.clubs", [club])
+    mocker.patch("server.competitions", [past, future])
+    return club, past, future
+
+
+def test_summary_shows_upcoming_competitions_by_default(client, sample_data):
+    """
+    Vérifie que la page de résumé n'affiche par défaut que les compétitions à venir.
+    """
+    club, past, future = sample_data
+
+    response = client.post("/showSummary", data={"email": club["email"]})
+
+    assert future["name"].encode() in response.data
+    assert past["name"].encode() not in response.data
+
+
+def test_summary_past_and_window_views(client, sample_data):
+    """
+    Vérifie les vues alternatives :
+
+        1. view=past n'affiche que les compétitions passées.
+        2. days=5 exclut une compétition ayant lieu dans 10 jours.
+        3. Une fenêtre au-delà des dates représentables ne limite pas la liste
+           (ni ne provoque d'erreur), sur la page comme dans l'API.
+    """
+    club, past, future = sample_data
+
+    response = client.post("/showSummary", data={"email": club["email"], "view": "past"})
+    assert past["name"].encode() in response.data
+    assert future["name"].encode() not in response.data
+
+    response = client.post("/showSummary", data={"email": club["email"], "days": 5})
+    assert future["name"].encode() not in response.data
+
+    response = client.post("/showSummary", data={"email": club["email"], "days": 99999999999})
+    assert future["name"].encode() in response.data
+    response = client.get("/api/competitions?days=99999999999")
+    assert [c["name"] for c in response.get_json()["competitions"]] == [future["name"]]
+    assert client.get("/api/competitions?days=-99999999999").get_json()["competitions"] == []
+
+
+@pytest.fixture
+def many_competitions(mocker):
+    """
+    Mocke les données globales avec un club et 5 compétitions futures, avec des pages de 2.
+
+    Returns:
+        tuple: (club, competitions)
+    """
+    club = {"name": "Iron Temple", "email": "iron@club.com", "points": "10"}
+    competitions = [
+        {
+            "name": f"Competition {i}",
+            "numberOfPlaces": "5",
+            "date": (datetime.now() + timedelta(days=i + 1)).strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        for i in range(5)
+    ]
+    mocker.patch("server.clubs", [club])
+    mocker.patch("server.competitions", competitions)
+    mocker.patch.dict(app.config, {"COMPETITIONS_PAGE_SIZE": 2})
+    return club, competitions
+
+
+def test_summary_pages_follow_cursor(client, many_competitions):
+    """
+    Vérifie la pagination par curseur :
+
+        1. Chaque page contient au plus 2 compétitions.
+        2. En suivant le curseur « after », toutes les compétitions sont vues une seule fois, dans l'ordre.
+    """
+    club, competitions = many_competitions
+    seen = []
+    data = {"email": club["email"]}
+
+    while True:
+        response = client.post("/showSummary", data=data)
+        soup = BeautifulSoup(response.data, "html.parser")
+        page = [strong.get_text() for strong in soup.find_all("strong")]
+        assert len(page) <= 2
+        seen += page
+        cursor = soup.find("input", attrs={"name": "after"})
+        if cursor is None:
+            break
+        data = {"email": club["email"], "after": cursor["value"]}
+
+    assert seen == [competition["name"] for competition in competitions]
+
+
+def test_streamed_summary_keeps_flash_messages(client, sample_data, mocker):
+    """
+    Vérifie le mode streaming de 'welcome.html' :
+
+        1. La réponse est envoyée en flux et contient le message flash.
+        2. Le message flash n'est pas affiché une seconde fois à la requête suivante.
+    """
+    club, past, future = sample_data
+    mocker.patch.dict(app.config, {"STREAM_TEMPLATES": True})
+
+    response = client.post(
+        "/purchasePlaces", data={"club": club["name"], "competition": future["name"], "places": 20}
+    )
+    assert response.is_streamed
+    assert b"Not enough places left in this competition." in response.data
+
+    response = client.post("/showSummary", data={"email": club["email"]})
+    assert b"Not enough places left in this competition." not in response.data
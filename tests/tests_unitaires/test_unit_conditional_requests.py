@@ -0,0 +1,94 @@
+import pytest
+import server
+from datetime import datetime, timedelta
+from server import app
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord.
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application.
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def sample_data(mocker):
+    """
+    Mocke les données globales avec deux clubs et deux compétitions futures.
+
+    Returns:
+        tuple: (clubs, competitions)
+    """
+    date = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
+    clubs = [
+        {"name": "Iron Temple", "email": "iron@club.com", "points": "10"},
+        {"name": "Power Gym", "email": "power@gym.com", "points": "10"},
+    ]
+    competitions = [
+        {"name": "Spring Festival", "numberOfPlaces": "10", "date": date},
+        {"name": "Fall Classic", "numberOfPlaces": "10", "date": date},
+    ]
+    mocker.patch("server.clubs", clubs)
+    mocker.patch("server.competitions", competitions)
+    return clubs, competitions
+
+
+def test_points_revalidation(client, sample_data, mocker):
+    """
+    Vérifie les requêtes conditionnelles sur /points :
+
+        1. La réponse porte un ETag, Last-Modified et Cache-Control.
+        2. Un If-None-Match correspondant donne un 304 sans rendu de gabarit.
+        3. Après une réservation, l'ancien ETag n'est plus valable.
+    """
+    response = client.get("/points")
+    etag = response.headers["ETag"]
+    assert response.headers["Last-Modified"]
+    assert "no-cache" in response.headers["Cache-Control"]
+
+    render = mocker.spy(server, "render_template")
+    response = client.get("/points", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert render.call_count == 0
+
+    client.post("/purchasePlaces", data={"club": "Iron Temple", "competition": "Spring Festival", "places": 1})
+    response = client.get("/points", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_booking_page_etag_is_per_record(client, sample_data):
+    """
+    Vérifie que l'ETag de /book/<competition>/<club> ne change que si ce club
+    ou cette compétition est modifié.
+    """
+    url = "/book/Spring Festival/Iron Temple"
+    etag = client.get(url).headers["ETag"]
+
+    client.post("/purchasePlaces", data={"club": "Power Gym", "competition": "Fall Classic", "places": 1})
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/purchasePlaces", data={"club": "Power Gym", "competition": "Spring Festival", "places": 1})
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert b"Places available: 9" in response.data
+
+
+def test_index_not_cached_with_pending_flash(client, sample_data):
+    """
+    Vérifie que la page d'accueil est revalidable, sauf quand un message flash est en attente.
+    """
+    etag = client.get("/").headers["ETag"]
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/showSummary", data={"email": "inconnu@example.com"})
+    response = client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert b"Sorry, that email wasn&#39;t found." in response.data
+    assert "no-store" in response.headers["Cache-Control"]
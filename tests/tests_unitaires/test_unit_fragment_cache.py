@@ -0,0 +1,107 @@
+import pytest
+from cache import VersionedCache
+from server import app
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord.
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application.
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def fragments(mocker):
+    """
+    Fixture qui mocke les données et vide le cache des éléments de 'welcome.html'.
+
+    Crée :
+        - deux clubs, dont un au nom à encoder dans les URL
+        - trois compétitions futures, dont une complète
+
+    Returns:
+        VersionedCache: Cache des éléments utilisé pendant le test.
+    """
+    mocker.patch(
+        "server.clubs",
+        [
+            {"name": "Iron Temple", "email": "iron@club.com", "points": "20"},
+            {"name": "Lift & Co", "email": "lift@co.com", "points": "20"},
+        ],
+    )
+    mocker.patch(
+        "server.competitions",
+        [
+            {"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": "10"},
+            {"name": "Fall Classic", "date": "2030-10-22 13:30:00", "numberOfPlaces": "13"},
+            {"name": "Winter Games", "date": "2030-12-01 10:00:00", "numberOfPlaces": "0"},
+        ],
+    )
+    cache = VersionedCache()
+    mocker.patch("server.fragment_cache", cache)
+    return cache
+
+
+def test_fragments_are_shared_between_clubs(client, fragments):
+    """
+    Vérifie que les éléments de la liste des compétitions sont rendus une seule
+    fois pour tous les clubs, le lien « Book Places » étant propre à chaque club.
+    """
+    iron = client.post("/showSummary", data={"email": "iron@club.com"}).data
+    lift = client.post("/showSummary", data={"email": "lift@co.com"}).data
+
+    assert (fragments.misses, fragments.hits) == (3, 3)
+    assert b'href="/book/Spring%20Festival/Iron%20Temple"' in iron
+    assert b'href="/book/Spring%20Festival/Lift%20&amp;%20Co"' in lift
+    assert b"/book/Winter%20Games/" not in iron
+
+
+def test_booking_rerenders_only_booked_competition(client, fragments):
+    """
+    Vérifie qu'après une réservation, seul l'élément de la compétition réservée
+    est rendu à nouveau, avec le nouveau nombre de places.
+    """
+    client.post("/showSummary", data={"email": "iron@club.com"})
+    response = client.post(
+        "/purchasePlaces", data={"club": "Iron Temple", "competition": "Spring Festival", "places": 2}
+    )
+
+    assert (fragments.misses, fragments.hits) == (4, 2)
+    assert b"Number of Places: 8" in response.data
+
+
+def test_book_with_unknown_names(client, fragments):
+    """
+    Vérifie que la page de réservation gère un club ou une compétition inconnus :
+
+        1. Club inconnu : retour à l'accueil avec un message flash.
+        2. Compétition inconnue : 'welcome.html' du club, liste des compétitions comprise.
+    """
+    response = client.get("/book/Spring Festival/Unknown", follow_redirects=True)
+    assert response.status_code == 200
+    assert b"Something went wrong-please try again" in response.data
+
+    response = client.get("/book/Unknown/Iron Temple")
+    assert response.status_code == 200
+    assert b"Something went wrong-please try again" in response.data
+    assert b'href="/book/Spring%20Festival/Iron%20Temple"' in response.data
+
+
+def test_streamed_summary_renders_items_lazily(client, fragments, mocker):
+    """
+    Vérifie qu'en mode streaming, les éléments ne sont rendus qu'au fil de l'envoi
+    de la page, et non tous avant le premier octet.
+    """
+    mocker.patch.dict(app.config, {"STREAM_TEMPLATES": True})
+    response = client.post("/showSummary", data={"email": "iron@club.com"})
+
+    assert response.is_streamed
+    assert fragments.misses == 0
+    assert b'href="/book/Spring%20Festival/Iron%20Temple"' in response.data
+    assert fragments.misses == 3
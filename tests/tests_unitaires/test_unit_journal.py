@@ -0,0 +1,131 @@
+import json
+import pytest
+from journal import BookingJournal
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """
+    Fixture qui crée des instantanés JSON temporaires et un journal associé.
+
+    Crée :
+        - un club avec 20 points
+        - une compétition avec 15 places
+
+    Returns:
+        BookingJournal: journal pointant vers les fichiers temporaires.
+    """
+    clubs_path = tmp_path / "clubs.json"
+    competitions_path = tmp_path / "competitions.json"
+    clubs_path.write_text(json.dumps({"clubs": [{"name": "Iron Temple", "email": "iron@club.com", "points": 20}]}))
+    competitions_path.write_text(
+        json.dumps({"competitions": [{"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": 15}]})
+    )
+    return BookingJournal(str(tmp_path / "bookings.journal"), str(clubs_path), str(competitions_path))
+
+
+def test_replay_rebuilds_state(journal):
+    """
+    Vérifie que l'état est reconstruit au démarrage à partir des instantanés et du journal.
+
+    Étapes :
+        1. Ajoute deux réservations au journal.
+        2. Recharge l'état avec un nouveau journal sur les mêmes fichiers.
+        3. Vérifie que les points et les places tiennent compte des deux réservations.
+    """
+    journal.load()
+    journal.append("Iron Temple", "Spring Festival", 2)
+    journal.append("Iron Temple", "Spring Festival", 3)
+    journal.close()
+
+    clubs, competitions = BookingJournal(journal.path, journal.clubs_path, journal.competitions_path).load()
+
+    assert clubs[0]["points"] == 15
+    assert competitions[0]["numberOfPlaces"] == 10
+
+
+def test_compaction_folds_journal_into_snapshots(journal):
+    """
+    Vérifie que la compaction réintègre le journal dans les instantanés sans double application.
+
+    Étapes :
+        1. Ajoute une réservation puis compacte.
+        2. Vérifie que le journal est vidé et que les instantanés sont à jour.
+        3. Ajoute une nouvelle réservation et recharge : seule celle-ci est rejouée.
+    """
+    journal.load()
+    journal.append("Iron Temple", "Spring Festival", 4)
+    journal.compact()
+
+    with open(journal.clubs_path) as f:
+        assert json.load(f)["clubs"][0]["points"] == 16
+    with open(journal.path) as f:
+        assert f.read() == ""
+
+    journal.append("Iron Temple", "Spring Festival", 1)
+    journal.close()
+    clubs, competitions = BookingJournal(journal.path, journal.clubs_path, journal.competitions_path).load()
+
+    assert clubs[0]["points"] == 15
+    assert competitions[0]["numberOfPlaces"] == 10
+
+
+def test_interrupted_compaction_is_not_replayed_twice(journal):
+    """
+    Vérifie qu'un instantané déjà à jour n'est pas modifié par le rejeu d'un journal non tronqué
+    (compaction interrompue entre l'écriture des instantanés et la troncature).
+    """
+    journal.load()
+    journal.append("Iron Temple", "Spring Festival", 5)
+    journal.close()
+    with open(journal.path) as f:
+        pending = f.read()
+
+    journal.compact()
+    with open(journal.path, "w") as f:
+        f.write(pending)
+
+    clubs, competitions = BookingJournal(journal.path, journal.clubs_path, journal.competitions_path).load()
+
+    assert clubs[0]["points"] == 15
+    assert competitions[0]["numberOfPlaces"] == 10
+
+
+def test_batch_record_replayed_as_one(journal):
+    """
+    Vérifie qu'un lot de réservations est journalisé sur une seule ligne et rejoué en entier.
+    """
+    journal.load()
+    journal.append_batch("Iron Temple", [("Spring Festival", 2), ("Spring Festival", 1)])
+    journal.close()
+
+    with open(journal.path) as f:
+        assert len(f.readlines()) == 1
+    clubs, competitions = BookingJournal(journal.path, journal.clubs_path, journal.competitions_path).load()
+    assert clubs[0]["points"] == 17
+    assert competitions[0]["numberOfPlaces"] == 12
+
+
+def test_torn_tail_truncated_before_next_append(journal):
+    """
+    Vérifie qu'une ligne incomplète laissée par un arrêt brutal ne masque pas les réservations suivantes.
+
+    Étapes :
+        1. Journalise une réservation puis simule une écriture interrompue.
+        2. Recharge l'état et ajoute une nouvelle réservation.
+        3. Vérifie qu'un rechargement ultérieur tient compte des deux réservations.
+    """
+    journal.load()
+    journal.append("Iron Temple", "Spring Festival", 2)
+    journal.close()
+    with open(journal.path, "a") as f:
+        f.write('{"seq":2,"club":"Iron Te')
+
+    restarted = BookingJournal(journal.path, journal.clubs_path, journal.competitions_path)
+    restarted.load()
+    restarted.append("Iron Temple", "Spring Festival", 3)
+    restarted.close()
+
+    clubs, competitions = BookingJournal(journal.path, journal.clubs_path, journal.competitions_path).load()
+    assert clubs[0]["points"] == 15
+    assert competitions[0]["numberOfPlaces"] == 10
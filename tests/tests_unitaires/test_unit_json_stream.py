@@ -0,0 +1,86 @@
+import json
+import tracemalloc
+import pytest
+from json_stream import iter_records
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    """
+    Fixture qui écrit un fichier de données JSON au format des fichiers de l'application
+    (indenté, avec une clé supplémentaire après la liste).
+
+    Returns:
+        tuple: (chemin du fichier, contenu attendu)
+    """
+    payload = {
+        "clubs": [
+            {"name": "Iron Temple", "email": "iron@club.com", "points": "4"},
+            {"name": "Simply Lift é", "email": "john@simplylift.co", "points": 13},
+            {"name": "She Lifts", "email": "kate@shelifts.co.uk", "points": 12.5, "tags": ["a", {"b": None}]},
+        ],
+        "journalSeq": 42,
+    }
+    path = tmp_path / "clubs.json"
+    path.write_text(json.dumps(payload, indent=4), encoding="utf-8")
+    return str(path), payload
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_records_match_json_load(data_file, chunk_size):
+    """
+    Vérifie que la lecture incrémentale donne les mêmes enregistrements que
+    `json.load`, quelle que soit la taille des blocs (coupures au milieu des
+    chaînes, des nombres et des objets), ainsi que les clés supplémentaires.
+    """
+    path, payload = data_file
+    extras = {}
+    assert list(iter_records(path, "clubs", extras, chunk_size=chunk_size)) == payload["clubs"]
+    assert extras == {"journalSeq": 42}
+
+
+def test_missing_key_and_malformed_files(tmp_path):
+    """
+    Vérifie les erreurs : clé absente (KeyError), fichier tronqué ou qui n'est pas un objet (ValueError).
+    """
+    path = tmp_path / "data.json"
+    path.write_text('{"competitions": []}')
+    with pytest.raises(KeyError):
+        list(iter_records(str(path), "clubs"))
+
+    path.write_text('{"clubs": [{"name": "Iron Temple"}, {"name": "Pow')
+    with pytest.raises(ValueError):
+        list(iter_records(str(path), "clubs", chunk_size=8))
+
+    path.write_text('[{"name": "Iron Temple"}]')
+    with pytest.raises(ValueError):
+        list(iter_records(str(path), "clubs"))
+
+
+def test_memory_bounded_by_chunk_not_file(tmp_path):
+    """
+    Vérifie que parcourir un gros fichier généré (plusieurs Mo) sans conserver les
+    enregistrements n'alloue pas plus de quelques blocs, contrairement à `json.load`.
+    """
+    path = tmp_path / "clubs.json"
+    with open(path, "w") as f:
+        json.dump(
+            {"clubs": [{"name": f"Club {i}", "email": f"club{i}@example.com", "points": i % 30} for i in range(50000)]},
+            f,
+            indent=4,
+        )
+
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in iter_records(str(path), "clubs"))
+        streaming_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        with open(path) as f:
+            json.load(f)
+        json_load_peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert count == 50000
+    assert streaming_peak < 1024 * 1024
+    assert streaming_peak * 10 < json_load_peak
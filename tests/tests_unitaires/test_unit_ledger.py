@@ -0,0 +1,218 @@
+import json
+import pytest
+from datetime import datetime, timedelta
+from journal import BookingJournal
+from ledger import BookingLedger
+from server import app
+from storage import JsonStorage, SqliteStorage
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord (sessions, flash, fichiers JSON)
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def sample_data_future(mocker):
+    """
+    Mocke les données globales `clubs` et `competitions` avec une compétition future.
+
+    Crée :
+        - un club avec 20 points
+        - une compétition avec 15 places et une date dans le futur
+
+    Returns:
+        tuple: (club, competition) pour les tests
+    """
+    club = {"name": "Iron Temple", "email": "iron@club.com", "points": "20"}
+    competition = {
+        "name": "Spring Festival",
+        "numberOfPlaces": "15",
+        "date": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    mocker.patch("server.clubs", [club])
+    mocker.patch("server.competitions", [competition])
+    return club, competition
+
+
+@pytest.fixture
+def json_files(tmp_path):
+    """
+    Fixture qui crée des fichiers JSON de données temporaires.
+
+    Crée :
+        - un club avec 20 points
+        - deux compétitions avec 15 places
+
+    Returns:
+        tuple: (chemin clubs.json, chemin competitions.json)
+    """
+    clubs_path = tmp_path / "clubs.json"
+    competitions_path = tmp_path / "competitions.json"
+    clubs_path.write_text(json.dumps({"clubs": [{"name": "Iron Temple", "email": "iron@club.com", "points": 20}]}))
+    competitions_path.write_text(
+        json.dumps(
+            {
+                "competitions": [
+                    {"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": 15},
+                    {"name": "Fall Classic", "date": "2030-10-22 13:30:00", "numberOfPlaces": 15},
+                ]
+            }
+        )
+    )
+    return str(clubs_path), str(competitions_path)
+
+
+def test_ledger_totals():
+    """
+    Vérifie les totaux du registre : cumul, annulation et historique par club.
+    """
+    ledger = BookingLedger()
+    ledger.add("Iron Temple", "Spring Festival", 2)
+    ledger.add("Iron Temple", "Fall Classic", 4)
+    ledger.add("Iron Temple", "Spring Festival", 3)
+    ledger.add("She Lifts", "Spring Festival", 1)
+
+    assert ledger.booked("Iron Temple", "Spring Festival") == 5
+    assert ledger.booked("Iron Temple", "Unknown") == 0
+    assert ledger.history("Iron Temple") == {"Spring Festival": 5, "Fall Classic": 4}
+
+    ledger.add("Iron Temple", "Fall Classic", -4)
+    assert ledger.history("Iron Temple") == {"Spring Festival": 5}
+    assert BookingLedger.from_records(ledger.to_records()).history("She Lifts") == {"Spring Festival": 1}
+
+
+def test_cap_counts_previous_bookings(client, sample_data_future, empty_ledger):
+    """
+    Vérifie que la limite de 12 places porte sur le total des réservations du club.
+
+    Étapes :
+        1. Réserve 10 places, puis tente d'en réserver 3 de plus.
+        2. Vérifie que la seconde réservation est refusée et ne modifie rien.
+        3. Vérifie que 2 places restent réservables.
+    """
+    club, competition = sample_data_future
+
+    def purchase(places):
+        return client.post(
+            "/purchasePlaces", data={"club": club["name"], "competition": competition["name"], "places": places}
+        )
+
+    response = purchase(10)
+    assert b"Great-booking complete!" in response.data
+
+    response = purchase(3)
+    assert b"Cannot book more than 12 places per competition." in response.data
+    assert int(club["points"]) == 10
+    assert int(competition["numberOfPlaces"]) == 5
+    assert empty_ledger.booked(club["name"], competition["name"]) == 10
+
+    response = purchase(2)
+    assert b"Great-booking complete!" in response.data
+    assert empty_ledger.booked(club["name"], competition["name"]) == 12
+
+
+def test_booking_page_shows_booked_places(client, sample_data_future, empty_ledger):
+    """
+    Vérifie que la page de réservation affiche les places déjà réservées et limite la saisie au reste.
+    """
+    club, competition = sample_data_future
+    empty_ledger.add(club["name"], competition["name"], 5)
+
+    response = client.get(f"/book/{competition['name']}/{club['name']}")
+
+    assert b"Places already booked: 5" in response.data
+    assert b'max="7"' in response.data
+
+
+def test_history_page(client, sample_data_future, empty_ledger):
+    """
+    Vérifie la page d'historique : places réservées par compétition, 404 pour un club inconnu.
+    """
+    club, competition = sample_data_future
+
+    response = client.get(f"/history/{club['name']}")
+    assert b"No places booked yet." in response.data
+
+    client.post("/purchasePlaces", data={"club": club["name"], "competition": competition["name"], "places": 4})
+    response = client.get(f"/history/{club['name']}")
+    assert response.status_code == 200
+    assert b"<td>Spring Festival</td>" in response.data
+    assert b"<td>4</td>" in response.data
+
+    assert client.get("/history/Unknown").status_code == 404
+
+
+def test_json_storage_persists_ledger(json_files, tmp_path):
+    """
+    Vérifie que le backend JSON écrit le registre avec les clubs et compétitions et le relit au démarrage.
+    """
+    ledger_path = str(tmp_path / "bookings.json")
+    storage = JsonStorage(*json_files, ledger_path=ledger_path)
+    clubs, competitions = storage.load()
+    ledger = storage.load_ledger()
+    assert len(ledger) == 0
+
+    ledger.add("Iron Temple", "Spring Festival", 3)
+    storage.record_booking(clubs, competitions, clubs[0], competitions[0], 3)
+
+    reloaded = JsonStorage(*json_files, ledger_path=ledger_path).load_ledger()
+    assert reloaded.history("Iron Temple") == {"Spring Festival": 3}
+
+
+def test_journal_rebuilds_ledger(json_files, tmp_path):
+    """
+    Vérifie que le registre est reconstruit par le journal, avant et après compaction.
+
+    Étapes :
+        1. Ajoute une réservation et un lot au journal.
+        2. Vérifie que le registre rechargé en tient compte.
+        3. Compacte le journal et vérifie que l'instantané du registre donne le même résultat.
+    """
+    ledger_path = str(tmp_path / "bookings.json")
+    journal = BookingJournal(str(tmp_path / "bookings.journal"), *json_files, ledger_path=ledger_path)
+    journal.load()
+    journal.append("Iron Temple", "Spring Festival", 2)
+    journal.append_batch("Iron Temple", [("Spring Festival", 1), ("Fall Classic", 4)])
+
+    expected = {"Spring Festival": 3, "Fall Classic": 4}
+    assert journal.load_ledger().history("Iron Temple") == expected
+
+    journal.compact()
+    journal.close()
+    with open(ledger_path) as f:
+        assert len(json.load(f)["bookings"]) == 2
+    reloaded = BookingJournal(str(tmp_path / "bookings.journal"), *json_files, ledger_path=ledger_path)
+    reloaded.load()
+    assert reloaded.load_ledger().history("Iron Temple") == expected
+    reloaded.close()
+
+
+def test_sqlite_storage_persists_ledger(json_files, tmp_path):
+    """
+    Vérifie que le backend SQLite cumule les réservations dans la même transaction que les compteurs.
+    """
+    database = str(tmp_path / "gudlft.sqlite3")
+    storage = SqliteStorage(database, *json_files)
+    clubs, competitions = storage.load()
+    storage.load_ledger()
+
+    clubs[0]["points"] = 15
+    competitions[0]["numberOfPlaces"] = 13
+    competitions[1]["numberOfPlaces"] = 12
+    storage.record_booking(clubs, competitions, clubs[0], competitions[0], 2)
+    storage.record_bookings(clubs, competitions, clubs[0], [(competitions[0], 1), (competitions[1], 3)])
+    storage.close()
+
+    reloaded = SqliteStorage(database, *json_files)
+    reloaded.load()
+    assert reloaded.load_ledger().history("Iron Temple") == {"Spring Festival": 3, "Fall Classic": 3}
+    reloaded.close()
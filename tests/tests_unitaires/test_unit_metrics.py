@@ -0,0 +1,97 @@
+import re
+import pytest
+from metrics import Metrics
+from server import app
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord.
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application.
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def mock_data(mocker):
+    """
+    Fixture qui mocke les données et active les métriques.
+
+    Crée :
+        - un club avec 20 points
+        - une compétition future avec 10 places
+
+    Returns:
+        Metrics: Métriques de l'application pendant le test.
+    """
+    mocker.patch("server.clubs", [{"name": "Iron Temple", "email": "iron@club.com", "points": "20"}])
+    mocker.patch(
+        "server.competitions", [{"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": "10"}]
+    )
+    metrics = Metrics()
+    mocker.patch("server.metrics", metrics)
+    return metrics
+
+
+def sample(text, name, **labels):
+    """Valeur d'un échantillon de l'export Prometheus (None si absent)."""
+    selector = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    match = re.search(rf"^{re.escape(name)}\{{{re.escape(selector)}\}} (\S+)$", text, re.MULTILINE)
+    return float(match.group(1)) if match else None
+
+
+def test_metrics_disabled_by_default(client):
+    """Vérifie que '/metrics' répond 404 quand METRICS est désactivé."""
+    assert client.get("/metrics").status_code == 404
+
+
+def test_metrics_count_requests_and_phases(client, mock_data, mocker):
+    """
+    Vérifie les métriques d'un achat de places :
+
+        1. Requêtes comptées par route et par statut, erreurs (404) comptées à part.
+        2. Histogramme des durées de la route (classe +Inf = nombre de requêtes).
+        3. Étapes de 'purchasePlaces' chronométrées : recherche, validation, persistance, rendu.
+
+    Le backend de stockage est remplacé par un mock pour que l'écriture ait lieu
+    (hors mode TESTING) sans toucher aux fichiers.
+    """
+    storage = mocker.patch("server.storage")
+    mocker.patch.dict(app.config, {"TESTING": False})
+    client.post("/purchasePlaces", data={"club": "Iron Temple", "competition": "Spring Festival", "places": 2})
+    client.get("/nowhere")
+    storage.record_booking.assert_called_once()
+
+    response = client.get("/metrics")
+    text = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert sample(text, "gudlft_requests_total", route="purchasePlaces", status=200) == 1
+    assert sample(text, "gudlft_request_errors_total", route="unmatched") == 1
+    assert sample(text, "gudlft_request_errors_total", route="purchasePlaces") is None
+    assert sample(text, "gudlft_request_duration_seconds_bucket", route="purchasePlaces", le="+Inf") == 1
+    assert sample(text, "gudlft_request_duration_seconds_count", route="purchasePlaces") == 1
+    for phase in ("lookup", "validation", "persistence", "rendering"):
+        assert sample(text, "gudlft_phase_duration_seconds_count", route="purchasePlaces", phase=phase) == 1
+
+
+def test_histogram_buckets_are_cumulative():
+    """Vérifie que les classes exportées sont cumulées et bornées par `le` (inclus)."""
+    metrics = Metrics(buckets=(0.1, 1.0))
+    with metrics.phase("rendering"):
+        pass
+    metrics._phases["background", "rendering"].observe(1.0)
+    metrics._phases["background", "rendering"].observe(5.0)
+
+    text = metrics.render()
+
+    labels = {"route": "background", "phase": "rendering"}
+    assert sample(text, "gudlft_phase_duration_seconds_bucket", **labels, le=0.1) == 1
+    assert sample(text, "gudlft_phase_duration_seconds_bucket", **labels, le=1.0) == 2
+    assert sample(text, "gudlft_phase_duration_seconds_bucket", **labels, le="+Inf") == 3
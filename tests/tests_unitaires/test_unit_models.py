@@ -0,0 +1,53 @@
+from datetime import datetime
+from models import Club, Competition, competition_date
+
+
+def test_records_are_parsed_once_at_load():
+    """
+    Vérifie que les champs sont typés dès le chargement :
+    points et places en entiers, date en datetime.
+    """
+    club = Club.from_dict({"name": "Iron Temple", "email": "iron@club.com", "points": "20"})
+    competition = Competition.from_dict(
+        {"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": "15"}
+    )
+
+    assert club.points == 20
+    assert competition.numberOfPlaces == 15
+    assert competition.date == datetime(2030, 3, 27, 10, 0, 0)
+    assert competition_date(competition) is competition.date
+
+
+def test_records_are_slotted():
+    """
+    Vérifie que les modèles n'ont pas de __dict__ par instance (mémoire réduite).
+    """
+    club = Club("Iron Temple", "iron@club.com", 20)
+    assert not hasattr(club, "__dict__")
+
+
+def test_mapping_view_matches_json_schema():
+    """
+    Vérifie la vue « dictionnaire » des modèles :
+
+        1. La lecture renvoie les valeurs au format JSON (date en texte).
+        2. L'écriture accepte ce format et le convertit.
+        3. `to_dict` reproduit le schéma des fichiers JSON.
+    """
+    data = {"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": 15}
+    competition = Competition.from_dict(data)
+
+    assert competition["date"] == "2030-03-27 10:00:00"
+    competition["numberOfPlaces"] = "14"
+    competition["date"] = "2031-01-01 09:00:00"
+
+    assert competition.numberOfPlaces == 14
+    assert competition.date == datetime(2031, 1, 1, 9, 0, 0)
+    assert Competition.from_dict(data).to_dict() == data
+
+
+def test_competition_date_accepts_raw_records():
+    """
+    Vérifie que `competition_date` analyse à la volée un enregistrement brut (dict).
+    """
+    assert competition_date({"date": "2030-03-27 10:00:00"}) == datetime(2030, 3, 27, 10, 0, 0)
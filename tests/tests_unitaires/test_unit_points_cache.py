@@ -0,0 +1,86 @@
+import pytest
+from bs4 import BeautifulSoup
+from datetime import datetime, timedelta
+import server
+from server import app
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord.
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application.
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def sample_data(mocker):
+    """
+    Mocke les données globales avec trois clubs et une compétition future.
+
+    Returns:
+        tuple: (clubs, competition)
+    """
+    clubs = [
+        {"name": "Iron Temple", "email": "iron@club.com", "points": "4"},
+        {"name": "Simply Lift", "email": "john@simplylift.co", "points": "13"},
+        {"name": "Power Gym", "email": "power@gym.com", "points": "8"},
+    ]
+    competition = {
+        "name": "Spring Festival",
+        "numberOfPlaces": "10",
+        "date": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    mocker.patch("server.clubs", clubs)
+    mocker.patch("server.competitions", [competition])
+    return clubs, competition
+
+
+def get_table(response):
+    """
+    Extrait les lignes (nom, points) du tableau de la page /points.
+    """
+    soup = BeautifulSoup(response.data, "html.parser")
+    return [tuple(td.get_text() for td in tr.find_all("td")) for tr in soup.find("tbody").find_all("tr")]
+
+
+def test_points_page_is_served_from_cache(client, sample_data, mocker):
+    """
+    Vérifie que deux visites consécutives de /points ne rendent le gabarit qu'une fois.
+    """
+    render = mocker.spy(server, "render_template")
+
+    first = client.get("/points")
+    second = client.get("/points")
+
+    assert first.data == second.data
+    assert render.call_count == 1
+
+
+def test_points_cache_invalidated_by_booking(client, sample_data):
+    """
+    Vérifie qu'une réservation réussie change la version des données et que
+    /points affiche immédiatement les nouveaux points.
+    """
+    clubs, competition = sample_data
+    assert ("Iron Temple", "4") in get_table(client.get("/points"))
+
+    client.post("/purchasePlaces", data={"club": "Iron Temple", "competition": competition["name"], "places": 1})
+
+    assert ("Iron Temple", "3") in get_table(client.get("/points"))
+
+
+def test_points_sort_and_pagination(client, sample_data, mocker):
+    """
+    Vérifie le tri par points (décroissant) et la pagination du tableau.
+    """
+    mocker.patch.dict(app.config, {"POINTS_PAGE_SIZE": 2})
+
+    assert get_table(client.get("/points?sort=points")) == [("Simply Lift", "13"), ("Power Gym", "8")]
+    assert get_table(client.get("/points?sort=points&page=2")) == [("Iron Temple", "4")]
+    assert get_table(client.get("/points?sort=name&page=1")) == [("Iron Temple", "4"), ("Power Gym", "8")]
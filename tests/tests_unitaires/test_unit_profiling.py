@@ -0,0 +1,122 @@
+import os
+import pytest
+from profiling import PROFILE_HEADER, RequestProfiler, collapsed_stacks, hotspot_report
+from server import app
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord.
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application.
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def profiler(mocker, tmp_path):
+    """
+    Fixture qui active le profilage à la demande (sans tirage au sort) sur des données mockées.
+
+    Returns:
+        RequestProfiler: Profileur de l'application, écrivant dans un dossier temporaire.
+    """
+    mocker.patch("server.clubs", [{"name": "Iron Temple", "email": "iron@club.com", "points": "20"}])
+    mocker.patch(
+        "server.competitions", [{"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": "10"}]
+    )
+    profiler = RequestProfiler(str(tmp_path / "profiles"), sample_rate=0.0, token="secret", keep=2)
+    mocker.patch("server.profiler", profiler)
+    return profiler
+
+
+def test_profiles_requested_requests_only(client, profiler):
+    """
+    Vérifie le profilage à la demande :
+
+        1. Une requête sans en-tête (ou avec un mauvais jeton) n'est pas profilée.
+        2. Une requête avec le bon jeton écrit un `.prof` et un `.collapsed` dans
+           le dossier de sa route.
+    """
+    client.post("/showSummary", data={"email": "iron@club.com"})
+    client.post("/showSummary", data={"email": "iron@club.com"}, headers={PROFILE_HEADER: "wrong"})
+    assert not os.path.exists(profiler.directory)
+
+    client.post("/showSummary", data={"email": "iron@club.com"}, headers={PROFILE_HEADER: "secret"})
+
+    files = sorted(os.listdir(os.path.join(profiler.directory, "showSummary")))
+    assert [os.path.splitext(name)[1] for name in files] == [".collapsed", ".prof"]
+    with open(os.path.join(profiler.directory, "showSummary", files[0])) as f:
+        stacks = f.read().splitlines()
+    assert any("server:showSummary" in line for line in stacks)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in stacks)
+
+
+def test_token_compared_as_bytes(client, profiler, tmp_path):
+    """
+    Vérifie que la comparaison du jeton ne provoque pas d'erreur :
+
+        1. Un en-tête non ASCII est refusé sans erreur 500.
+        2. Un jeton numérique (ex. GUDLFT_PROFILE_TOKEN=12345) est accepté.
+    """
+    response = client.get("/", headers={PROFILE_HEADER: "sécret"})
+    assert response.status_code == 200
+    assert not os.path.exists(profiler.directory)
+
+    numeric = RequestProfiler(str(tmp_path / "numeric"), token=12345)
+    assert numeric.start("1234") is None
+    profile = numeric.start("12345")
+    assert profile is not None
+    numeric.finish(profile, "index")
+
+
+def test_rotation_and_report(client, profiler):
+    """
+    Vérifie que seuls les `keep` derniers profils d'une route sont conservés et
+    que le rapport agrège les profils restants par route.
+    """
+    for _ in range(4):
+        client.get("/points", headers={PROFILE_HEADER: "secret"})
+
+    folder = os.path.join(profiler.directory, "points")
+    assert len([name for name in os.listdir(folder) if name.endswith(".prof")]) == 2
+    assert len(os.listdir(folder)) == 4
+
+    report = hotspot_report(profiler.directory, top=5)
+    assert report.startswith("points (2 profiled requests)")
+    assert len(report.splitlines()) == 2 + 5
+
+
+def test_profile_report_command(client, profiler, mocker):
+    """Vérifie la commande `flask profile-report` sur les profils écrits."""
+    mocker.patch.dict(app.config, {"PROFILE_DIR": profiler.directory})
+    client.get("/points", headers={PROFILE_HEADER: "secret"})
+
+    result = app.test_cli_runner().invoke(args=["profile-report", "--top", "3", "--sort", "cumtime"])
+
+    assert result.exit_code == 0
+    assert "points (1 profiled requests)" in result.output
+
+
+def test_collapsed_stacks_split_shared_callees():
+    """
+    Vérifie la reconstitution des piles : une fonction appelée depuis deux
+    appelants voit son temps réparti au prorata de chaque arc.
+    """
+    a, b, c, d = ("m.py", 1, "a"), ("m.py", 2, "b"), ("m.py", 3, "c"), ("m.py", 4, "shared")
+    stats = {
+        a: (1, 1, 0.1, 1.0, {}),
+        b: (1, 1, 0.1, 0.4, {a: (1, 1, 0.1, 0.4)}),
+        c: (1, 1, 0.1, 0.5, {a: (1, 1, 0.1, 0.5)}),
+        d: (2, 2, 0.7, 0.7, {b: (1, 1, 0.3, 0.3), c: (1, 1, 0.4, 0.4)}),
+    }
+
+    stacks = collapsed_stacks(stats)
+
+    assert stacks["m:a:1"] == pytest.approx(0.1)
+    assert stacks["m:a:1;m:b:2;m:shared:4"] == pytest.approx(0.3)
+    assert stacks["m:a:1;m:c:3;m:shared:4"] == pytest.approx(0.4)
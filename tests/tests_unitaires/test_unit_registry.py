@@ -0,0 +1,89 @@
+import pytest
+from datetime import datetime
+from registry import Registry
+
+
+@pytest.fixture
+def registry():
+    """
+    Fixture qui fournit un registre rempli avec deux clubs et une compétition.
+
+    Returns:
+        Registry: registre indexé prêt à l'emploi.
+    """
+    clubs = [
+        {"name": "Iron Temple", "email": "iron@club.com", "points": "10"},
+        {"name": "Power Gym", "email": "power@gym.com", "points": "20"},
+    ]
+    competitions = [{"name": "Spring Festival", "numberOfPlaces": "15", "date": "2030-03-27 10:00:00"}]
+    return Registry(clubs, competitions)
+
+
+def test_lookups_by_email_and_name(registry):
+    """
+    Vérifie que les recherches par email et par nom retournent les bons enregistrements,
+    et None pour une clé inconnue.
+    """
+    assert registry.club_by_email("power@gym.com")["name"] == "Power Gym"
+    assert registry.club_by_name("Iron Temple")["email"] == "iron@club.com"
+    assert registry.competition_by_name("Spring Festival")["numberOfPlaces"] == "15"
+    assert registry.club_by_email("inconnu@example.com") is None
+    assert registry.competition_by_name("Fall Classic") is None
+
+
+def test_indexes_follow_mutations(registry):
+    """
+    Vérifie que les index restent cohérents après ajout, modification et suppression.
+
+    Étapes :
+        1. Ajoute un club puis le retrouve par email.
+        2. Change l'email d'un club : l'ancien email ne doit plus répondre.
+        3. Supprime une compétition : elle ne doit plus être trouvée.
+    """
+    registry.add_club({"name": "She Lifts", "email": "kate@shelifts.co.uk", "points": "12"})
+    assert registry.club_by_email("kate@shelifts.co.uk")["name"] == "She Lifts"
+
+    club = registry.club_by_name("Iron Temple")
+    registry.update_club(club, email="new@club.com")
+    assert registry.club_by_email("iron@club.com") is None
+    assert registry.club_by_email("new@club.com") is club
+
+    registry.remove_competition(registry.competition_by_name("Spring Festival"))
+    assert registry.competition_by_name("Spring Festival") is None
+    assert registry.competitions == []
+
+
+def test_reload_rebuilds_indexes(registry):
+    """
+    Vérifie qu'un rechargement remplace entièrement les données indexées.
+    """
+    registry.reload([{"name": "New Club", "email": "new@club.com", "points": "3"}], [])
+    assert registry.club_by_name("Iron Temple") is None
+    assert registry.club_by_email("new@club.com")["name"] == "New Club"
+
+
+def test_competitions_partitioned_by_date():
+    """
+    Vérifie les vues datées de l'index trié :
+
+        1. Les compétitions à venir et passées sont séparées autour de `now`, triées par date.
+        2. La fenêtre des N prochains jours exclut les compétitions plus lointaines.
+        3. Une compétition ajoutée ou dont la date change est replacée dans l'index.
+    """
+    now = datetime(2030, 1, 1)
+    competitions = [
+        {"name": "Far", "numberOfPlaces": "5", "date": "2030-06-01 10:00:00"},
+        {"name": "Old", "numberOfPlaces": "5", "date": "2020-03-27 10:00:00"},
+        {"name": "Soon", "numberOfPlaces": "5", "date": "2030-01-05 10:00:00"},
+    ]
+    registry = Registry([], competitions)
+
+    assert [c["name"] for c in registry.upcoming_competitions(now)] == ["Soon", "Far"]
+    assert [c["name"] for c in registry.past_competitions(now)] == ["Old"]
+    assert [c["name"] for c in registry.competitions_within(30, now)] == ["Soon"]
+
+    registry.add_competition({"name": "Next", "numberOfPlaces": "5", "date": "2030-01-02 10:00:00"})
+    registry.update_competition(registry.competition_by_name("Far"), date="2019-01-01 10:00:00")
+
+    assert [c["name"] for c in registry.upcoming_competitions(now)] == ["Next", "Soon"]
+    assert [c["name"] for c in registry.past_competitions(now)] == ["Far", "Old"]
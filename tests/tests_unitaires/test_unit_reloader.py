@@ -0,0 +1,192 @@
+import json
+import os
+import pytest
+import server
+from models import Club, Competition
+from reloader import DataWatcher, merge_records
+from server import app
+from storage import JsonStorage
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord.
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application.
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    """
+    Fixture qui crée des fichiers JSON de données temporaires.
+
+    Crée :
+        - deux clubs (20 et 10 points)
+        - une compétition avec 15 places
+
+    Returns:
+        tuple: (chemin clubs.json, chemin competitions.json)
+    """
+    clubs_path = tmp_path / "clubs.json"
+    competitions_path = tmp_path / "competitions.json"
+    write(
+        clubs_path,
+        {
+            "clubs": [
+                {"name": "Iron Temple", "email": "iron@club.com", "points": "20"},
+                {"name": "Power Gym", "email": "power@gym.com", "points": "10"},
+            ]
+        },
+    )
+    write(
+        competitions_path,
+        {"competitions": [{"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": "15"}]},
+    )
+    return str(clubs_path), str(competitions_path)
+
+
+def write(path, payload):
+    """Réécrit un fichier de données comme le ferait un éditeur (nouvelle date de modification)."""
+    with open(path, "w") as f:
+        json.dump(payload, f)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def watch(data_files, clubs, competitions):
+    """Surveille les fichiers de données temporaires, à partir des données chargées."""
+    return DataWatcher({data_files[0]: (clubs, Club.from_dict), data_files[1]: (competitions, Competition.from_dict)})
+
+
+def test_merge_keeps_in_memory_changes():
+    """
+    Vérifie la fusion à trois voies :
+
+        1. Un champ modifié dans le fichier est recopié sur l'objet en mémoire.
+        2. Un compteur modifié seulement en mémoire (réservation) est conservé.
+        3. Les enregistrements ajoutés ou retirés du fichier sont ajoutés ou retirés.
+    """
+    iron, power = Club("Iron Temple", "iron@club.com", 18), Club("Power Gym", "power@gym.com", 10)
+    baseline = {
+        "Iron Temple": {"name": "Iron Temple", "email": "iron@club.com", "points": 20},
+        "Power Gym": {"name": "Power Gym", "email": "power@gym.com", "points": 10},
+    }
+    records = [
+        {"name": "Iron Temple", "email": "contact@irontemple.com", "points": "20"},
+        {"name": "She Lifts", "email": "kate@shelifts.co.uk", "points": "12"},
+    ]
+
+    merged, seen = merge_records([iron, power], baseline, records, Club.from_dict)
+
+    assert merged[0] is iron
+    assert (iron.email, iron.points) == ("contact@irontemple.com", 18)
+    assert [club.name for club in merged] == ["Iron Temple", "She Lifts"]
+    assert seen["She Lifts"]["points"] == 12
+
+
+def test_storage_does_not_overwrite_external_edit(data_files):
+    """
+    Vérifie qu'une écriture de l'application ne remplace pas un fichier modifié
+    par un tiers et pas encore fusionné, mais écrit les autres fichiers.
+    """
+    storage = JsonStorage(*data_files)
+    clubs, competitions = storage.load()
+    storage.watcher = watch(data_files, clubs, competitions)
+
+    write(data_files[0], {"clubs": [{"name": "Iron Temple", "email": "iron@club.com", "points": "99"}]})
+    competitions[0]["numberOfPlaces"] = 14
+    storage.save(clubs, competitions)
+
+    assert storage.watcher.changes() == [data_files[0]]
+    with open(data_files[0]) as f:
+        assert json.load(f)["clubs"][0]["points"] == "99"
+    with open(data_files[1]) as f:
+        assert json.load(f)["competitions"][0]["numberOfPlaces"] == 14
+
+
+def test_reload_swaps_merged_state(client, data_files, mocker):
+    """
+    Vérifie le rechargement à chaud de bout en bout :
+
+        1. Une réservation est faite en mémoire.
+        2. L'équipe d'administration ajoute une compétition dans le fichier.
+        3. Après `reload_data`, la nouvelle compétition est visible (et réservable)
+           et la réservation déjà faite est conservée.
+    """
+    storage = JsonStorage(*data_files)
+    clubs, competitions = storage.load()
+    watcher = watch(data_files, clubs, competitions)
+    storage.watcher = watcher
+    mocker.patch.dict(app.config, {"CLUBS_FILE": data_files[0], "COMPETITIONS_FILE": data_files[1]})
+    mocker.patch("server.storage", storage)
+    mocker.patch("server.data_watcher", watcher)
+    mocker.patch("server.clubs", clubs)
+    mocker.patch("server.competitions", competitions)
+
+    client.post("/purchasePlaces", data={"club": "Iron Temple", "competition": "Spring Festival", "places": 3})
+    write(
+        data_files[1],
+        {
+            "competitions": [
+                {"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": "15"},
+                {"name": "Winter Games", "date": "2030-12-01 10:00:00", "numberOfPlaces": "8"},
+            ]
+        },
+    )
+
+    assert watcher.changes() == [data_files[1]]
+    server.reload_data(watcher.changes())
+
+    assert watcher.changes() == []
+    assert server.competitions is not competitions
+    assert [c["numberOfPlaces"] for c in server.competitions] == [12, 8]
+    assert server.get_registry().competition_by_name("Winter Games") is server.competitions[1]
+    response = client.get("/book/Winter Games/Iron Temple")
+    assert b"Winter Games" in response.data
+
+
+def test_reload_replaces_edited_ledger(data_files, tmp_path, mocker):
+    """
+    Vérifie qu'un registre des places réservées modifié par un tiers (ex. remis
+    à zéro entre deux tests de charge) remplace les totaux en mémoire, et que
+    l'application ne l'écrase pas avant de l'avoir relu.
+    """
+    ledger_path = str(tmp_path / "bookings.json")
+    storage = JsonStorage(*data_files, ledger_path=ledger_path)
+    clubs, competitions = storage.load()
+    ledger = storage.load_ledger()
+    ledger.add("Iron Temple", "Spring Festival", 12)
+    watcher = DataWatcher(
+        {
+            data_files[0]: (clubs, Club.from_dict),
+            data_files[1]: (competitions, Competition.from_dict),
+            ledger_path: ([], None),
+        }
+    )
+    storage.watcher = watcher
+    storage.save(clubs, competitions)
+    assert watcher.changes() == []
+
+    write(ledger_path, {"bookings": []})
+    storage.save(clubs, competitions)
+    with open(ledger_path) as f:
+        assert json.load(f) == {"bookings": []}
+
+    mocker.patch.dict(
+        app.config, {"CLUBS_FILE": data_files[0], "COMPETITIONS_FILE": data_files[1], "LEDGER_FILE": ledger_path}
+    )
+    mocker.patch("server.storage", storage)
+    mocker.patch("server.data_watcher", watcher)
+    mocker.patch("server.ledger", ledger)
+    mocker.patch("server.clubs", clubs)
+    mocker.patch("server.competitions", competitions)
+    server.reload_data(watcher.changes())
+
+    assert watcher.changes() == []
+    assert ledger.booked("Iron Temple", "Spring Festival") == 0
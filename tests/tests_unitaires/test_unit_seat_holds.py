@@ -0,0 +1,167 @@
+import pytest
+from datetime import datetime, timedelta
+from holds import SeatHolds
+from server import app
+
+
+class FakeClock:
+    """Horloge contrôlée par le test."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def client():
+    """
+    Fixture qui fournit un client Flask pour les tests.
+
+    - Configure Flask en mode TESTING pour éviter les effets de bord (sessions, flash, fichiers JSON)
+    - Permet d'envoyer des requêtes HTTP simulées vers l'application
+    """
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def sample_data(mocker):
+    """
+    Mocke les données globales avec deux clubs et une compétition de 4 places.
+
+    Returns:
+        tuple: (clubs, competition)
+    """
+    clubs = [
+        {"name": "Iron Temple", "email": "iron@club.com", "points": "20"},
+        {"name": "She Lifts", "email": "she@club.com", "points": "20"},
+    ]
+    competition = {
+        "name": "Spring Festival",
+        "numberOfPlaces": "4",
+        "date": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    mocker.patch("server.clubs", clubs)
+    mocker.patch("server.competitions", [competition])
+    return clubs, competition
+
+
+@pytest.fixture
+def clock(mocker):
+    """Active les retenues (60 secondes) avec une horloge contrôlée par le test."""
+    clock = FakeClock()
+    mocker.patch("server.seat_holds", SeatHolds(60, clock=clock))
+    return clock
+
+
+def purchase(client, club, competition, places):
+    """Achète des places via /purchasePlaces."""
+    return client.post(
+        "/purchasePlaces", data={"club": club["name"], "competition": competition["name"], "places": places}
+    )
+
+
+def test_holds_limit_other_clubs():
+    """
+    Vérifie qu'une retenue est bornée par les places non retenues par les autres clubs,
+    et qu'une nouvelle retenue du même club remplace la précédente.
+    """
+    holds = SeatHolds(60, clock=FakeClock())
+
+    assert holds.hold("Iron Temple", "Spring Festival", 3, available=4) == (3, 60)
+    assert holds.hold("She Lifts", "Spring Festival", 3, available=4) == (1, 60)
+    assert holds.hold("Iron Temple", "Spring Festival", 2, available=4) == (2, 60)
+    assert holds.held("Spring Festival") == 3
+    assert holds.held("Spring Festival", exclude="She Lifts") == 2
+    assert holds.hold("Iron Temple", "Fall Classic", 0, available=4) == (0, 0)
+
+
+def test_holds_expire_in_deadline_order():
+    """
+    Vérifie l'expiration des retenues :
+
+        1. Seules les retenues arrivées à échéance sont supprimées.
+        2. Une retenue renouvelée n'expire pas à son ancienne échéance.
+        3. Une retenue convertie n'est pas comptée comme expirée.
+    """
+    clock = FakeClock()
+    holds = SeatHolds(60, clock=clock)
+    for i in range(1000):
+        clock.now = i / 100
+        holds.hold(f"Club {i}", "Spring Festival", 1, available=10_000)
+    holds.hold("Club 0", "Spring Festival", 1, available=10_000)  # renouvelée à t=9.99
+    assert holds.convert("Club 999", "Spring Festival") == 1
+
+    clock.now = 65
+    assert holds.expire() == 499
+    assert holds.expired == 500
+    assert holds.held("Spring Festival") == 499
+
+    clock.now = 70
+    assert holds.expire() == 0
+    assert holds.expired == 999
+    assert holds.converted == 1
+    assert holds.held("Spring Festival") == 0
+
+
+def test_booking_page_holds_places(client, sample_data, clock):
+    """
+    Vérifie qu'ouvrir la page de réservation retient des places pour le club :
+
+        1. Les places retenues ne sont plus réservables par un autre club.
+        2. Le club qui les retient les achète malgré la demande des autres clubs.
+        3. La retenue est convertie : elle ne bloque plus de places après l'achat.
+    """
+    clubs, competition = sample_data
+
+    response = client.get(f"/book/{competition['name']}/{clubs[0]['name']}?places=3")
+    assert b"3 place(s) held for you for 60 seconds." in response.data
+    assert b"Places available: 4" in response.data
+
+    response = purchase(client, clubs[1], competition, 2)
+    assert b"Not enough places left in this competition." in response.data
+    response = client.get(f"/book/{competition['name']}/{clubs[1]['name']}?places=3")
+    assert b"1 place(s) held for you" in response.data
+    assert b"Places available: 1" in response.data
+
+    response = purchase(client, clubs[0], competition, 3)
+    assert b"Great-booking complete!" in response.data
+    assert int(competition["numberOfPlaces"]) == 1
+
+    response = purchase(client, clubs[1], competition, 1)
+    assert b"Great-booking complete!" in response.data
+    assert int(competition["numberOfPlaces"]) == 0
+
+
+def test_expired_hold_releases_places(client, sample_data, clock):
+    """
+    Vérifie qu'une retenue expirée libère ses places pour les autres clubs.
+    """
+    clubs, competition = sample_data
+    client.get(f"/book/{competition['name']}/{clubs[0]['name']}?places=4")
+
+    response = purchase(client, clubs[1], competition, 1)
+    assert b"Not enough places left in this competition." in response.data
+
+    clock.now = 61
+    response = purchase(client, clubs[1], competition, 1)
+    assert b"Great-booking complete!" in response.data
+
+
+def test_hold_bounded_by_cap_and_points(client, sample_data, clock, empty_ledger):
+    """
+    Vérifie que la retenue ne dépasse ni les points du club ni ce qui lui reste sous la limite par compétition.
+    """
+    clubs, competition = sample_data
+    competition["numberOfPlaces"] = "20"
+    empty_ledger.add(clubs[0]["name"], competition["name"], 10)
+
+    response = client.get(f"/book/{competition['name']}/{clubs[0]['name']}?places=5")
+    assert b"2 place(s) held for you" in response.data
+
+    clubs[1]["points"] = "1"
+    response = client.get(f"/book/{competition['name']}/{clubs[1]['name']}?places=5")
+    assert b"1 place(s) held for you" in response.data
@@ -0,0 +1,173 @@
+import multiprocessing
+import os
+import pytest
+from ledger import BookingLedger
+from shared_state import RING_SIZE, SharedCounters
+
+
+def make_data():
+    """
+    Construit un jeu de données neuf (un club, une compétition), comme le ferait
+    chaque worker en chargeant les fichiers JSON.
+
+    Returns:
+        tuple: (clubs, competitions)
+    """
+    clubs = [{"name": "Iron Temple", "email": "iron@club.com", "points": 100}]
+    competitions = [{"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": 60}]
+    return clubs, competitions
+
+
+def book_one_place_many_times(path, times):
+    """
+    Simule un worker qui réserve `times` fois une place sous le verrou partagé.
+    """
+    clubs, competitions = make_data()
+    shared = SharedCounters(path, clubs, competitions)
+    for _ in range(times):
+        with shared.locked():
+            club, competition = clubs[0], competitions[0]
+            if competition["numberOfPlaces"] >= 1 and club["points"] >= 1:
+                competition["numberOfPlaces"] -= 1
+                club["points"] -= 1
+                shared.store(club, competition)
+    shared.close()
+
+
+@pytest.fixture
+def shared_path(tmp_path):
+    """Chemin du fichier d'état partagé, dans un répertoire temporaire."""
+    return str(tmp_path / "gudlft.shared")
+
+
+def test_booking_is_visible_to_other_workers(shared_path):
+    """
+    Vérifie qu'une réservation publiée par un worker est vue par un autre après `refresh`,
+    et qu'un worker démarrant plus tard adopte les valeurs partagées.
+    """
+    clubs_a, competitions_a = make_data()
+    clubs_b, competitions_b = make_data()
+    worker_a = SharedCounters(shared_path, clubs_a, competitions_a)
+    worker_b = SharedCounters(shared_path, clubs_b, competitions_b)
+
+    with worker_a.locked():
+        clubs_a[0]["points"] -= 5
+        competitions_a[0]["numberOfPlaces"] -= 5
+        worker_a.store(clubs_a[0], competitions_a[0])
+
+    assert worker_b.refresh() is True
+    assert clubs_b[0]["points"] == 95
+    assert competitions_b[0]["numberOfPlaces"] == 55
+    assert worker_b.refresh() is False
+
+    clubs_c, competitions_c = make_data()
+    SharedCounters(shared_path, clubs_c, competitions_c)
+    assert clubs_c[0]["points"] == 95
+
+
+def test_refresh_copies_only_changed_counters(shared_path):
+    """
+    Vérifie que la resynchronisation ne recopie que les compteurs modifiés :
+
+        1. Après une réservation, seuls le club et la compétition concernés sont
+           recopiés et signalés à `on_change`.
+        2. Un worker qui a pris plus de RING_SIZE modifications de retard recopie tout.
+    """
+    clubs_a, competitions_a = make_data()
+    clubs_b, competitions_b = make_data()
+    changes = []
+    worker_a = SharedCounters(shared_path, clubs_a, competitions_a)
+    worker_b = SharedCounters(shared_path, clubs_b, competitions_b, on_change=lambda **kw: changes.append(kw))
+    changes.clear()
+
+    with worker_a.locked():
+        clubs_a[0]["points"] -= 1
+        worker_a.store(clubs_a[0], competitions_a[0])
+    assert worker_b.refresh() is True
+    assert changes == [{"club": clubs_b[0]}, {"competition": competitions_b[0]}]
+    assert clubs_b[0]["points"] == 99
+
+    changes.clear()
+    for _ in range(RING_SIZE):
+        with worker_a.locked():
+            worker_a.store(clubs_a[0], competitions_a[0])
+    assert worker_b.refresh() is True
+    assert changes == [{}]
+
+
+def test_booking_totals_are_shared(shared_path):
+    """
+    Vérifie que les places réservées par club et par compétition sont partagées :
+
+        1. Les réservations de deux workers s'additionnent dans le registre de chacun.
+        2. Un worker démarrant plus tard adopte les totaux partagés.
+    """
+    workers = []
+    for _ in range(2):
+        clubs, competitions = make_data()
+        ledger = BookingLedger()
+        workers.append((SharedCounters(shared_path, clubs, competitions, ledger=ledger), clubs, competitions, ledger))
+
+    for places, (shared, clubs, competitions, ledger) in zip((5, 3), workers):
+        with shared.locked():
+            clubs[0]["points"] -= places
+            competitions[0]["numberOfPlaces"] -= places
+            ledger.add("Iron Temple", "Spring Festival", places)
+            shared.store(clubs[0], competitions[0])
+
+    workers[0][0].refresh()
+    assert workers[0][3].booked("Iron Temple", "Spring Festival") == 8
+    assert workers[1][3].history("Iron Temple") == {"Spring Festival": 8}
+
+    ledger = BookingLedger()
+    SharedCounters(shared_path, *make_data(), ledger=ledger)
+    assert ledger.booked("Iron Temple", "Spring Festival") == 8
+
+
+def test_concurrent_processes_never_oversell(shared_path):
+    """
+    Test multi-processus : 4 processus réservent chacun 30 fois une place sur une
+    compétition de 60 places. Les places ne doivent jamais devenir négatives et
+    chaque place vendue doit correspondre à un point dépensé.
+    """
+    SharedCounters(shared_path, *make_data()).close()
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=book_one_place_many_times, args=(shared_path, 30)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    clubs, competitions = make_data()
+    SharedCounters(shared_path, clubs, competitions)
+    assert competitions[0]["numberOfPlaces"] == 0
+    assert clubs[0]["points"] == 40
+
+
+def test_booking_totals_table_is_sparse(shared_path):
+    """
+    Vérifie que le registre partagé ne dépend que des couples réservés :
+
+        1. Avec 3 000 clubs et 3 000 compétitions, le fichier reste petit.
+        2. Une table pleine refuse un nouveau couple avec une erreur explicite.
+    """
+    clubs = [{"name": f"Club {i}", "email": f"club{i}@example.com", "points": 100} for i in range(3000)]
+    competitions = [
+        {"name": f"Competition {i}", "date": "2030-03-27 10:00:00", "numberOfPlaces": 60} for i in range(3000)
+    ]
+    ledger = BookingLedger.from_records([{"club": "Club 1", "competition": "Competition 2", "places": 3}])
+    shared = SharedCounters(shared_path, clubs, competitions, ledger=ledger, ledger_capacity=4)
+    assert os.path.getsize(shared_path) < 100 * 1024
+
+    with shared.locked():
+        for i in range(3):
+            ledger.add(f"Club {i}", "Competition 0", 1)
+            shared.store(clubs[i], competitions[0])
+        ledger.add("Club 9", "Competition 0", 1)
+        with pytest.raises(RuntimeError):
+            shared.store(clubs[9], competitions[0])
+
+    reloaded = BookingLedger()
+    SharedCounters(shared_path, clubs, competitions, ledger=reloaded, ledger_capacity=4)
+    assert reloaded.booked("Club 1", "Competition 2") == 3
+    assert reloaded.history("Club 2") == {"Competition 0": 1}
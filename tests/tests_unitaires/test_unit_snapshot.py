@@ -0,0 +1,103 @@
+import json
+import os
+import pytest
+import storage as storage_module
+from datetime import datetime
+from journal import BookingJournal
+from models import Club, Competition
+from snapshot import SnapshotError, read_snapshot, write_snapshot
+from storage import JsonStorage
+
+
+@pytest.fixture
+def json_files(tmp_path):
+    """
+    Fixture qui crée des fichiers JSON de données temporaires.
+
+    Crée :
+        - un club avec 20 points
+        - une compétition avec 15 places
+
+    Returns:
+        tuple: (chemin clubs.json, chemin competitions.json)
+    """
+    clubs_path = tmp_path / "clubs.json"
+    competitions_path = tmp_path / "competitions.json"
+    clubs_path.write_text(json.dumps({"clubs": [{"name": "Iron Temple", "email": "iron@club.com", "points": "20"}]}))
+    competitions_path.write_text(
+        json.dumps({"competitions": [{"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": 15}]})
+    )
+    return str(clubs_path), str(competitions_path)
+
+
+def test_snapshot_round_trip(tmp_path):
+    """
+    Vérifie qu'un instantané binaire restitue les mêmes modèles (chaînes non ASCII,
+    dates antérieures à 1970 comprises) et les séquences de journal.
+    """
+    path = str(tmp_path / "data.snapshot")
+    clubs = [Club("Iron Temple", "iron@club.com", 4), Club("Élan Sportif", "élan@club.fr", 0)]
+    competitions = [
+        Competition("Spring Festival", "2030-03-27 10:00:00", 25),
+        Competition("Old Cup", datetime(1969, 7, 20, 20, 17, 40), 0),
+    ]
+    write_snapshot(path, clubs, competitions, clubs_seq=3, competitions_seq=5)
+
+    loaded_clubs, loaded_competitions, clubs_seq, competitions_seq = read_snapshot(path)
+    assert [c.to_dict() for c in loaded_clubs] == [c.to_dict() for c in clubs]
+    assert [c.to_dict() for c in loaded_competitions] == [c.to_dict() for c in competitions]
+    assert (clubs_seq, competitions_seq) == (3, 5)
+
+    with open(path, "r+b") as f:
+        f.write(b"NOTASNAP")
+    with pytest.raises(SnapshotError):
+        read_snapshot(path)
+
+
+def test_json_storage_prefers_fresh_snapshot(json_files, tmp_path, mocker):
+    """
+    Vérifie le backend JSON avec instantané binaire :
+
+        1. Une sauvegarde écrit l'instantané à côté des fichiers JSON.
+        2. Au chargement, l'instantané à jour est lu sans analyser le JSON.
+        3. Si un fichier JSON est plus récent (modifié à la main), le JSON est relu.
+    """
+    snapshot_path = str(tmp_path / "data.snapshot")
+    storage = JsonStorage(*json_files, snapshot_path=snapshot_path)
+    clubs, competitions = storage.load()
+    clubs[0]["points"] = 18
+    storage.save(clubs, competitions)
+    assert os.path.exists(snapshot_path)
+
+    parse = mocker.spy(storage_module, "iter_records")
+    clubs, _ = JsonStorage(*json_files, snapshot_path=snapshot_path).load()
+    assert clubs[0]["points"] == 18
+    assert parse.call_count == 0
+
+    with open(json_files[0], "w") as f:
+        json.dump({"clubs": [{"name": "Iron Temple", "email": "iron@club.com", "points": 7}]}, f)
+    written = os.stat(snapshot_path).st_mtime_ns
+    os.utime(json_files[0], ns=(written + 10**9, written + 10**9))
+    clubs, _ = JsonStorage(*json_files, snapshot_path=snapshot_path).load()
+    assert clubs[0]["points"] == 7
+
+
+def test_journal_replays_on_top_of_snapshot(json_files, tmp_path):
+    """
+    Vérifie que le journal s'appuie sur l'instantané binaire écrit à la compaction
+    et ne rejoue que les réservations postérieures.
+    """
+    snapshot_path = str(tmp_path / "data.snapshot")
+    journal_path = str(tmp_path / "bookings.journal")
+    journal = BookingJournal(journal_path, *json_files, snapshot_path=snapshot_path)
+    journal.load()
+    journal.append("Iron Temple", "Spring Festival", 4)
+    journal.compact()
+    journal.append("Iron Temple", "Spring Festival", 1)
+    journal.close()
+
+    _, _, clubs_seq, _ = read_snapshot(snapshot_path)
+    assert clubs_seq == 1
+    clubs, competitions = BookingJournal(journal_path, *json_files, snapshot_path=snapshot_path).load()
+    assert isinstance(clubs[0], Club)
+    assert (clubs[0]["points"], competitions[0]["numberOfPlaces"]) == (15, 10)
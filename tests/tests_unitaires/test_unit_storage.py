@@ -0,0 +1,231 @@
+import json
+import pytest
+from contextlib import contextmanager
+import storage as storage_module
+from storage import BookingConflict, JsonStorage, SqliteStorage, create_storage
+
+
+@pytest.fixture
+def json_files(tmp_path):
+    """
+    Fixture qui crée des fichiers JSON de données temporaires.
+
+    Crée :
+        - un club avec 20 points
+        - une compétition avec 15 places
+
+    Returns:
+        tuple: (chemin clubs.json, chemin competitions.json)
+    """
+    clubs_path = tmp_path / "clubs.json"
+    competitions_path = tmp_path / "competitions.json"
+    clubs_path.write_text(json.dumps({"clubs": [{"name": "Iron Temple", "email": "iron@club.com", "points": "20"}]}))
+    competitions_path.write_text(
+        json.dumps({"competitions": [{"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": 15}]})
+    )
+    return str(clubs_path), str(competitions_path)
+
+
+def test_json_storage_round_trip(json_files):
+    """
+    Vérifie que le backend JSON sauvegarde une réservation en normalisant les compteurs en entiers.
+    """
+    storage = JsonStorage(*json_files)
+    clubs, competitions = storage.load()
+    clubs[0]["points"] = "18"
+    competitions[0]["numberOfPlaces"] = 13
+
+    storage.record_booking(clubs, competitions, clubs[0], competitions[0], 2)
+
+    clubs, competitions = storage.load()
+    assert [club.to_dict() for club in clubs] == [{"name": "Iron Temple", "email": "iron@club.com", "points": 18}]
+    assert [competition.to_dict() for competition in competitions] == [
+        {"name": "Spring Festival", "date": "2030-03-27 10:00:00", "numberOfPlaces": 13}
+    ]
+    with open(json_files[0]) as f:
+        assert json.load(f) == {"clubs": [{"name": "Iron Temple", "email": "iron@club.com", "points": 18}]}
+
+
+def test_group_commit_coalesces_bookings(json_files, mocker):
+    """
+    Vérifie le mode d'écriture groupée du backend JSON :
+
+        1. Plusieurs réservations rapprochées ne déclenchent qu'une écriture par fichier.
+        2. La fermeture garantit l'écriture finale de l'état.
+    """
+    write = mocker.spy(storage_module, "write_json_atomic")
+    storage = JsonStorage(*json_files, durability="group", group_commit_window=0.2)
+    clubs, competitions = storage.load()
+
+    for _ in range(5):
+        clubs[0]["points"] = int(clubs[0]["points"]) - 1
+        competitions[0]["numberOfPlaces"] -= 1
+        storage.record_booking(clubs, competitions, clubs[0], competitions[0], 1)
+    storage.close()
+
+    assert write.call_count == 2
+    assert storage.load()[0][0]["points"] == 15
+    assert storage.load()[1][0]["numberOfPlaces"] == 10
+
+
+def test_group_commit_writes_only_dirty_files(json_files, mocker):
+    """
+    Vérifie que seul le fichier marqué comme modifié est réécrit.
+    """
+    write = mocker.spy(storage_module, "write_json_atomic")
+    storage = JsonStorage(*json_files, durability="group")
+    clubs, competitions = storage.load()
+
+    storage.mark_dirty(clubs, competitions, "clubs")
+    storage.close()
+
+    assert [call.args[0] for call in write.call_args_list] == [json_files[0]]
+
+
+def test_group_commit_copies_state_under_guard(json_files, mocker):
+    """
+    Vérifie que l'écriture groupée copie l'état sous `copy_guard`, puis écrit hors de ce contexte :
+
+        1. Aucun fichier n'est écrit pendant que le contexte est tenu.
+        2. Une réservation appliquée juste après la copie n'apparaît pas dans l'écriture en cours.
+    """
+    storage = JsonStorage(*json_files)
+    clubs, competitions = storage.load()
+    guarded = []
+
+    @contextmanager
+    def copy_guard():
+        guarded.append(True)
+        yield
+        guarded.pop()
+        clubs[0]["points"] = 5
+
+    def write(path, data, **kwargs):
+        assert not guarded
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    mocker.patch.object(storage_module, "write_json_atomic", side_effect=write)
+    storage.copy_guard = copy_guard
+    clubs[0]["points"] = 19
+    storage.mark_dirty(clubs, competitions, "clubs")
+    storage.flush()
+
+    with open(json_files[0]) as f:
+        assert json.load(f)["clubs"][0]["points"] == 19
+
+
+def test_sqlite_storage_seeds_and_books(json_files, tmp_path):
+    """
+    Vérifie le backend SQLite :
+
+        1. La base vide est initialisée depuis les fichiers JSON.
+        2. Une réservation met à jour les deux lignes concernées.
+        3. Un nouveau backend ouvert sur la même base relit l'état à jour.
+    """
+    database = str(tmp_path / "gudlft.sqlite3")
+    storage = SqliteStorage(database, *json_files)
+    clubs, competitions = storage.load()
+    assert clubs[0]["points"] == 20
+    assert competitions[0]["numberOfPlaces"] == 15
+
+    storage.record_booking(clubs, competitions, clubs[0], competitions[0], 3)
+    storage.close()
+
+    clubs, competitions = SqliteStorage(database, *json_files).load()
+    assert clubs[0]["points"] == 17
+    assert competitions[0]["numberOfPlaces"] == 12
+
+
+def test_sqlite_storage_rejects_stale_booking(json_files, tmp_path):
+    """
+    Vérifie que deux processus partageant la base ne peuvent pas survendre :
+    le second, dont l'état en mémoire est périmé, reçoit un BookingConflict
+    avec les valeurs actuelles de la base.
+    """
+    database = str(tmp_path / "gudlft.sqlite3")
+    worker_a = SqliteStorage(database, *json_files)
+    worker_b = SqliteStorage(database, *json_files)
+    clubs, competitions = worker_a.load()
+
+    worker_a.record_booking(clubs, competitions, clubs[0], competitions[0], 12)
+
+    with pytest.raises(BookingConflict) as conflict:
+        worker_b.record_booking(clubs, competitions, clubs[0], competitions[0], 10)
+    assert (conflict.value.points, conflict.value.places) == (8, 3)
+
+
+def test_create_storage_unknown_backend(json_files):
+    """
+    Vérifie qu'un backend inconnu dans la configuration lève une ValueError.
+    """
+    config = {"STORAGE_BACKEND": "csv", "CLUBS_FILE": json_files[0], "COMPETITIONS_FILE": json_files[1]}
+    with pytest.raises(ValueError):
+        create_storage(config)
+
+
+def test_sqlite_batch_is_all_or_nothing(json_files, tmp_path):
+    """
+    Vérifie qu'un lot refusé par la base (conflit) ne modifie aucune ligne,
+    et qu'un lot accepté est appliqué en une transaction.
+    """
+    database = str(tmp_path / "gudlft.sqlite3")
+    storage = SqliteStorage(database, *json_files)
+    clubs, competitions = storage.load()
+
+    with pytest.raises(BookingConflict) as conflict:
+        storage.record_bookings(clubs, competitions, clubs[0], [(competitions[0], 16)])
+    assert conflict.value.places == {"Spring Festival": 15}
+
+    storage.record_bookings(clubs, competitions, clubs[0], [(competitions[0], 5)])
+    clubs, competitions = storage.load()
+    assert (clubs[0]["points"], competitions[0]["numberOfPlaces"]) == (15, 10)
+
+
+def test_sqlite_record_batches_rejects_only_conflicting_batch(json_files, tmp_path):
+    """
+    Vérifie que plusieurs lots sont persistés dans une transaction, et qu'un lot
+    que la base ne peut plus honorer est seul annulé, avec les valeurs finales de la base.
+    """
+    database = str(tmp_path / "gudlft.sqlite3")
+    storage = SqliteStorage(database, *json_files)
+    clubs, competitions = storage.load()
+    club, competition = clubs[0], competitions[0]
+
+    conflicts = storage.record_batches(
+        clubs, competitions, [(club, [(competition, 4)]), (club, [(competition, 12)]), (club, [(competition, 5)])]
+    )
+
+    assert conflicts[0] is None and conflicts[2] is None
+    assert (conflicts[1].points, conflicts[1].places) == (11, {"Spring Festival": 6})
+    clubs, competitions = storage.load()
+    assert (clubs[0]["points"], competitions[0]["numberOfPlaces"]) == (11, 6)
+
+
+def test_sqlite_enforces_cap_across_processes(json_files, tmp_path):
+    """
+    Vérifie que la limite de 12 places par compétition tient entre deux processus
+    partageant la base, chacun ne connaissant que ses propres réservations :
+
+        1. Une réservation isolée au-delà de la limite est refusée, avec le total en base.
+        2. Un lot au-delà de la limite est refusé de la même façon.
+        3. Dans `record_batches`, seul le lot qui dépasse la limite est annulé.
+    """
+    database = str(tmp_path / "gudlft.sqlite3")
+    worker_a = SqliteStorage(database, *json_files)
+    worker_b = SqliteStorage(database, *json_files)
+    clubs, competitions = worker_a.load()
+    club, competition = clubs[0], competitions[0]
+
+    worker_a.record_booking(clubs, competitions, club, competition, 7)
+    with pytest.raises(BookingConflict) as conflict:
+        worker_b.record_booking(clubs, competitions, club, competition, 7)
+    assert conflict.value.booked == {"Spring Festival": 7}
+    with pytest.raises(BookingConflict) as conflict:
+        worker_b.record_bookings(clubs, competitions, club, [(competition, 6)])
+    assert conflict.value.booked == {"Spring Festival": 7}
+
+    conflicts = worker_b.record_batches(clubs, competitions, [(club, [(competition, 6)]), (club, [(competition, 5)])])
+    assert conflicts[1] is None
+    assert conflicts[0].booked == {"Spring Festival": 12}
+    assert worker_b.load_ledger().booked("Iron Temple", "Spring Festival") == 12